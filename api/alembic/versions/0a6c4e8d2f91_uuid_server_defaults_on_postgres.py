@@ -0,0 +1,34 @@
+"""uuid_server_defaults_on_postgres
+
+Revision ID: 0a6c4e8d2f91
+Revises: f3b9d2e61a47
+Create Date: 2026-10-16 16:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0a6c4e8d2f91"
+down_revision: Union[str, None] = "f3b9d2e61a47"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_TABLES = ("users", "sessions")
+
+
+def upgrade() -> None:
+    # gen_random_uuid() is built in from PostgreSQL 13; SQLite keys stay application-generated.
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    for table in _TABLES:
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN id SET DEFAULT gen_random_uuid()")
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    for table in _TABLES:
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN id DROP DEFAULT")
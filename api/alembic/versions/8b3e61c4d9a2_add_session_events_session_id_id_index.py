@@ -0,0 +1,30 @@
+"""add_session_events_session_id_id_index
+
+Revision ID: 8b3e61c4d9a2
+Revises: 5d7f2aa7f8e4
+Create Date: 2026-10-16 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "8b3e61c4d9a2"
+down_revision: Union[str, None] = "5d7f2aa7f8e4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_session_events_session_id_id",
+        "session_events",
+        ["session_id", "id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_session_events_session_id_id", table_name="session_events")
@@ -0,0 +1,32 @@
+"""add_webhook_deliveries_status_next_attempt_index
+
+Revision ID: c41f7e2a9b05
+Revises: 8b3e61c4d9a2
+Create Date: 2026-10-16 13:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c41f7e2a9b05"
+down_revision: Union[str, None] = "8b3e61c4d9a2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_webhook_deliveries_status_next_attempt",
+        "webhook_deliveries",
+        ["status", "next_attempt_at"],
+        unique=False,
+    )
+    op.drop_index("ix_webhook_deliveries_status", table_name="webhook_deliveries")
+
+
+def downgrade() -> None:
+    op.create_index("ix_webhook_deliveries_status", "webhook_deliveries", ["status"], unique=False)
+    op.drop_index("ix_webhook_deliveries_status_next_attempt", table_name="webhook_deliveries")
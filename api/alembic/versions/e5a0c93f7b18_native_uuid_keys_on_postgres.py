@@ -0,0 +1,58 @@
+"""native_uuid_keys_on_postgres
+
+Revision ID: e5a0c93f7b18
+Revises: c41f7e2a9b05
+Create Date: 2026-10-16 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e5a0c93f7b18"
+down_revision: Union[str, None] = "c41f7e2a9b05"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (table, column, referenced table) for every foreign key onto a UUID primary key.
+_FOREIGN_KEYS = (
+    ("consent_records", "user_id", "users"),
+    ("practice_progress", "user_id", "users"),
+    ("sessions", "user_id", "users"),
+    ("adaptation_decisions", "session_id", "sessions"),
+    ("bhav_evaluations", "session_id", "sessions"),
+    ("session_events", "session_id", "sessions"),
+)
+# Built by create_all rather than a revision, so they may be absent.
+_OPTIONAL_FOREIGN_KEYS = (
+    ("audio_chunks", "session_id", "sessions"),
+    ("stage_score_projections", "session_id", "sessions"),
+)
+_PRIMARY_KEYS = (("users", "id"), ("sessions", "id"))
+
+
+def _retype(type_sql: str, cast_sql: str) -> None:
+    inspector = sa.inspect(op.get_bind())
+    foreign_keys = _FOREIGN_KEYS + tuple(fk for fk in _OPTIONAL_FOREIGN_KEYS if inspector.has_table(fk[0]))
+    for table, column, _ in foreign_keys:
+        op.drop_constraint(f"{table}_{column}_fkey", table, type_="foreignkey")
+    for table, column in (*_PRIMARY_KEYS, *((t, c) for t, c, _ in foreign_keys)):
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} TYPE {type_sql} USING {column}::{cast_sql}")
+    for table, column, referred in foreign_keys:
+        op.create_foreign_key(f"{table}_{column}_fkey", table, referred, [column], ["id"])
+
+
+def upgrade() -> None:
+    # SQLite has no native UUID type; keys stay VARCHAR(36) there.
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    _retype("uuid", "uuid")
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    _retype("varchar(36)", "varchar")
@@ -0,0 +1,30 @@
+"""sessions_summary_json_jsonb
+
+Revision ID: f3b9d2e61a47
+Revises: e5a0c93f7b18
+Create Date: 2026-10-16 15:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "f3b9d2e61a47"
+down_revision: Union[str, None] = "e5a0c93f7b18"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # SQLite stores JSON as text either way.
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    op.execute("ALTER TABLE sessions ALTER COLUMN summary_json TYPE jsonb USING summary_json::jsonb")
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    op.execute("ALTER TABLE sessions ALTER COLUMN summary_json TYPE json USING summary_json::json")
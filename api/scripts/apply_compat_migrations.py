@@ -0,0 +1,19 @@
+from __future__ import annotations
+
+import json
+
+from gemini_music_api.compat_migrations import apply_sqlite_compat_migrations
+from gemini_music_api.db import Base, engine
+import gemini_music_api.models  # noqa: F401
+
+
+def main() -> int:
+    # Compat steps ALTER tables that create_all may not have built yet on a fresh file.
+    Base.metadata.create_all(bind=engine)
+    applied = apply_sqlite_compat_migrations(engine)
+    print(json.dumps({"dialect": engine.dialect.name, "applied_versions": applied}, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
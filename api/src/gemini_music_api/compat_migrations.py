@@ -0,0 +1,171 @@
+from __future__ import annotations
+
+from typing import NamedTuple
+
+from sqlalchemy import Connection, Engine
+
+
+class CompatMigration(NamedTuple):
+    version: int
+    table: str
+    column: str | None
+    ddl: str
+
+
+# Append-only: never renumber or edit an entry once it has shipped.
+COMPAT_MIGRATIONS: tuple[CompatMigration, ...] = (
+    CompatMigration(1, "session_events", "source_adapter", "ALTER TABLE session_events ADD COLUMN source_adapter VARCHAR(80)"),
+    CompatMigration(
+        2,
+        "session_events",
+        "schema_version",
+        "ALTER TABLE session_events ADD COLUMN schema_version VARCHAR(20) NOT NULL DEFAULT 'v1'",
+    ),
+    CompatMigration(
+        3,
+        "session_events",
+        None,
+        "CREATE INDEX IF NOT EXISTS ix_session_events_source_adapter ON session_events (source_adapter)",
+    ),
+    CompatMigration(
+        4,
+        "webhook_deliveries",
+        "attempt_count",
+        "ALTER TABLE webhook_deliveries ADD COLUMN attempt_count INTEGER NOT NULL DEFAULT 0",
+    ),
+    CompatMigration(
+        5,
+        "webhook_deliveries",
+        "max_attempts",
+        "ALTER TABLE webhook_deliveries ADD COLUMN max_attempts INTEGER NOT NULL DEFAULT 3",
+    ),
+    CompatMigration(6, "webhook_deliveries", "next_attempt_at", "ALTER TABLE webhook_deliveries ADD COLUMN next_attempt_at DATETIME"),
+    CompatMigration(7, "webhook_deliveries", "delivered_at", "ALTER TABLE webhook_deliveries ADD COLUMN delivered_at DATETIME"),
+    CompatMigration(8, "webhook_deliveries", "dead_lettered_at", "ALTER TABLE webhook_deliveries ADD COLUMN dead_lettered_at DATETIME"),
+    CompatMigration(9, "webhook_deliveries", "last_error", "ALTER TABLE webhook_deliveries ADD COLUMN last_error VARCHAR(500)"),
+    CompatMigration(
+        10,
+        "webhook_deliveries",
+        "dead_letter_reason",
+        "ALTER TABLE webhook_deliveries ADD COLUMN dead_letter_reason VARCHAR(500)",
+    ),
+    CompatMigration(
+        11,
+        "ecosystem_usage_daily",
+        "webhook_deliveries_succeeded",
+        "ALTER TABLE ecosystem_usage_daily ADD COLUMN webhook_deliveries_succeeded INTEGER NOT NULL DEFAULT 0",
+    ),
+    CompatMigration(
+        12,
+        "ecosystem_usage_daily",
+        "webhook_deliveries_retrying",
+        "ALTER TABLE ecosystem_usage_daily ADD COLUMN webhook_deliveries_retrying INTEGER NOT NULL DEFAULT 0",
+    ),
+    CompatMigration(
+        13,
+        "ecosystem_usage_daily",
+        "webhook_dead_letters",
+        "ALTER TABLE ecosystem_usage_daily ADD COLUMN webhook_dead_letters INTEGER NOT NULL DEFAULT 0",
+    ),
+    CompatMigration(
+        14,
+        "ecosystem_usage_daily",
+        "webhook_failed_attempts",
+        "ALTER TABLE ecosystem_usage_daily ADD COLUMN webhook_failed_attempts INTEGER NOT NULL DEFAULT 0",
+    ),
+    CompatMigration(
+        15,
+        "stage_score_projections",
+        "scorer_source",
+        "ALTER TABLE stage_score_projections ADD COLUMN scorer_source VARCHAR(20) NOT NULL DEFAULT 'deterministic'",
+    ),
+    CompatMigration(
+        16,
+        "stage_score_projections",
+        "scorer_model",
+        "ALTER TABLE stage_score_projections ADD COLUMN scorer_model VARCHAR(80)",
+    ),
+    CompatMigration(
+        17,
+        "stage_score_projections",
+        "scorer_confidence",
+        "ALTER TABLE stage_score_projections ADD COLUMN scorer_confidence FLOAT NOT NULL DEFAULT 0",
+    ),
+    CompatMigration(
+        18,
+        "stage_score_projections",
+        "scorer_evidence_json",
+        "ALTER TABLE stage_score_projections ADD COLUMN scorer_evidence_json JSON NOT NULL DEFAULT '{}'",
+    ),
+    CompatMigration(
+        19,
+        "stage_score_projections",
+        None,
+        "CREATE INDEX IF NOT EXISTS ix_stage_score_projections_scorer_source ON stage_score_projections (scorer_source)",
+    ),
+    CompatMigration(
+        20,
+        "session_events",
+        None,
+        "CREATE INDEX IF NOT EXISTS ix_session_events_session_id_id ON session_events (session_id, id)",
+    ),
+    CompatMigration(
+        21,
+        "webhook_deliveries",
+        None,
+        "CREATE INDEX IF NOT EXISTS ix_webhook_deliveries_status_next_attempt "
+        "ON webhook_deliveries (status, next_attempt_at)",
+    ),
+    CompatMigration(22, "webhook_deliveries", None, "DROP INDEX IF EXISTS ix_webhook_deliveries_status"),
+    CompatMigration(
+        23,
+        "audio_chunks",
+        None,
+        "CREATE INDEX IF NOT EXISTS ix_audio_chunks_session_stage_seq ON audio_chunks (session_id, stage, seq)",
+    ),
+    CompatMigration(24, "audio_chunks", None, "DROP INDEX IF EXISTS ix_audio_chunks_session_id"),
+)
+
+
+def _table_columns(conn: Connection, table_name: str) -> set[str]:
+    rows = conn.exec_driver_sql(f"PRAGMA table_info('{table_name}')").all()
+    # PRAGMA table_info columns: cid, name, type, notnull, dflt_value, pk
+    return {str(r[1]) for r in rows}
+
+
+def apply_sqlite_compat_migrations(engine: Engine) -> list[int]:
+    """
+    Bring local hackathon SQLite files up to the current model columns.
+
+    Applied versions are recorded in `schema_migrations`, so a boot with nothing
+    pending costs a single `SELECT MAX(version)`. Postgres deployments use Alembic.
+    """
+    if engine.dialect.name != "sqlite":
+        return []
+
+    with engine.begin() as conn:
+        conn.exec_driver_sql(
+            "CREATE TABLE IF NOT EXISTS schema_migrations ("
+            "version INTEGER PRIMARY KEY, applied_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP)"
+        )
+        current = conn.exec_driver_sql("SELECT MAX(version) FROM schema_migrations").scalar() or 0
+        pending = [m for m in COMPAT_MIGRATIONS if m.version > current]
+        if not pending:
+            return []
+
+        # Pending steps may target tables create_all just built with every column,
+        # so inspect each table once before adding columns.
+        columns: dict[str, set[str]] = {}
+        for migration in pending:
+            if migration.table not in columns:
+                columns[migration.table] = _table_columns(conn, migration.table)
+            existing = columns[migration.table]
+            if existing and (migration.column is None or migration.column not in existing):
+                conn.exec_driver_sql(migration.ddl)
+                if migration.column is not None:
+                    existing.add(migration.column)
+            conn.exec_driver_sql(
+                "INSERT INTO schema_migrations (version) VALUES (?)",
+                (migration.version,),
+            )
+        return [m.version for m in pending]
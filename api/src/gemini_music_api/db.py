@@ -1,29 +1,135 @@
 from __future__ import annotations
 
+import datetime as dt
 import os
+import uuid
 from collections.abc import Generator
+from typing import Any
 
-from sqlalchemy import create_engine
+from sqlalchemy import DateTime, String, Table, Uuid, create_engine, event
+from sqlalchemy.engine import make_url
 from sqlalchemy.orm import DeclarativeBase, Session, sessionmaker
+from sqlalchemy.pool import QueuePool
+from sqlalchemy.sql.dml import Insert
+from sqlalchemy.types import TypeDecorator
 
 DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./gemini_music.db")
 
-engine = create_engine(
-    DATABASE_URL,
-    connect_args={"check_same_thread": False} if DATABASE_URL.startswith("sqlite") else {},
-    future=True,
+
+def _engine_options(url: str) -> dict[str, Any]:
+    options: dict[str, Any] = {}
+    parsed = make_url(url)
+    if parsed.get_backend_name() == "sqlite":
+        options["connect_args"] = {"check_same_thread": False}
+        if parsed.database in (None, "", ":memory:"):
+            # In-memory databases live on a single connection; keep SQLAlchemy's default pool.
+            return options
+    options.update(
+        poolclass=QueuePool,
+        pool_size=int(os.getenv("DB_POOL_SIZE", "10")),
+        max_overflow=int(os.getenv("DB_MAX_OVERFLOW", "20")),
+        pool_pre_ping=True,
+        pool_timeout=float(os.getenv("DB_POOL_TIMEOUT_SECONDS", "30")),
+        pool_recycle=int(os.getenv("DB_POOL_RECYCLE_SECONDS", "3600")),
+    )
+    return options
+
+
+engine = create_engine(DATABASE_URL, future=True, **_engine_options(DATABASE_URL))
+
+_SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA cache_size=-65536",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA foreign_keys=ON",
 )
 
-SessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False, future=True)
+if engine.dialect.name == "sqlite":
+
+    @event.listens_for(engine, "connect")
+    def _apply_sqlite_pragmas(dbapi_conn: Any, _connection_record: Any) -> None:
+        cursor = dbapi_conn.cursor()
+        try:
+            for pragma in _SQLITE_PRAGMAS:
+                cursor.execute(pragma)
+        finally:
+            cursor.close()
+
+# Handlers serialize ORM rows after committing; keeping loaded state avoids a reload SELECT per row.
+SessionLocal = sessionmaker(
+    bind=engine,
+    autoflush=False,
+    autocommit=False,
+    expire_on_commit=False,
+    future=True,
+)
 
 
 class Base(DeclarativeBase):
     pass
 
 
+class UUIDString(TypeDecorator):
+    """UUID key stored as native 16-byte ``uuid`` on PostgreSQL and ``VARCHAR(36)`` elsewhere.
+
+    Python values stay canonical 36-character strings on every backend.
+    """
+
+    impl = String(36)
+    cache_ok = True
+
+    def load_dialect_impl(self, dialect: Any) -> Any:
+        if dialect.name == "postgresql":
+            return dialect.type_descriptor(Uuid(as_uuid=False))
+        return dialect.type_descriptor(String(36))
+
+    def process_bind_param(self, value: Any, dialect: Any) -> Any:
+        if value is None or dialect.name != "postgresql":
+            return value
+        try:
+            return str(uuid.UUID(str(value)))
+        except ValueError:
+            # A malformed id cannot match any row; bind NULL instead of failing the uuid cast.
+            return None
+
+
+class UTCDateTime(TypeDecorator):
+    """Timezone-aware UTC timestamp on every backend.
+
+    SQLite has no zone storage and hands back naive values; those are read as UTC so a row
+    serializes the same whether it was just written or loaded from the database.
+    """
+
+    impl = DateTime(timezone=True)
+    cache_ok = True
+
+    def process_bind_param(self, value: Any, dialect: Any) -> Any:
+        if isinstance(value, dt.datetime) and value.tzinfo is not None:
+            return value.astimezone(dt.timezone.utc)
+        return value
+
+    def process_result_value(self, value: Any, dialect: Any) -> Any:
+        if value is None:
+            return None
+        if value.tzinfo is None:
+            return value.replace(tzinfo=dt.timezone.utc)
+        return value.astimezone(dt.timezone.utc)
+
+
 def get_db() -> Generator[Session, None, None]:
     db = SessionLocal()
     try:
         yield db
     finally:
         db.close()
+
+
+def dialect_insert(db: Session, target: type[Base] | Table) -> Insert:
+    """INSERT construct with ON CONFLICT support for the bound dialect (SQLite or PostgreSQL)."""
+    if db.get_bind().dialect.name == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    else:
+        from sqlalchemy.dialects.sqlite import insert
+    return insert(target)
@@ -2,24 +2,32 @@ from __future__ import annotations
 
 import datetime as dt
 import json
+import os
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from pathlib import Path
-from typing import Annotated
+from types import MappingProxyType
+from typing import Annotated, Any
 
-from fastapi import Depends, FastAPI, HTTPException, status
-from fastapi.responses import RedirectResponse
+from anyio import to_thread
+from fastapi import BackgroundTasks, Depends, FastAPI, Header, HTTPException, status
+from fastapi.responses import JSONResponse, ORJSONResponse, RedirectResponse, Response
 from fastapi.staticfiles import StaticFiles
-from sqlalchemy import Connection, select
-from sqlalchemy.exc import IntegrityError
-from sqlalchemy.orm import Session as DBSession
+from pydantic import BaseModel, TypeAdapter
+from sqlalchemy import Float, and_, bindparam, case, cast, insert, select
+from sqlalchemy.orm import InstrumentedAttribute, Session as DBSession
 
-from .db import Base, engine, get_db
+from .compat_migrations import apply_sqlite_compat_migrations
+from .db import Base, dialect_insert, engine, get_db
 from .models import (
     AdaptationDecision,
     AudioChunk,
+    BhavEvaluation,
     BusinessSignalDaily,
     ConsentRecord,
     EcosystemUsageDaily,
     IntegrationExportLog,
+    PracticeProgress,
     SessionEvent,
     SessionModel,
     StageScoreProjection,
@@ -43,10 +51,14 @@ from .schemas import (
     MahaTimingOut,
     MahaMantraEvalOut,
     MahaMantraEvalRequest,
+    PartnerEventBatchIn,
+    PartnerEventBatchOut,
     PartnerEventIn,
     ProgressOut,
     SessionEndOut,
     SessionEndRequest,
+    SessionEventBatchIn,
+    SessionEventBatchOut,
     SessionEventIn,
     SessionEventOut,
     SessionOut,
@@ -58,12 +70,24 @@ from .schemas import (
     StageScoreProjectionOut,
 )
 from .services.adaptation import AdaptationContext, generate_adaptation
-from .services.audio_scoring import normalize_audio_chunk, recompute_stage_projection
+from .services.audio_scoring import (
+    enhance_stage_projection_with_gemini,
+    flush_pending_projections,
+    mark_gemini_pending,
+    mark_projection_pending,
+    normalize_audio_chunk,
+    recompute_pending_projection,
+    recompute_stage_projection,
+)
+from .services.analytics_cache import analytics_cache
 from .services.ai_kirtan_contract import quality_rubric_score, verify_payload_contract
 from .services.bhav import DEFAULT_GOLDEN_PROFILE, compute_bhav, resolve_lineage
+from .services.consent_cache import consent_cache
 from .services.event_contracts import validate_event_payload
 from .services.experiments import compare_adaptive_vs_static
-from .services.gemini_adapter import try_gemini_adaptation
+from .services.gemini_adapter import close_gemini_clients, get_gemini_adaptation_config, try_gemini_adaptation
+from .services.gemini_scoring import get_gemini_scoring_config
+from .services.ingest_buffer import partner_event_buffer, write_partner_events
 from .services.maha_mantra_timing import load_maha_mantra_timing_markers
 from .services.maha_mantra_eval import evaluate_maha_mantra_stage
 from .services.projections import (
@@ -74,10 +98,41 @@ from .services.projections import (
     process_webhook_deliveries,
     queue_webhook_deliveries,
     recompute_all_daily_projections,
-    refresh_daily_projections,
+    record_bhav_evaluation,
+    record_partner_events,
+    record_session_ended,
+    record_session_started,
+    refresh_ecosystem_usage_days,
+    to_date_key,
 )
 
+# DB-backed handlers are sync and run on AnyIO's worker threads; size that pool to the DB pool
+# (DB_POOL_SIZE + DB_MAX_OVERFLOW) plus headroom. Handlers with no DB or file I/O are `async def`
+# so they run on the event loop and never queue behind DB work for a thread.
+API_THREADPOOL_SIZE = int(os.getenv("API_THREADPOOL_SIZE", "40"))
+# Compat steps normally run once per deploy via `make migrate`; set this to also apply them at boot.
+RUN_COMPAT_MIGRATIONS = os.getenv("RUN_COMPAT_MIGRATIONS", "false").strip().lower() in {"1", "true", "yes"}
+
+
+@asynccontextmanager
+async def lifespan(_: FastAPI) -> AsyncIterator[None]:
+    Base.metadata.create_all(bind=engine)
+    if RUN_COMPAT_MIGRATIONS:
+        apply_sqlite_compat_migrations(engine)
+    to_thread.current_default_thread_limiter().total_tokens = API_THREADPOOL_SIZE
+    # Prime the cached marker file so the async timing handler never reads from disk.
+    load_maha_mantra_timing_markers()
+    partner_event_buffer.start()
+    try:
+        yield
+    finally:
+        partner_event_buffer.stop()
+        close_gemini_clients()
+
+
 app = FastAPI(
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
     title="Gemini Music API",
     version="0.1.0",
     description=(
@@ -88,6 +143,84 @@ app = FastAPI(
 
 WEB_DIR = Path(__file__).resolve().parents[2] / "web"
 DEMO_WEB_DIR = Path(__file__).resolve().parents[2] / "web-demo"
+NORTH_STAR_CONTRACT_PATH = Path(__file__).resolve().parents[3] / "docs" / "contracts" / "north_star_metric.v1.json"
+PARTNER_ASYNC_INSERT_DEFAULT = os.getenv("PARTNER_ASYNC_INSERT", "false").strip().lower() in {"1", "true", "yes"}
+
+
+def _load_north_star_contract() -> dict[str, Any]:
+    try:
+        return json.loads(NORTH_STAR_CONTRACT_PATH.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+
+# Static for the life of the process; read once at import instead of per request.
+_NORTH_STAR_CONTRACT = MappingProxyType(_load_north_star_contract())
+_STAGE_PROJECTION_LIST_ADAPTER = TypeAdapter(list[StageScoreProjectionOut])
+_WEBHOOK_SUBSCRIPTION_LIST_ADAPTER = TypeAdapter(list[WebhookSubscriptionOut])
+_STAGE_RANK = MappingProxyType({"guided": 0, "call_response": 1, "independent": 2})
+_STAGE_ORDER = case(dict(_STAGE_RANK), value=StageScoreProjection.stage, else_=99)
+
+# Hot lookups are built once with bound parameters so each request only supplies values.
+_EVENT_BY_CLIENT_ID = select(SessionEvent).where(
+    SessionEvent.session_id == bindparam("session_id"),
+    SessionEvent.client_event_id == bindparam("client_event_id"),
+)
+_CHUNK_BY_CHUNK_ID = select(AudioChunk).where(
+    AudioChunk.session_id == bindparam("session_id"),
+    AudioChunk.chunk_id == bindparam("chunk_id"),
+)
+_LATEST_CONSENT = (
+    select(ConsentRecord)
+    .where(ConsentRecord.user_id == bindparam("user_id"))
+    .order_by(ConsentRecord.created_at.desc(), ConsentRecord.id.desc())
+    .limit(1)
+)
+_USER_WITH_PROGRESS = (
+    select(User.id, PracticeProgress)
+    .outerjoin(PracticeProgress, PracticeProgress.user_id == User.id)
+    .where(User.id == bindparam("user_id"))
+)
+_LATEST_EVENT_ID = (
+    select(SessionEvent.id)
+    .where(SessionEvent.session_id == SessionModel.id)
+    .order_by(SessionEvent.id.desc())
+    .limit(1)
+    .correlate(SessionModel)
+    .scalar_subquery()
+)
+_SESSION_WITH_LATEST_EVENT = (
+    select(SessionModel, SessionEvent)
+    .outerjoin(SessionEvent, SessionEvent.id == _LATEST_EVENT_ID)
+    .where(SessionModel.id == bindparam("session_id"))
+)
+_SIGNAL_STARTED = case(
+    (BusinessSignalDaily.sessions_started < 1, 1),
+    else_=BusinessSignalDaily.sessions_started,
+)
+_SIGNAL_MEANINGFUL_RATE = cast(BusinessSignalDaily.meaningful_sessions, Float) / cast(_SIGNAL_STARTED, Float)
+_ATTRIBUTION_WINDOW = (
+    select(
+        BusinessSignalDaily.date_key,
+        BusinessSignalDaily.sessions_started,
+        BusinessSignalDaily.sessions_completed,
+        BusinessSignalDaily.meaningful_sessions,
+        BusinessSignalDaily.day7_returning_users,
+        _SIGNAL_MEANINGFUL_RATE.label("meaningful_rate"),
+        (
+            _SIGNAL_MEANINGFUL_RATE
+            * BusinessSignalDaily.adaptation_helpful_rate
+            * BusinessSignalDaily.bhav_pass_rate
+        ).label("north_star_raw"),
+    )
+    .order_by(BusinessSignalDaily.date_key.desc())
+    .limit(7)
+    .subquery()
+)
+# Last seven days, oldest first, with the per-day rates computed by the database.
+_ATTRIBUTION_TIMELINE = select(_ATTRIBUTION_WINDOW).order_by(_ATTRIBUTION_WINDOW.c.date_key.asc())
+_SESSION_WITH_KEY_STMTS: dict[tuple[type[Base], str], Any] = {}
+
 if WEB_DIR.exists():
     app.mount("/poc", StaticFiles(directory=str(WEB_DIR), html=True), name="poc")
 
@@ -99,129 +232,13 @@ if DEMO_WEB_DIR.exists():
     app.mount("/demo", StaticFiles(directory=str(DEMO_WEB_DIR), html=True), name="demo")
 
 
-def _sqlite_table_exists(conn: Connection, table_name: str) -> bool:
-    row = conn.exec_driver_sql(
-        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?",
-        (table_name,),
-    ).first()
-    return row is not None
-
-
-def _sqlite_table_columns(conn: Connection, table_name: str) -> set[str]:
-    rows = conn.exec_driver_sql(f"PRAGMA table_info('{table_name}')").all()
-    # PRAGMA table_info columns: cid, name, type, notnull, dflt_value, pk
-    return {str(r[1]) for r in rows}
-
-
-def _apply_sqlite_compat_migrations() -> None:
-    """
-    Lightweight compatibility migrations for local hackathon SQLite files.
-    """
-    with engine.begin() as conn:
-        if conn.dialect.name != "sqlite":
-            return
-
-        if _sqlite_table_exists(conn, "session_events"):
-            cols = _sqlite_table_columns(conn, "session_events")
-            if "source_adapter" not in cols:
-                conn.exec_driver_sql(
-                    "ALTER TABLE session_events ADD COLUMN source_adapter VARCHAR(80)"
-                )
-            if "schema_version" not in cols:
-                conn.exec_driver_sql(
-                    "ALTER TABLE session_events ADD COLUMN schema_version VARCHAR(20) NOT NULL DEFAULT 'v1'"
-                )
-            conn.exec_driver_sql(
-                "CREATE INDEX IF NOT EXISTS ix_session_events_source_adapter ON session_events (source_adapter)"
-            )
-
-        if _sqlite_table_exists(conn, "webhook_deliveries"):
-            cols = _sqlite_table_columns(conn, "webhook_deliveries")
-            if "attempt_count" not in cols:
-                conn.exec_driver_sql(
-                    "ALTER TABLE webhook_deliveries ADD COLUMN attempt_count INTEGER NOT NULL DEFAULT 0"
-                )
-            if "max_attempts" not in cols:
-                conn.exec_driver_sql(
-                    "ALTER TABLE webhook_deliveries ADD COLUMN max_attempts INTEGER NOT NULL DEFAULT 3"
-                )
-            if "next_attempt_at" not in cols:
-                conn.exec_driver_sql(
-                    "ALTER TABLE webhook_deliveries ADD COLUMN next_attempt_at DATETIME"
-                )
-            if "delivered_at" not in cols:
-                conn.exec_driver_sql(
-                    "ALTER TABLE webhook_deliveries ADD COLUMN delivered_at DATETIME"
-                )
-            if "dead_lettered_at" not in cols:
-                conn.exec_driver_sql(
-                    "ALTER TABLE webhook_deliveries ADD COLUMN dead_lettered_at DATETIME"
-                )
-            if "last_error" not in cols:
-                conn.exec_driver_sql(
-                    "ALTER TABLE webhook_deliveries ADD COLUMN last_error VARCHAR(500)"
-                )
-            if "dead_letter_reason" not in cols:
-                conn.exec_driver_sql(
-                    "ALTER TABLE webhook_deliveries ADD COLUMN dead_letter_reason VARCHAR(500)"
-                )
-
-        if _sqlite_table_exists(conn, "ecosystem_usage_daily"):
-            cols = _sqlite_table_columns(conn, "ecosystem_usage_daily")
-            if "webhook_deliveries_succeeded" not in cols:
-                conn.exec_driver_sql(
-                    "ALTER TABLE ecosystem_usage_daily ADD COLUMN webhook_deliveries_succeeded INTEGER NOT NULL DEFAULT 0"
-                )
-            if "webhook_deliveries_retrying" not in cols:
-                conn.exec_driver_sql(
-                    "ALTER TABLE ecosystem_usage_daily ADD COLUMN webhook_deliveries_retrying INTEGER NOT NULL DEFAULT 0"
-                )
-            if "webhook_dead_letters" not in cols:
-                conn.exec_driver_sql(
-                    "ALTER TABLE ecosystem_usage_daily ADD COLUMN webhook_dead_letters INTEGER NOT NULL DEFAULT 0"
-                )
-            if "webhook_failed_attempts" not in cols:
-                conn.exec_driver_sql(
-                    "ALTER TABLE ecosystem_usage_daily ADD COLUMN webhook_failed_attempts INTEGER NOT NULL DEFAULT 0"
-                )
-
-        if _sqlite_table_exists(conn, "stage_score_projections"):
-            cols = _sqlite_table_columns(conn, "stage_score_projections")
-            if "scorer_source" not in cols:
-                conn.exec_driver_sql(
-                    "ALTER TABLE stage_score_projections ADD COLUMN scorer_source VARCHAR(20) NOT NULL DEFAULT 'deterministic'"
-                )
-            if "scorer_model" not in cols:
-                conn.exec_driver_sql(
-                    "ALTER TABLE stage_score_projections ADD COLUMN scorer_model VARCHAR(80)"
-                )
-            if "scorer_confidence" not in cols:
-                conn.exec_driver_sql(
-                    "ALTER TABLE stage_score_projections ADD COLUMN scorer_confidence FLOAT NOT NULL DEFAULT 0"
-                )
-            if "scorer_evidence_json" not in cols:
-                conn.exec_driver_sql(
-                    "ALTER TABLE stage_score_projections ADD COLUMN scorer_evidence_json JSON NOT NULL DEFAULT '{}'"
-                )
-            conn.exec_driver_sql(
-                "CREATE INDEX IF NOT EXISTS ix_stage_score_projections_scorer_source ON stage_score_projections (scorer_source)"
-            )
-
-
-@app.on_event("startup")
-def on_startup() -> None:
-    Base.metadata.create_all(bind=engine)
-    _apply_sqlite_compat_migrations()
-
-
 def _utcnow() -> dt.datetime:
     return dt.datetime.now(dt.timezone.utc)
 
 
-def _date_key(value: dt.datetime | dt.date) -> str:
-    if isinstance(value, dt.date) and not isinstance(value, dt.datetime):
-        return value.isoformat()
-    return value.date().isoformat()
+def _model_response(model: BaseModel, status_code: int = status.HTTP_200_OK) -> Response:
+    """Encode a response model once in pydantic-core, skipping FastAPI's response_model re-validation."""
+    return Response(content=model.model_dump_json(), status_code=status_code, media_type="application/json")
 
 
 def _north_star_value(row: BusinessSignalDaily | None) -> float:
@@ -247,13 +264,56 @@ def _must_get_session(db: DBSession, session_id: str) -> SessionModel:
     return session
 
 
+def _must_get_session_with(
+    db: DBSession,
+    session_id: str,
+    key_column: InstrumentedAttribute[Any],
+    key_value: str | None,
+) -> tuple[SessionModel, Any]:
+    """Load the session and its idempotency match (`key_column == key_value`) in one round trip."""
+    if key_value is None:
+        return _must_get_session(db, session_id), None
+    model = key_column.class_
+    stmt = _SESSION_WITH_KEY_STMTS.get((model, key_column.key))
+    if stmt is None:
+        stmt = (
+            select(SessionModel, model)
+            .outerjoin(model, and_(model.session_id == SessionModel.id, key_column == bindparam("key_value")))
+            .where(SessionModel.id == bindparam("session_id"))
+            .limit(1)
+        )
+        _SESSION_WITH_KEY_STMTS[(model, key_column.key)] = stmt
+    row = db.execute(stmt, {"session_id": session_id, "key_value": key_value}).first()
+    if row is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Session not found")
+    return row[0], row[1]
+
+
 def _latest_consent(db: DBSession, user_id: str) -> ConsentRecord | None:
-    return db.scalars(
-        select(ConsentRecord)
-        .where(ConsentRecord.user_id == user_id)
-        .order_by(ConsentRecord.created_at.desc(), ConsentRecord.id.desc())
-        .limit(1)
-    ).first()
+    return db.scalars(_LATEST_CONSENT, {"user_id": user_id}).first()
+
+
+def _validate_event_write(
+    session: SessionModel,
+    *,
+    event_type: str,
+    payload: dict,
+    schema_version: str,
+) -> None:
+    if session.status != "ACTIVE":
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Session is not active")
+
+    validate_event_payload(
+        event_type=event_type,
+        payload=payload,
+        schema_version=schema_version,
+    )
+
+
+def _use_async_insert(header_value: str | None) -> bool:
+    if header_value is None:
+        return PARTNER_ASYNC_INSERT_DEFAULT
+    return header_value.strip().lower() in {"1", "true", "yes"}
 
 
 def _ingest_event_row(
@@ -266,76 +326,59 @@ def _ingest_event_row(
     ingestion_source: str,
     source_adapter: str | None,
     schema_version: str,
+    existing: SessionEvent | None,
 ) -> SessionEventOut:
-    if session.status != "ACTIVE":
-        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Session is not active")
-
-    validate_event_payload(
+    _validate_event_write(
+        session,
         event_type=event_type,
         payload=payload,
         schema_version=schema_version,
     )
 
-    if client_event_id:
+    if existing is not None:
+        return SessionEventOut.from_orm_trusted(existing, idempotency_hit=True)
+
+    # A concurrent duplicate is skipped by ON CONFLICT instead of failing the flush, so the
+    # common no-duplicate path is a single INSERT ... RETURNING with no savepoint.
+    event = db.scalars(
+        dialect_insert(db, SessionEvent)
+        .values(
+            session_id=session.id,
+            event_type=event_type,
+            client_event_id=client_event_id,
+            ingestion_source=ingestion_source,
+            source_adapter=source_adapter,
+            schema_version=schema_version,
+            payload=payload,
+        )
+        .on_conflict_do_nothing(index_elements=["session_id", "client_event_id"])
+        .returning(SessionEvent)
+    ).first()
+    if event is None:
         existing = db.scalars(
-            select(SessionEvent).where(
-                SessionEvent.session_id == session.id,
-                SessionEvent.client_event_id == client_event_id,
-            )
+            _EVENT_BY_CLIENT_ID,
+            {"session_id": session.id, "client_event_id": client_event_id},
         ).first()
-        if existing:
-            out = SessionEventOut.model_validate(existing)
-            out.idempotency_hit = True
-            return out
+        if existing is None:
+            raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Conflicting event write")
+        return SessionEventOut.from_orm_trusted(existing, idempotency_hit=True)
 
-    event = SessionEvent(
-        session_id=session.id,
-        event_type=event_type,
-        client_event_id=client_event_id,
-        ingestion_source=ingestion_source,
-        source_adapter=source_adapter,
-        schema_version=schema_version,
-        payload=payload,
-    )
-    db.add(event)
-    try:
-        db.commit()
-    except IntegrityError:
-        db.rollback()
-        if client_event_id:
-            existing = db.scalars(
-                select(SessionEvent).where(
-                    SessionEvent.session_id == session.id,
-                    SessionEvent.client_event_id == client_event_id,
-                )
-            ).first()
-            if existing:
-                out = SessionEventOut.model_validate(existing)
-                out.idempotency_hit = True
-                return out
-        raise
-
-    db.refresh(event)
-    out = SessionEventOut.model_validate(event)
-    out.idempotency_hit = False
-    return out
+    return SessionEventOut.from_orm_trusted(event, idempotency_hit=False)
 
 
 @app.get("/health", response_model=HealthOut)
-def health() -> HealthOut:
+async def health() -> HealthOut:
     return HealthOut(ok=True, service="gemini-music-api")
 
 
 @app.post("/v1/users", response_model=UserOut, status_code=status.HTTP_201_CREATED)
 def create_user(payload: UserCreate, db: Annotated[DBSession, Depends(get_db)]) -> User:
-    user = User(display_name=payload.display_name.strip())
-    db.add(user)
-    db.flush()
-
-    consent = ConsentRecord(user_id=user.id)
-    db.add(consent)
+    user = db.execute(
+        insert(User).values(display_name=payload.display_name.strip()).returning(User)
+    ).scalar_one()
+    consent = db.execute(insert(ConsentRecord).values(user_id=user.id).returning(ConsentRecord)).scalar_one()
     db.commit()
-    db.refresh(user)
+    consent_cache.put(ConsentOut.from_orm_trusted(consent))
     return user
 
 
@@ -344,29 +387,39 @@ def set_user_consent(
     user_id: str,
     payload: ConsentUpdate,
     db: Annotated[DBSession, Depends(get_db)],
-) -> ConsentRecord:
+) -> ConsentOut:
     _must_get_user(db, user_id)
-    consent = ConsentRecord(
-        user_id=user_id,
-        biometric_enabled=payload.biometric_enabled,
-        environmental_enabled=payload.environmental_enabled,
-        raw_audio_storage_enabled=payload.raw_audio_storage_enabled,
-        policy_version=payload.policy_version,
-        source="api",
-    )
-    db.add(consent)
+    consent = db.execute(
+        insert(ConsentRecord)
+        .values(
+            user_id=user_id,
+            biometric_enabled=payload.biometric_enabled,
+            environmental_enabled=payload.environmental_enabled,
+            raw_audio_storage_enabled=payload.raw_audio_storage_enabled,
+            policy_version=payload.policy_version,
+            source="api",
+        )
+        .returning(ConsentRecord)
+    ).scalar_one()
     db.commit()
-    db.refresh(consent)
-    return consent
+    out = ConsentOut.from_orm_trusted(consent)
+    consent_cache.put(out)
+    return out
 
 
 @app.get("/v1/users/{user_id}/consent", response_model=ConsentOut)
-def get_user_consent(user_id: str, db: Annotated[DBSession, Depends(get_db)]) -> ConsentRecord:
+def get_user_consent(user_id: str, db: Annotated[DBSession, Depends(get_db)]) -> ConsentOut:
+    # Users are never deleted, so a cached consent also proves the user exists.
+    cached = consent_cache.get(user_id)
+    if cached is not None:
+        return cached
     _must_get_user(db, user_id)
     consent = _latest_consent(db, user_id)
     if consent is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Consent not found")
-    return consent
+    out = ConsentOut.from_orm_trusted(consent)
+    consent_cache.put(out)
+    return out
 
 
 @app.post("/v1/sessions", response_model=SessionOut, status_code=status.HTTP_201_CREATED)
@@ -398,10 +451,8 @@ def start_session(payload: SessionStartRequest, db: Annotated[DBSession, Depends
     )
     db.add(session_started)
 
+    record_session_started(db, session=session)
     db.commit()
-    refresh_daily_projections(db, date_key=_date_key(session.started_at))
-    db.commit()
-    db.refresh(session)
     return session
 
 
@@ -416,7 +467,12 @@ def ingest_session_event(
     payload: SessionEventIn,
     db: Annotated[DBSession, Depends(get_db)],
 ) -> SessionEventOut:
-    session = _must_get_session(db, session_id)
+    session, existing = _must_get_session_with(
+        db,
+        session_id,
+        SessionEvent.client_event_id,
+        payload.client_event_id,
+    )
     out = _ingest_event_row(
         db,
         session=session,
@@ -426,29 +482,133 @@ def ingest_session_event(
         ingestion_source="api",
         source_adapter=payload.source_adapter,
         schema_version=payload.schema_version,
+        existing=existing,
     )
-    refresh_daily_projections(db, date_key=_date_key(out.event_time))
+    # API-sourced events do not feed the daily ecosystem/business projections.
     db.commit()
     return out
 
 
+@app.post(
+    "/v1/sessions/{session_id}/events:batch",
+    response_model=SessionEventBatchOut,
+    status_code=status.HTTP_201_CREATED,
+)
+def ingest_session_events_batch(
+    session_id: str,
+    payload: SessionEventBatchIn,
+    db: Annotated[DBSession, Depends(get_db)],
+) -> Response:
+    session = _must_get_session(db, session_id)
+    for item in payload.events:
+        _validate_event_write(
+            session,
+            event_type=item.event_type,
+            payload=item.payload,
+            schema_version=item.schema_version,
+        )
+
+    client_ids = {item.client_event_id for item in payload.events if item.client_event_id is not None}
+    by_client_id: dict[str, SessionEvent] = {}
+    if client_ids:
+        by_client_id = {
+            event.client_event_id: event
+            for event in db.scalars(
+                select(SessionEvent).where(
+                    SessionEvent.session_id == session.id,
+                    SessionEvent.client_event_id.in_(client_ids),
+                )
+            )
+        }
+    already_stored = set(by_client_id)
+
+    # First occurrence of each new client_event_id (and every unkeyed event) is inserted;
+    # later repeats inside the batch resolve to that row as idempotency hits.
+    rows: list[dict[str, Any]] = []
+    queued: set[str] = set()
+    for item in payload.events:
+        if item.client_event_id is not None:
+            if item.client_event_id in already_stored or item.client_event_id in queued:
+                continue
+            queued.add(item.client_event_id)
+        rows.append(
+            {
+                "session_id": session.id,
+                "event_type": item.event_type,
+                "client_event_id": item.client_event_id,
+                "ingestion_source": "api",
+                "source_adapter": item.source_adapter,
+                "schema_version": item.schema_version,
+                "payload": item.payload,
+            }
+        )
+
+    inserted_ids: set[int] = set()
+    unkeyed: list[SessionEvent] = []
+    if rows:
+        inserted = db.scalars(
+            dialect_insert(db, SessionEvent)
+            .on_conflict_do_nothing(index_elements=["session_id", "client_event_id"])
+            .returning(SessionEvent, sort_by_parameter_order=True),
+            rows,
+        ).all()
+        for event in inserted:
+            inserted_ids.add(event.id)
+            if event.client_event_id is None:
+                unkeyed.append(event)
+            else:
+                by_client_id[event.client_event_id] = event
+        lost = queued.difference(by_client_id)
+        if lost:
+            # A concurrent writer stored these client_event_ids between our SELECT and INSERT.
+            by_client_id.update(
+                (event.client_event_id, event)
+                for event in db.scalars(
+                    select(SessionEvent).where(
+                        SessionEvent.session_id == session.id,
+                        SessionEvent.client_event_id.in_(lost),
+                    )
+                )
+            )
+            if not queued.issubset(by_client_id):
+                raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Conflicting event write")
+
+    results: list[SessionEventOut] = []
+    unkeyed_iter = iter(unkeyed)
+    reported: set[int] = set()
+    for item in payload.events:
+        event = next(unkeyed_iter) if item.client_event_id is None else by_client_id[item.client_event_id]
+        results.append(
+            SessionEventOut.from_orm_trusted(
+                event,
+                idempotency_hit=event.id not in inserted_ids or event.id in reported,
+            )
+        )
+        reported.add(event.id)
+    # API-sourced events do not feed the daily ecosystem/business projections.
+    db.commit()
+    # Up to 500 events: encode the whole body in pydantic-core instead of FastAPI's per-item walk.
+    body = SessionEventBatchOut.model_construct(
+        events=results,
+        inserted=len(inserted_ids),
+        idempotency_hits=sum(1 for out in results if out.idempotency_hit),
+    )
+    return _model_response(body, status_code=status.HTTP_201_CREATED)
+
+
 @app.post("/v1/sessions/{session_id}/adaptations", response_model=AdaptationOut)
 def create_adaptation(
     session_id: str,
     payload: AdaptationRequest,
     db: Annotated[DBSession, Depends(get_db)],
-) -> AdaptationDecision:
-    session = _must_get_session(db, session_id)
+) -> Response:
+    row = db.execute(_SESSION_WITH_LATEST_EVENT, {"session_id": session_id}).first()
+    if row is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Session not found")
+    session, latest_signal = row
     if session.status != "ACTIVE":
         raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Session is not active")
 
-    latest_signal = db.scalars(
-        select(SessionEvent)
-        .where(SessionEvent.session_id == session_id)
-        .order_by(SessionEvent.id.desc())
-        .limit(1)
-    ).first()
-
     p = latest_signal.payload if latest_signal else {}
 
     ctx = AdaptationContext(
@@ -464,6 +624,11 @@ def create_adaptation(
         ),
     )
 
+    gemini_cfg = get_gemini_adaptation_config()
+    if gemini_cfg.enabled and gemini_cfg.api_key:
+        # End the read-only transaction so the pooled connection is not held across the model call.
+        db.commit()
+
     gemini_error: str | None = None
     try:
         gemini_payload = try_gemini_adaptation(
@@ -491,8 +656,9 @@ def create_adaptation(
         decision_payload = generate_adaptation(ctx)
         decision_payload.setdefault("adaptation_json", {}).setdefault("contract", {})["fallback_from_invalid_payload"] = True
         decision_payload["adaptation_json"]["contract"]["errors"] = contract_errors
+    # A payload that just passed verification scores from that result; a fallback is re-verified.
     decision_payload.setdefault("adaptation_json", {}).setdefault("contract", {})["quality_score"] = round(
-        quality_rubric_score(decision_payload),
+        quality_rubric_score(decision_payload, errors=[] if contract_ok else None),
         3,
     )
     decision = AdaptationDecision(
@@ -517,7 +683,7 @@ def create_adaptation(
     )
     db.add(event)
 
-    db.commit()
+    db.flush()
     queue_webhook_deliveries(
         db,
         event_type="adaptation_applied",
@@ -527,10 +693,12 @@ def create_adaptation(
             "guidance_intensity": decision.guidance_intensity,
         },
     )
-    refresh_daily_projections(db, date_key=_date_key(decision.decision_time))
+    # Decisions are not part of the daily projections; the queued webhooks already
+    # bumped outbound_webhooks_queued above.
     db.commit()
-    db.refresh(decision)
-    return decision
+    # The row was just written from a contract-checked payload: encode it once in pydantic-core
+    # rather than letting FastAPI re-validate it against response_model first.
+    return _model_response(AdaptationOut.from_orm_trusted(decision))
 
 
 @app.post("/v1/sessions/{session_id}/end", response_model=SessionEndOut)
@@ -566,7 +734,7 @@ def end_session(
     )
     db.add(end_event)
 
-    db.commit()
+    db.flush()
     queue_webhook_deliveries(
         db,
         event_type="session_ended",
@@ -576,10 +744,9 @@ def end_session(
             "summary": summary,
         },
     )
-    refresh_daily_projections(db, date_key=_date_key(session.ended_at or _utcnow()))
+    record_session_ended(db, session=session, summary=summary)
     db.commit()
-    db.refresh(session)
-    return SessionEndOut(session=SessionOut.model_validate(session), summary=summary)
+    return SessionEndOut(session=SessionOut.from_orm_trusted(session), summary=summary)
 
 
 @app.post("/v1/sessions/{session_id}/bhav", response_model=BhavEvaluationOut)
@@ -588,8 +755,6 @@ def evaluate_bhav(
     payload: BhavEvaluateRequest,
     db: Annotated[DBSession, Depends(get_db)],
 ) -> BhavEvaluationOut:
-    from .models import BhavEvaluation
-
     session = _must_get_session(db, session_id)
     if session.status != "ENDED":
         raise HTTPException(
@@ -647,7 +812,7 @@ def evaluate_bhav(
             detail_json=bhav["detail_json"],
         )
         db.add(row)
-        db.commit()
+        db.flush()
         queue_webhook_deliveries(
             db,
             event_type="bhav_evaluated",
@@ -658,10 +823,9 @@ def evaluate_bhav(
                 "passes_golden": bhav["passes_golden"],
             },
         )
-        refresh_daily_projections(db, date_key=_date_key(_utcnow()))
+        record_bhav_evaluation(db, evaluation=row)
         db.commit()
-        db.refresh(row)
-        return BhavEvaluationOut.model_validate(row)
+        return BhavEvaluationOut.from_orm_trusted(row)
 
     return BhavEvaluationOut(
         id=None,
@@ -680,12 +844,12 @@ def evaluate_bhav(
 
 
 @app.get("/v1/maha-mantra/timing", response_model=MahaTimingOut)
-def get_maha_mantra_timing() -> MahaTimingOut:
+async def get_maha_mantra_timing() -> MahaTimingOut:
     return MahaTimingOut.model_validate(load_maha_mantra_timing_markers())
 
 
 @app.post("/v1/maha-mantra/evaluate", response_model=MahaMantraEvalOut)
-def evaluate_maha_mantra(payload: MahaMantraEvalRequest) -> MahaMantraEvalOut:
+async def evaluate_maha_mantra(payload: MahaMantraEvalRequest) -> MahaMantraEvalOut:
     if payload.golden_profile != DEFAULT_GOLDEN_PROFILE:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -717,8 +881,16 @@ def ingest_audio_chunk(
     session_id: str,
     payload: AudioChunkIn,
     db: Annotated[DBSession, Depends(get_db)],
+    background_tasks: BackgroundTasks,
+    defer_projection: bool = False,
+    defer_gemini: bool = False,
 ) -> AudioChunkIngestOut:
-    session = _must_get_session(db, session_id)
+    session, existing = _must_get_session_with(
+        db,
+        session_id,
+        AudioChunk.chunk_id,
+        payload.chunk_id,
+    )
     if session.status != "ACTIVE":
         raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Session is not active")
     if payload.golden_profile != DEFAULT_GOLDEN_PROFILE:
@@ -734,13 +906,9 @@ def ingest_audio_chunk(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(exc),
         ) from exc
+    # Nothing to rescore later without Gemini scoring; the inline path already scores deterministically.
+    defer_gemini = defer_gemini and get_gemini_scoring_config().enabled
 
-    existing = db.scalars(
-        select(AudioChunk).where(
-            AudioChunk.session_id == session_id,
-            AudioChunk.chunk_id == payload.chunk_id,
-        )
-    ).first()
     if existing is not None:
         projection = db.scalars(
             select(StageScoreProjection).where(
@@ -759,48 +927,47 @@ def ingest_audio_chunk(
                 golden_profile=existing.golden_profile,
             )
             db.commit()
-            db.refresh(projection)
 
-        out = AudioChunkIngestOut.model_validate(existing)
-        out.idempotency_hit = True
-        out.projection = StageScoreProjectionOut.model_validate(projection)
-        return out
+        return AudioChunkIngestOut.from_orm_trusted(
+            existing,
+            idempotency_hit=True,
+            projection=StageScoreProjectionOut.from_orm_trusted(projection),
+        )
 
     features_json, metrics_json, chunk_confidence = normalize_audio_chunk(
         t_start_ms=payload.t_start_ms,
         t_end_ms=payload.t_end_ms,
         features=payload.features,
     )
-    row = AudioChunk(
-        session_id=session_id,
-        stage=payload.stage,
-        round_index=payload.round_index,
-        chunk_id=payload.chunk_id,
-        seq=payload.seq,
-        t_start_ms=payload.t_start_ms,
-        t_end_ms=payload.t_end_ms,
-        sample_rate_hz=payload.sample_rate_hz,
-        encoding=payload.encoding,
-        blob_uri=payload.blob_uri,
-        lineage_id=lineage.id,
-        golden_profile=payload.golden_profile,
-        features_json=features_json,
-        metrics_json=metrics_json,
-        confidence=chunk_confidence,
-    )
-    db.add(row)
-    try:
-        db.flush()
-    except IntegrityError:
-        db.rollback()
+    row = db.scalars(
+        dialect_insert(db, AudioChunk)
+        .values(
+            session_id=session_id,
+            stage=payload.stage,
+            round_index=payload.round_index,
+            chunk_id=payload.chunk_id,
+            seq=payload.seq,
+            t_start_ms=payload.t_start_ms,
+            t_end_ms=payload.t_end_ms,
+            sample_rate_hz=payload.sample_rate_hz,
+            encoding=payload.encoding,
+            blob_uri=payload.blob_uri,
+            lineage_id=lineage.id,
+            golden_profile=payload.golden_profile,
+            features_json=features_json,
+            metrics_json=metrics_json,
+            confidence=chunk_confidence,
+        )
+        .on_conflict_do_nothing(index_elements=["session_id", "chunk_id"])
+        .returning(AudioChunk)
+    ).first()
+    if row is None:
         existing_after_conflict = db.scalars(
-            select(AudioChunk).where(
-                AudioChunk.session_id == session_id,
-                AudioChunk.chunk_id == payload.chunk_id,
-            )
+            _CHUNK_BY_CHUNK_ID,
+            {"session_id": session_id, "chunk_id": payload.chunk_id},
         ).first()
         if existing_after_conflict is None:
-            raise
+            raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Conflicting audio chunk write")
         projection = db.scalars(
             select(StageScoreProjection).where(
                 StageScoreProjection.session_id == session_id,
@@ -818,50 +985,71 @@ def ingest_audio_chunk(
                 golden_profile=existing_after_conflict.golden_profile,
             )
             db.commit()
-            db.refresh(projection)
 
-        out = AudioChunkIngestOut.model_validate(existing_after_conflict)
-        out.idempotency_hit = True
-        out.projection = StageScoreProjectionOut.model_validate(projection)
-        return out
+        return AudioChunkIngestOut.from_orm_trusted(
+            existing_after_conflict,
+            idempotency_hit=True,
+            projection=StageScoreProjectionOut.from_orm_trusted(projection),
+        )
 
-    projection = recompute_stage_projection(
-        db,
-        session_id=session_id,
-        stage=payload.stage,
-        lineage_id=lineage.id,
-        golden_profile=payload.golden_profile,
-    )
+    event_payload: dict[str, Any] = {
+        "stage": payload.stage,
+        "chunk_id": payload.chunk_id,
+        "round_index": payload.round_index,
+        "metrics": metrics_json,
+    }
+    if defer_projection:
+        # Return the last materialized projection (possibly stale or absent) and rebuild it after the
+        # response; list_stage_projections recomputes first if it is read before the task runs.
+        projection = db.scalars(
+            select(StageScoreProjection).where(
+                StageScoreProjection.session_id == session_id,
+                StageScoreProjection.stage == payload.stage,
+                StageScoreProjection.lineage_id == lineage.id,
+                StageScoreProjection.golden_profile == payload.golden_profile,
+            )
+        ).first()
+        event_payload["projection_deferred"] = True
+    else:
+        # defer_gemini: answer with the deterministic score now and rescore with Gemini after the response.
+        projection = recompute_stage_projection(
+            db,
+            session_id=session_id,
+            stage=payload.stage,
+            lineage_id=lineage.id,
+            golden_profile=payload.golden_profile,
+            score_with_gemini=not defer_gemini,
+        )
+        event_payload["projection"] = {
+            "discipline": projection.discipline,
+            "resonance": projection.resonance,
+            "coherence": projection.coherence,
+            "composite": projection.composite,
+            "confidence": projection.confidence,
+        }
     db.add(
         SessionEvent(
             session_id=session_id,
             event_type="audio_chunk_ingested",
             client_event_id=f"audio_chunk:{payload.chunk_id}",
             schema_version="v1",
-            payload={
-                "stage": payload.stage,
-                "chunk_id": payload.chunk_id,
-                "round_index": payload.round_index,
-                "metrics": metrics_json,
-                "projection": {
-                    "discipline": projection.discipline,
-                    "resonance": projection.resonance,
-                    "coherence": projection.coherence,
-                    "composite": projection.composite,
-                    "confidence": projection.confidence,
-                },
-            },
+            payload=event_payload,
         )
     )
-    refresh_daily_projections(db, date_key=_date_key(row.ingested_at))
     db.commit()
 
-    db.refresh(row)
-    db.refresh(projection)
-    out = AudioChunkIngestOut.model_validate(row)
-    out.idempotency_hit = False
-    out.projection = StageScoreProjectionOut.model_validate(projection)
-    return out
+    projection_key = (session_id, payload.stage, lineage.id, payload.golden_profile)
+    if defer_projection:
+        mark_projection_pending(projection_key)
+        background_tasks.add_task(recompute_pending_projection, projection_key)
+    elif defer_gemini and mark_gemini_pending(projection_key):
+        background_tasks.add_task(enhance_stage_projection_with_gemini, projection_key)
+
+    return AudioChunkIngestOut.from_orm_trusted(
+        row,
+        idempotency_hit=False,
+        projection=StageScoreProjectionOut.from_orm_trusted(projection) if projection is not None else None,
+    )
 
 
 @app.get(
@@ -871,29 +1059,67 @@ def ingest_audio_chunk(
 def list_stage_projections(
     session_id: str,
     db: Annotated[DBSession, Depends(get_db)],
-) -> list[StageScoreProjection]:
+) -> Response:
     _must_get_session(db, session_id)
+    flush_pending_projections(db, session_id=session_id)
     rows = db.scalars(
         select(StageScoreProjection)
         .where(StageScoreProjection.session_id == session_id)
-        .order_by(StageScoreProjection.updated_at.desc(), StageScoreProjection.id.desc())
+        .order_by(_STAGE_ORDER, StageScoreProjection.id.asc())
     ).all()
-
-    stage_rank = {
-        "guided": 0,
-        "call_response": 1,
-        "independent": 2,
-    }
-    rows.sort(key=lambda row: (stage_rank.get(row.stage, 99), row.id))
-    return rows
+    # Validate and encode the whole list in one pass instead of FastAPI's per-row response_model walk.
+    projections = _STAGE_PROJECTION_LIST_ADAPTER.validate_python(rows, from_attributes=True)
+    return Response(content=_STAGE_PROJECTION_LIST_ADAPTER.dump_json(projections), media_type="application/json")
 
 
-@app.post("/v1/integrations/events", response_model=SessionEventOut, status_code=status.HTTP_201_CREATED)
+@app.post(
+    "/v1/integrations/events",
+    response_model=SessionEventOut,
+    status_code=status.HTTP_201_CREATED,
+    responses={status.HTTP_202_ACCEPTED: {"description": "Buffered for batched insert (X-Async-Insert: true)"}},
+)
 def ingest_partner_event(
     payload: PartnerEventIn,
     db: Annotated[DBSession, Depends(get_db)],
-) -> SessionEventOut:
-    session = _must_get_session(db, payload.session_id)
+    x_async_insert: Annotated[str | None, Header()] = None,
+) -> SessionEventOut | JSONResponse:
+    if _use_async_insert(x_async_insert):
+        session = _must_get_session(db, payload.session_id)
+        _validate_event_write(
+            session,
+            event_type=payload.event_type,
+            payload=payload.payload,
+            schema_version=payload.schema_version,
+        )
+        buffered = partner_event_buffer.submit(
+            {
+                "session_id": session.id,
+                "event_type": payload.event_type,
+                "event_time": _utcnow(),
+                "client_event_id": payload.client_event_id,
+                "ingestion_source": f"partner:{payload.partner_source}",
+                "source_adapter": payload.adapter_id,
+                "schema_version": payload.schema_version,
+                "payload": payload.payload,
+            }
+        )
+        if buffered:
+            return JSONResponse(
+                status_code=status.HTTP_202_ACCEPTED,
+                content={
+                    "accepted": True,
+                    "session_id": session.id,
+                    "client_event_id": payload.client_event_id,
+                },
+            )
+        # Buffer full (e.g. flushes failing): write synchronously so the 2xx stays durable.
+
+    session, existing = _must_get_session_with(
+        db,
+        payload.session_id,
+        SessionEvent.client_event_id,
+        payload.client_event_id,
+    )
     out = _ingest_event_row(
         db,
         session=session,
@@ -903,109 +1129,151 @@ def ingest_partner_event(
         ingestion_source=f"partner:{payload.partner_source}",
         source_adapter=payload.adapter_id,
         schema_version=payload.schema_version,
+        existing=existing,
     )
 
-    increment_ecosystem_usage(
-        db,
-        date_key=_date_key(out.event_time),
-        inbound_partner_events=1,
-        wearable_adapter_events=1 if payload.adapter_id.startswith("wearable_") else 0,
-        content_export_events=1 if payload.adapter_id.startswith("content_") else 0,
-    )
-    refresh_daily_projections(db, date_key=_date_key(out.event_time))
+    if not out.idempotency_hit:
+        # Counted in the event's own transaction, so a rebuild from the log can never count it twice.
+        record_partner_events(db, date_key=to_date_key(out.event_time), adapter_ids=[payload.adapter_id])
     db.commit()
     return out
 
 
+@app.post(
+    "/v1/integrations/events:batch",
+    response_model=PartnerEventBatchOut,
+    status_code=status.HTTP_201_CREATED,
+)
+def ingest_partner_events_batch(
+    payload: PartnerEventBatchIn,
+    db: Annotated[DBSession, Depends(get_db)],
+) -> PartnerEventBatchOut:
+    session_ids = {item.session_id for item in payload.events}
+    sessions = {
+        session.id: session
+        for session in db.scalars(select(SessionModel).where(SessionModel.id.in_(session_ids)))
+    }
+    if len(sessions) != len(session_ids):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Session not found")
+
+    event_time = _utcnow()
+    rows: list[dict[str, Any]] = []
+    for item in payload.events:
+        _validate_event_write(
+            sessions[item.session_id],
+            event_type=item.event_type,
+            payload=item.payload,
+            schema_version=item.schema_version,
+        )
+        rows.append(
+            {
+                "session_id": item.session_id,
+                "event_type": item.event_type,
+                "event_time": event_time,
+                "client_event_id": item.client_event_id,
+                "ingestion_source": f"partner:{item.partner_source}",
+                "source_adapter": item.adapter_id,
+                "schema_version": item.schema_version,
+                "payload": item.payload,
+            }
+        )
+    # One multi-row INSERT plus one ecosystem upsert per day, all in this transaction.
+    inserted = write_partner_events(db, rows)
+    db.commit()
+    return PartnerEventBatchOut(
+        received=len(rows),
+        inserted=inserted,
+        idempotency_hits=len(rows) - inserted,
+    )
+
+
 @app.post("/v1/integrations/webhooks", response_model=WebhookSubscriptionOut, status_code=status.HTTP_201_CREATED)
 def create_webhook_subscription(
     payload: WebhookSubscriptionCreate,
     db: Annotated[DBSession, Depends(get_db)],
 ) -> WebhookSubscription:
-    subscription = WebhookSubscription(
-        target_url=payload.target_url.strip(),
-        adapter_id=payload.adapter_id.strip(),
-        event_types=payload.event_types,
-        is_active=payload.is_active,
-    )
-    db.add(subscription)
+    subscription = db.execute(
+        insert(WebhookSubscription)
+        .values(
+            target_url=payload.target_url.strip(),
+            adapter_id=payload.adapter_id.strip(),
+            event_types=payload.event_types,
+            is_active=payload.is_active,
+        )
+        .returning(WebhookSubscription)
+    ).scalar_one()
     db.commit()
-    db.refresh(subscription)
     return subscription
 
 
 @app.get("/v1/integrations/webhooks", response_model=list[WebhookSubscriptionOut])
-def list_webhook_subscriptions(db: Annotated[DBSession, Depends(get_db)]) -> list[WebhookSubscription]:
-    return db.scalars(
+def list_webhook_subscriptions(db: Annotated[DBSession, Depends(get_db)]) -> Response:
+    rows = db.scalars(
         select(WebhookSubscription).order_by(WebhookSubscription.id.asc())
     ).all()
+    subscriptions = _WEBHOOK_SUBSCRIPTION_LIST_ADAPTER.validate_python(rows, from_attributes=True)
+    return Response(
+        content=_WEBHOOK_SUBSCRIPTION_LIST_ADAPTER.dump_json(subscriptions),
+        media_type="application/json",
+    )
+
+
+def _stored_daily_row(
+    db: DBSession,
+    model: type[BusinessSignalDaily] | type[EcosystemUsageDaily],
+    date_key: str | None,
+) -> BusinessSignalDaily | EcosystemUsageDaily | None:
+    """Read one day's incrementally maintained projection, defaulting to the latest stored day."""
+    # Writers keep these rows current with counter upserts and /v1/admin/projections/recompute
+    # (or scripts/recompute_projections.py on a schedule) rebuilds them from the log, so exports
+    # are primary-key reads rather than a per-request rebuild.
+    if date_key:
+        return db.get(model, date_key)
+    return db.scalars(select(model).order_by(model.date_key.desc()).limit(1)).first()
 
 
 @app.get("/v1/integrations/exports/business-signals/daily", response_model=BusinessSignalDailyOut)
 def export_business_signals_daily(
     db: Annotated[DBSession, Depends(get_db)],
     date_key: str | None = None,
-) -> BusinessSignalDaily:
-    if date_key:
-        refresh_daily_projections(db, date_key=date_key)
-        row = db.get(BusinessSignalDaily, date_key)
-    else:
-        row = db.scalars(
-            select(BusinessSignalDaily).order_by(BusinessSignalDaily.date_key.desc())
-        ).first()
-        if row is not None:
-            refresh_daily_projections(db, date_key=row.date_key)
-            row = db.get(BusinessSignalDaily, row.date_key)
-
+) -> Response:
+    row = _stored_daily_row(db, BusinessSignalDaily, date_key)
     if row is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="No business signals available")
 
-    export_log = IntegrationExportLog(
-        export_type="business_signals_daily",
-        adapter_id="content_partner_export",
-        payload={"date_key": row.date_key},
+    db.execute(
+        insert(IntegrationExportLog).values(
+            export_type="business_signals_daily",
+            adapter_id="content_partner_export",
+            payload={"date_key": row.date_key},
+        )
     )
-    db.add(export_log)
     increment_ecosystem_usage(
         db,
         date_key=row.date_key,
         exports_generated=1,
         content_export_events=1,
     )
-    refresh_daily_projections(db, date_key=row.date_key)
     db.commit()
-    db.refresh(row)
-    return row
+    return _model_response(BusinessSignalDailyOut.from_orm_trusted(row))
 
 
 @app.get("/v1/integrations/exports/ecosystem-usage/daily", response_model=EcosystemUsageOut)
 def export_ecosystem_usage_daily(
     db: Annotated[DBSession, Depends(get_db)],
     date_key: str | None = None,
-) -> EcosystemUsageDaily:
-    if date_key:
-        refresh_daily_projections(db, date_key=date_key)
-        row = db.get(EcosystemUsageDaily, date_key)
-    else:
-        row = db.scalars(
-            select(EcosystemUsageDaily).order_by(EcosystemUsageDaily.date_key.desc())
-        ).first()
-        if row is not None:
-            refresh_daily_projections(db, date_key=row.date_key)
-            row = db.get(EcosystemUsageDaily, row.date_key)
-
+) -> Response:
+    row = _stored_daily_row(db, EcosystemUsageDaily, date_key)
     if row is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="No ecosystem usage data available")
-    db.commit()
-    db.refresh(row)
-    return row
+    return _model_response(EcosystemUsageOut.from_orm_trusted(row))
 
 
 @app.post("/v1/analytics/experiments/adaptive-vs-static", response_model=ExperimentCompareOut)
-def experiment_adaptive_vs_static(payload: ExperimentCompareRequest) -> ExperimentCompareOut:
+async def experiment_adaptive_vs_static(payload: ExperimentCompareRequest) -> ExperimentCompareOut:
     result = compare_adaptive_vs_static(
-        adaptive_values=[float(v) for v in payload.adaptive_values],
-        static_values=[float(v) for v in payload.static_values],
+        adaptive_values=payload.adaptive_values,
+        static_values=payload.static_values,
     )
     return ExperimentCompareOut(**result)
 
@@ -1017,17 +1285,16 @@ def get_business_cohorts(db: Annotated[DBSession, Depends(get_db)]) -> dict:
 
 @app.get("/v1/analytics/business-signal/north-star")
 def get_north_star_metric(db: Annotated[DBSession, Depends(get_db)]) -> dict:
+    return analytics_cache.get_or_compute("north_star", lambda: _north_star_metric(db))
+
+
+def _north_star_metric(db: DBSession) -> dict:
     row = db.scalars(
         select(BusinessSignalDaily).order_by(BusinessSignalDaily.date_key.desc())
     ).first()
     if row is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="No business signals available")
 
-    contract_path = Path(__file__).resolve().parents[3] / "docs" / "contracts" / "north_star_metric.v1.json"
-    contract: dict = {}
-    if contract_path.exists():
-        contract = json.loads(contract_path.read_text(encoding="utf-8"))
-
     started = max(1, int(row.sessions_started))
     components = {
         "meaningful_session_rate": round(float(row.meaningful_sessions) / float(started), 4),
@@ -1036,38 +1303,36 @@ def get_north_star_metric(db: Annotated[DBSession, Depends(get_db)]) -> dict:
     }
     return {
         "date_key": row.date_key,
-        "metric_id": contract.get("metric_id", "NSM-001"),
-        "version": contract.get("version", "1.0.0"),
+        "metric_id": _NORTH_STAR_CONTRACT.get("metric_id", "NSM-001"),
+        "version": _NORTH_STAR_CONTRACT.get("version", "1.0.0"),
         "value": _north_star_value(row),
         "components": components,
-        "formula": contract.get("formula"),
+        "formula": _NORTH_STAR_CONTRACT.get("formula"),
     }
 
 
 @app.get("/v1/analytics/business-signal/attribution")
 def get_business_signal_attribution(db: Annotated[DBSession, Depends(get_db)]) -> dict:
-    rows = db.scalars(
-        select(BusinessSignalDaily).order_by(BusinessSignalDaily.date_key.desc()).limit(7)
-    ).all()
+    return analytics_cache.get_or_compute("attribution", lambda: _business_signal_attribution(db))
+
+
+def _business_signal_attribution(db: DBSession) -> dict:
+    rows = db.execute(_ATTRIBUTION_TIMELINE).mappings().all()
     if not rows:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="No business signals available")
 
-    ordered = list(reversed(rows))
-    timeline = []
-    for row in ordered:
-        started = max(1, int(row.sessions_started))
-        meaningful_rate = round(float(row.meaningful_sessions) / float(started), 4)
-        timeline.append(
-            {
-                "date_key": row.date_key,
-                "sessions_started": row.sessions_started,
-                "sessions_completed": row.sessions_completed,
-                "meaningful_sessions": row.meaningful_sessions,
-                "meaningful_session_rate": meaningful_rate,
-                "day7_returning_users": row.day7_returning_users,
-                "north_star_value": _north_star_value(row),
-            }
-        )
+    timeline = [
+        {
+            "date_key": row["date_key"],
+            "sessions_started": row["sessions_started"],
+            "sessions_completed": row["sessions_completed"],
+            "meaningful_sessions": row["meaningful_sessions"],
+            "meaningful_session_rate": round(row["meaningful_rate"], 4),
+            "day7_returning_users": row["day7_returning_users"],
+            "north_star_value": round(max(0.0, min(1.0, row["north_star_raw"])), 4),
+        }
+        for row in rows
+    ]
 
     first = timeline[0]
     last = timeline[-1]
@@ -1076,14 +1341,11 @@ def get_business_signal_attribution(db: Annotated[DBSession, Depends(get_db)]) -
         "timeline": timeline,
         "trend": {
             "meaningful_session_rate_delta": round(
-                float(last["meaningful_session_rate"]) - float(first["meaningful_session_rate"]),
-                4,
-            ),
-            "day7_returning_users_delta": int(last["day7_returning_users"]) - int(first["day7_returning_users"]),
-            "north_star_delta": round(
-                float(last["north_star_value"]) - float(first["north_star_value"]),
+                last["meaningful_session_rate"] - first["meaningful_session_rate"],
                 4,
             ),
+            "day7_returning_users_delta": last["day7_returning_users"] - first["day7_returning_users"],
+            "north_star_delta": round(last["north_star_value"] - first["north_star_value"], 4),
         },
     }
 
@@ -1091,15 +1353,22 @@ def get_business_signal_attribution(db: Annotated[DBSession, Depends(get_db)]) -
 @app.post("/v1/admin/webhooks/process")
 def process_webhooks(
     db: Annotated[DBSession, Depends(get_db)],
+    background_tasks: BackgroundTasks,
     batch_size: int = 100,
     ignore_schedule: bool = False,
 ) -> dict:
+    touched_dates: set[str] = set()
     result = process_webhook_deliveries(
         db,
         batch_size=max(1, min(batch_size, 1000)),
         ignore_schedule=ignore_schedule,
+        touched_dates=touched_dates,
     )
     db.commit()
+    # The response carries only delivery counts; webhook counters reach usage exports only once this
+    # background refresh has rebuilt their days.
+    if touched_dates:
+        background_tasks.add_task(refresh_ecosystem_usage_days, sorted(touched_dates))
     return result
 
 
@@ -1111,14 +1380,14 @@ def recompute_projections(db: Annotated[DBSession, Depends(get_db)]) -> dict:
 
 
 @app.get("/v1/users/{user_id}/progress", response_model=ProgressOut)
-def get_user_progress(user_id: str, db: Annotated[DBSession, Depends(get_db)]) -> ProgressOut:
-    _must_get_user(db, user_id)
-    from .models import PracticeProgress
-
-    progress = db.get(PracticeProgress, user_id)
+def get_user_progress(user_id: str, db: Annotated[DBSession, Depends(get_db)]) -> Response:
+    # One round-trip answers both "does the user exist" and "is there a progress row".
+    row = db.execute(_USER_WITH_PROGRESS, {"user_id": user_id}).first()
+    if row is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
+    progress = row.PracticeProgress
     if progress is None:
         progress = PracticeProgress(user_id=user_id)
         db.add(progress)
         db.commit()
-        db.refresh(progress)
-    return progress
+    return _model_response(ProgressOut.from_orm_trusted(progress))
@@ -6,17 +6,22 @@ import uuid
 from sqlalchemy import (
     JSON,
     Boolean,
-    DateTime,
     Float,
     ForeignKey,
+    Index,
     Integer,
     String,
     Text,
     UniqueConstraint,
 )
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column
 
-from .db import Base
+from .db import Base, UTCDateTime, UUIDString
+
+
+# Binary JSON on PostgreSQL for documents whose keys are extracted in SQL; plain JSON text elsewhere.
+QueryableJSON = JSON().with_variant(JSONB(), "postgresql")
 
 
 def _utcnow() -> dt.datetime:
@@ -26,49 +31,51 @@ def _utcnow() -> dt.datetime:
 class User(Base):
     __tablename__ = "users"
 
-    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    id: Mapped[str] = mapped_column(UUIDString, primary_key=True, default=lambda: str(uuid.uuid4()))
     display_name: Mapped[str] = mapped_column(String(120), nullable=False)
-    created_at: Mapped[dt.datetime] = mapped_column(DateTime(timezone=True), default=_utcnow, nullable=False)
+    created_at: Mapped[dt.datetime] = mapped_column(UTCDateTime, default=_utcnow, nullable=False)
 
 
 class ConsentRecord(Base):
     __tablename__ = "consent_records"
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
-    user_id: Mapped[str] = mapped_column(String(36), ForeignKey("users.id"), nullable=False, index=True)
+    user_id: Mapped[str] = mapped_column(UUIDString, ForeignKey("users.id"), nullable=False, index=True)
     biometric_enabled: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
     environmental_enabled: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
     raw_audio_storage_enabled: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
     policy_version: Mapped[str] = mapped_column(String(20), default="v1", nullable=False)
     source: Mapped[str] = mapped_column(String(40), default="api", nullable=False)
-    created_at: Mapped[dt.datetime] = mapped_column(DateTime(timezone=True), default=_utcnow, nullable=False)
+    created_at: Mapped[dt.datetime] = mapped_column(UTCDateTime, default=_utcnow, nullable=False)
 
 
 class SessionModel(Base):
     __tablename__ = "sessions"
 
-    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
-    user_id: Mapped[str] = mapped_column(String(36), ForeignKey("users.id"), nullable=False, index=True)
+    id: Mapped[str] = mapped_column(UUIDString, primary_key=True, default=lambda: str(uuid.uuid4()))
+    user_id: Mapped[str] = mapped_column(UUIDString, ForeignKey("users.id"), nullable=False, index=True)
     mantra_key: Mapped[str | None] = mapped_column(String(80), nullable=True)
     intention: Mapped[str] = mapped_column(Text, nullable=False)
     mood: Mapped[str | None] = mapped_column(String(40), nullable=True)
     target_duration_minutes: Mapped[int] = mapped_column(Integer, default=10, nullable=False)
     status: Mapped[str] = mapped_column(String(20), default="ACTIVE", nullable=False, index=True)
-    started_at: Mapped[dt.datetime] = mapped_column(DateTime(timezone=True), default=_utcnow, nullable=False)
-    ended_at: Mapped[dt.datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
-    summary_json: Mapped[dict | None] = mapped_column(JSON, nullable=True)
+    started_at: Mapped[dt.datetime] = mapped_column(UTCDateTime, default=_utcnow, nullable=False)
+    ended_at: Mapped[dt.datetime | None] = mapped_column(UTCDateTime, nullable=True)
+    summary_json: Mapped[dict | None] = mapped_column(QueryableJSON, nullable=True)
 
 
 class SessionEvent(Base):
     __tablename__ = "session_events"
     __table_args__ = (
         UniqueConstraint("session_id", "client_event_id", name="uq_session_client_event"),
+        # Latest-event-per-session lookups scan this backwards instead of sorting.
+        Index("ix_session_events_session_id_id", "session_id", "id"),
     )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
-    session_id: Mapped[str] = mapped_column(String(36), ForeignKey("sessions.id"), nullable=False, index=True)
+    session_id: Mapped[str] = mapped_column(UUIDString, ForeignKey("sessions.id"), nullable=False, index=True)
     event_type: Mapped[str] = mapped_column(String(60), nullable=False, index=True)
-    event_time: Mapped[dt.datetime] = mapped_column(DateTime(timezone=True), default=_utcnow, nullable=False, index=True)
+    event_time: Mapped[dt.datetime] = mapped_column(UTCDateTime, default=_utcnow, nullable=False, index=True)
     client_event_id: Mapped[str | None] = mapped_column(String(120), nullable=True)
     ingestion_source: Mapped[str] = mapped_column(String(40), default="api", nullable=False)
     source_adapter: Mapped[str | None] = mapped_column(String(80), nullable=True, index=True)
@@ -80,8 +87,8 @@ class AdaptationDecision(Base):
     __tablename__ = "adaptation_decisions"
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
-    session_id: Mapped[str] = mapped_column(String(36), ForeignKey("sessions.id"), nullable=False, index=True)
-    decision_time: Mapped[dt.datetime] = mapped_column(DateTime(timezone=True), default=_utcnow, nullable=False)
+    session_id: Mapped[str] = mapped_column(UUIDString, ForeignKey("sessions.id"), nullable=False, index=True)
+    decision_time: Mapped[dt.datetime] = mapped_column(UTCDateTime, default=_utcnow, nullable=False)
     reason: Mapped[str] = mapped_column(Text, nullable=False)
     tempo_bpm: Mapped[int] = mapped_column(Integer, nullable=False)
     guidance_intensity: Mapped[str] = mapped_column(String(20), nullable=False)
@@ -92,20 +99,20 @@ class AdaptationDecision(Base):
 class PracticeProgress(Base):
     __tablename__ = "practice_progress"
 
-    user_id: Mapped[str] = mapped_column(String(36), ForeignKey("users.id"), primary_key=True)
+    user_id: Mapped[str] = mapped_column(UUIDString, ForeignKey("users.id"), primary_key=True)
     total_sessions: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
     completed_sessions: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
     total_practice_minutes: Mapped[float] = mapped_column(Float, default=0.0, nullable=False)
     avg_flow_score: Mapped[float] = mapped_column(Float, default=0.0, nullable=False)
     avg_pronunciation_score: Mapped[float] = mapped_column(Float, default=0.0, nullable=False)
-    updated_at: Mapped[dt.datetime] = mapped_column(DateTime(timezone=True), default=_utcnow, nullable=False)
+    updated_at: Mapped[dt.datetime] = mapped_column(UTCDateTime, default=_utcnow, nullable=False)
 
 
 class BhavEvaluation(Base):
     __tablename__ = "bhav_evaluations"
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
-    session_id: Mapped[str] = mapped_column(String(36), ForeignKey("sessions.id"), nullable=False, index=True)
+    session_id: Mapped[str] = mapped_column(UUIDString, ForeignKey("sessions.id"), nullable=False, index=True)
     mantra_key: Mapped[str | None] = mapped_column(String(120), nullable=True)
     lineage_id: Mapped[str] = mapped_column(String(60), nullable=False, default="vaishnavism")
     profile_name: Mapped[str] = mapped_column(String(40), nullable=False, default="maha_mantra_v1")
@@ -115,17 +122,19 @@ class BhavEvaluation(Base):
     composite: Mapped[float] = mapped_column(Float, nullable=False)
     passes_golden: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
     detail_json: Mapped[dict] = mapped_column(JSON, default=dict, nullable=False)
-    created_at: Mapped[dt.datetime] = mapped_column(DateTime(timezone=True), default=_utcnow, nullable=False)
+    created_at: Mapped[dt.datetime] = mapped_column(UTCDateTime, default=_utcnow, nullable=False)
 
 
 class AudioChunk(Base):
     __tablename__ = "audio_chunks"
     __table_args__ = (
         UniqueConstraint("session_id", "chunk_id", name="uq_audio_chunk_session_chunk"),
+        # Stage projections replay a session's chunks for one stage in seq order.
+        Index("ix_audio_chunks_session_stage_seq", "session_id", "stage", "seq"),
     )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
-    session_id: Mapped[str] = mapped_column(String(36), ForeignKey("sessions.id"), nullable=False, index=True)
+    session_id: Mapped[str] = mapped_column(UUIDString, ForeignKey("sessions.id"), nullable=False)
     stage: Mapped[str] = mapped_column(String(40), nullable=False, index=True)
     round_index: Mapped[int | None] = mapped_column(Integer, nullable=True)
     chunk_id: Mapped[str] = mapped_column(String(120), nullable=False)
@@ -140,7 +149,7 @@ class AudioChunk(Base):
     features_json: Mapped[dict] = mapped_column(JSON, default=dict, nullable=False)
     metrics_json: Mapped[dict] = mapped_column(JSON, default=dict, nullable=False)
     confidence: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
-    ingested_at: Mapped[dt.datetime] = mapped_column(DateTime(timezone=True), default=_utcnow, nullable=False)
+    ingested_at: Mapped[dt.datetime] = mapped_column(UTCDateTime, default=_utcnow, nullable=False)
 
 
 class StageScoreProjection(Base):
@@ -156,7 +165,7 @@ class StageScoreProjection(Base):
     )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
-    session_id: Mapped[str] = mapped_column(String(36), ForeignKey("sessions.id"), nullable=False, index=True)
+    session_id: Mapped[str] = mapped_column(UUIDString, ForeignKey("sessions.id"), nullable=False, index=True)
     stage: Mapped[str] = mapped_column(String(40), nullable=False, index=True)
     lineage_id: Mapped[str] = mapped_column(String(60), nullable=False, default="vaishnavism", index=True)
     golden_profile: Mapped[str] = mapped_column(String(40), nullable=False, default="maha_mantra_v1")
@@ -174,7 +183,7 @@ class StageScoreProjection(Base):
     source_chunk_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
     metrics_json: Mapped[dict] = mapped_column(JSON, default=dict, nullable=False)
     feedback_json: Mapped[list[str]] = mapped_column(JSON, default=list, nullable=False)
-    updated_at: Mapped[dt.datetime] = mapped_column(DateTime(timezone=True), default=_utcnow, nullable=False)
+    updated_at: Mapped[dt.datetime] = mapped_column(UTCDateTime, default=_utcnow, nullable=False)
 
 
 class WebhookSubscription(Base):
@@ -185,11 +194,15 @@ class WebhookSubscription(Base):
     adapter_id: Mapped[str] = mapped_column(String(80), nullable=False, index=True)
     event_types: Mapped[list[str]] = mapped_column(JSON, default=list, nullable=False)
     is_active: Mapped[bool] = mapped_column(Boolean, nullable=False, default=True)
-    created_at: Mapped[dt.datetime] = mapped_column(DateTime(timezone=True), default=_utcnow, nullable=False)
+    created_at: Mapped[dt.datetime] = mapped_column(UTCDateTime, default=_utcnow, nullable=False)
 
 
 class WebhookDelivery(Base):
     __tablename__ = "webhook_deliveries"
+    __table_args__ = (
+        # The delivery worker selects queued/retrying rows that are due.
+        Index("ix_webhook_deliveries_status_next_attempt", "status", "next_attempt_at"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     subscription_id: Mapped[int | None] = mapped_column(
@@ -200,15 +213,15 @@ class WebhookDelivery(Base):
     )
     event_type: Mapped[str] = mapped_column(String(120), nullable=False, index=True)
     payload: Mapped[dict] = mapped_column(JSON, default=dict, nullable=False)
-    status: Mapped[str] = mapped_column(String(20), nullable=False, default="queued", index=True)
+    status: Mapped[str] = mapped_column(String(20), nullable=False, default="queued")
     attempt_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
     max_attempts: Mapped[int] = mapped_column(Integer, nullable=False, default=3)
-    next_attempt_at: Mapped[dt.datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
-    delivered_at: Mapped[dt.datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
-    dead_lettered_at: Mapped[dt.datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    next_attempt_at: Mapped[dt.datetime | None] = mapped_column(UTCDateTime, nullable=True)
+    delivered_at: Mapped[dt.datetime | None] = mapped_column(UTCDateTime, nullable=True)
+    dead_lettered_at: Mapped[dt.datetime | None] = mapped_column(UTCDateTime, nullable=True)
     last_error: Mapped[str | None] = mapped_column(String(500), nullable=True)
     dead_letter_reason: Mapped[str | None] = mapped_column(String(500), nullable=True)
-    created_at: Mapped[dt.datetime] = mapped_column(DateTime(timezone=True), default=_utcnow, nullable=False)
+    created_at: Mapped[dt.datetime] = mapped_column(UTCDateTime, default=_utcnow, nullable=False)
 
 
 class IntegrationExportLog(Base):
@@ -218,7 +231,7 @@ class IntegrationExportLog(Base):
     export_type: Mapped[str] = mapped_column(String(120), nullable=False, index=True)
     adapter_id: Mapped[str] = mapped_column(String(80), nullable=False, index=True)
     payload: Mapped[dict] = mapped_column(JSON, default=dict, nullable=False)
-    created_at: Mapped[dt.datetime] = mapped_column(DateTime(timezone=True), default=_utcnow, nullable=False)
+    created_at: Mapped[dt.datetime] = mapped_column(UTCDateTime, default=_utcnow, nullable=False)
 
 
 class EcosystemUsageDaily(Base):
@@ -235,7 +248,7 @@ class EcosystemUsageDaily(Base):
     wearable_adapter_events: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
     content_export_events: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
     unique_partner_sources: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
-    updated_at: Mapped[dt.datetime] = mapped_column(DateTime(timezone=True), default=_utcnow, nullable=False)
+    updated_at: Mapped[dt.datetime] = mapped_column(UTCDateTime, default=_utcnow, nullable=False)
 
 
 class BusinessSignalDaily(Base):
@@ -250,7 +263,7 @@ class BusinessSignalDaily(Base):
     day7_returning_users: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
     unique_active_users: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
     bhav_pass_rate: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
-    updated_at: Mapped[dt.datetime] = mapped_column(DateTime(timezone=True), default=_utcnow, nullable=False)
+    updated_at: Mapped[dt.datetime] = mapped_column(UTCDateTime, default=_utcnow, nullable=False)
 
 
 class EvalDriftSnapshot(Base):
@@ -268,4 +281,4 @@ class EvalDriftSnapshot(Base):
     ci95_high: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
     status: Mapped[str] = mapped_column(String(20), nullable=False, default="PASS", index=True)
     detail_json: Mapped[dict] = mapped_column(JSON, nullable=False, default=dict)
-    captured_at: Mapped[dt.datetime] = mapped_column(DateTime(timezone=True), default=_utcnow, nullable=False)
+    captured_at: Mapped[dt.datetime] = mapped_column(UTCDateTime, default=_utcnow, nullable=False)
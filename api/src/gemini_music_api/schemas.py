@@ -2,13 +2,27 @@ from __future__ import annotations
 
 import datetime as dt
 from typing import Literal
-from typing import Any
+from typing import Any, Self
 
-from pydantic import BaseModel, Field, model_validator
+from pydantic import BaseModel, Field, ValidationInfo, field_validator
+
+_MISSING = object()
 
 
 class APIModel(BaseModel):
-    model_config = {"from_attributes": True}
+    # Frozen: instances are shared from process-local caches (consent_cache), so they must not mutate.
+    model_config = {"from_attributes": True, "frozen": True}
+
+    @classmethod
+    def from_orm_trusted(cls, obj: Any, **overrides: Any) -> Self:
+        """Build from a row this service wrote, skipping validation; fields the row lacks keep defaults."""
+        values = {}
+        for name in cls.model_fields:
+            value = getattr(obj, name, _MISSING)
+            if value is not _MISSING:
+                values[name] = value
+        values.update(overrides)
+        return cls.model_construct(**values)
 
 
 class UserCreate(BaseModel):
@@ -80,6 +94,16 @@ class SessionEventOut(APIModel):
     idempotency_hit: bool = False
 
 
+class SessionEventBatchIn(BaseModel):
+    events: list[SessionEventIn] = Field(min_length=1, max_length=500)
+
+
+class SessionEventBatchOut(BaseModel):
+    events: list[SessionEventOut]
+    inserted: int
+    idempotency_hits: int
+
+
 class AdaptationRequest(BaseModel):
     explicit_mood: str | None = None
     energy_level: float | None = Field(default=None, ge=0, le=1)
@@ -131,6 +155,9 @@ class BhavEvaluationOut(APIModel):
 
 
 class MahaMantraMetrics(BaseModel):
+    # Frozen (and so hashable): keys the deterministic stage-eval cache in audio_scoring.
+    model_config = {"frozen": True}
+
     duration_seconds: float = Field(ge=1, le=1800)
     voice_ratio_total: float = Field(ge=0, le=1)
     voice_ratio_student: float | None = Field(default=None, ge=0, le=1)
@@ -150,6 +177,8 @@ class MahaMantraEvalRequest(BaseModel):
 
 
 class MahaMantraEvalOut(BaseModel):
+    model_config = {"frozen": True}
+
     stage: str
     lineage_id: str
     golden_profile: str
@@ -222,11 +251,14 @@ class AudioChunkIn(BaseModel):
     round_index: int | None = Field(default=None, ge=1, le=256)
     features: AudioChunkFeaturesIn = Field(default_factory=AudioChunkFeaturesIn)
 
-    @model_validator(mode="after")
-    def validate_time_window(self) -> "AudioChunkIn":
-        if self.t_end_ms <= self.t_start_ms:
+    @field_validator("t_end_ms")
+    @classmethod
+    def validate_time_window(cls, t_end_ms: int, info: ValidationInfo) -> int:
+        # Runs while fields validate (t_start_ms is declared first), with no extra model-level pass.
+        t_start_ms = info.data.get("t_start_ms")
+        if t_start_ms is not None and t_end_ms <= t_start_ms:
             raise ValueError("t_end_ms must be greater than t_start_ms")
-        return self
+        return t_end_ms
 
 
 class StageScoreProjectionOut(APIModel):
@@ -284,6 +316,16 @@ class PartnerEventIn(BaseModel):
     payload: dict[str, Any] = Field(default_factory=dict)
 
 
+class PartnerEventBatchIn(BaseModel):
+    events: list[PartnerEventIn] = Field(min_length=1, max_length=500)
+
+
+class PartnerEventBatchOut(BaseModel):
+    received: int
+    inserted: int
+    idempotency_hits: int
+
+
 class WebhookSubscriptionCreate(BaseModel):
     target_url: str = Field(min_length=1, max_length=500)
     adapter_id: str = Field(min_length=1, max_length=80)
@@ -13,6 +13,37 @@ class AdaptationContext:
     noise_level_db: float | None = None
 
 
+# mood token -> (tempo delta, tempo bound, guidance, key center, reason); the bound caps in the
+# direction of the delta.
+_CALMING = (-8, 52, "high", "D", "calming adjustment for anxious mood")
+_UPLIFT = (8, 108, "low", "G", "uplift adjustment for joyful mood")
+_MOOD_RULES = {
+    "anxious": _CALMING,
+    "stressed": _CALMING,
+    "overwhelmed": _CALMING,
+    "joyful": _UPLIFT,
+    "energized": _UPLIFT,
+}
+
+# Arrangement/coach blocks depend only on (tempo < 80, guidance == "high"); built once and shared
+# across decisions, so callers must treat them as read-only.
+_ARRANGEMENT_BLOCKS = {
+    (slow, high): (
+        {
+            "drone_level": "medium",
+            "percussion": "tabla_soft" if slow else "tabla_groove",
+            "call_response": high,
+        },
+        [
+            "repeat_line" if high else "continue_flow",
+            "show_pronunciation_hint" if high else "hide_hint",
+        ],
+    )
+    for slow in (False, True)
+    for high in (False, True)
+}
+
+
 def generate_adaptation(ctx: AdaptationContext) -> dict:
     """
     Deterministic rule engine stub for hackathon.
@@ -28,26 +59,21 @@ def generate_adaptation(ctx: AdaptationContext) -> dict:
         reason_parts.append(f"cadence match {tempo} bpm")
 
     if ctx.mood:
-        mood = ctx.mood.lower()
-        if mood in {"anxious", "stressed", "overwhelmed"}:
-            tempo = max(52, tempo - 8)
-            guidance = "high"
-            key_center = "D"
-            reason_parts.append("calming adjustment for anxious mood")
-        elif mood in {"joyful", "energized"}:
-            tempo = min(108, tempo + 8)
-            guidance = "low"
-            key_center = "G"
-            reason_parts.append("uplift adjustment for joyful mood")
-        else:
+        rule = _MOOD_RULES.get(ctx.mood.lower())
+        if rule is None:
             reason_parts.append("neutral mood profile")
+        else:
+            delta, bound, guidance, key_center, mood_reason = rule
+            tempo = max(bound, tempo + delta) if delta < 0 else min(bound, tempo + delta)
+            reason_parts.append(mood_reason)
 
-    if ctx.heart_rate is not None:
-        if ctx.heart_rate > 110:
+    heart_rate = ctx.heart_rate
+    if heart_rate is not None:
+        if heart_rate > 110:
             tempo = max(56, tempo - 6)
             guidance = "high"
             reason_parts.append("heart rate elevated, easing tempo")
-        elif ctx.heart_rate < 60:
+        elif heart_rate < 60:
             tempo = min(96, tempo + 4)
             reason_parts.append("heart rate low, adding gentle momentum")
 
@@ -64,21 +90,13 @@ def generate_adaptation(ctx: AdaptationContext) -> dict:
         reason_parts.append("strong flow, reducing interruptions")
 
     reason = "; ".join(reason_parts) if reason_parts else "default devotional adaptation"
+    arrangement, coach_actions = _ARRANGEMENT_BLOCKS[(tempo < 80, guidance == "high")]
 
     return {
         "tempo_bpm": tempo,
         "guidance_intensity": guidance,
         "key_center": key_center,
         "reason": reason,
-        "adaptation_json": {
-            "arrangement": {
-                "drone_level": "medium",
-                "percussion": "tabla_soft" if tempo < 80 else "tabla_groove",
-                "call_response": guidance == "high",
-            },
-            "coach_actions": [
-                "repeat_line" if guidance == "high" else "continue_flow",
-                "show_pronunciation_hint" if guidance == "high" else "hide_hint",
-            ],
-        },
+        # Fresh outer dict: create_adaptation adds "contract"/"fallback" keys to it.
+        "adaptation_json": {"arrangement": arrangement, "coach_actions": coach_actions},
     }
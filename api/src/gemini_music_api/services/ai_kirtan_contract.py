@@ -2,15 +2,38 @@ from __future__ import annotations
 
 from typing import Any
 
-REQUIRED_TOP_LEVEL = {"tempo_bpm", "guidance_intensity", "key_center", "reason", "adaptation_json"}
-REQUIRED_ARRANGEMENT = {"drone_level", "percussion", "call_response"}
+# Kept in sorted order so missing-key errors come out canonical without sorting per call.
+_REQUIRED_TOP_LEVEL_ORDERED = ("adaptation_json", "guidance_intensity", "key_center", "reason", "tempo_bpm")
+_REQUIRED_ARRANGEMENT_ORDERED = ("call_response", "drone_level", "percussion")
+REQUIRED_TOP_LEVEL = frozenset(_REQUIRED_TOP_LEVEL_ORDERED)
+REQUIRED_ARRANGEMENT = frozenset(_REQUIRED_ARRANGEMENT_ORDERED)
+
+
+def _contract_ok(payload: dict[str, Any]) -> bool:
+    """Allocation-free check for the common valid payload; errors are only itemised on a miss."""
+    adaptation_json = payload.get("adaptation_json")
+    if not isinstance(adaptation_json, dict) or not payload.keys() >= REQUIRED_TOP_LEVEL:
+        return False
+    arrangement = adaptation_json.get("arrangement")
+    if not isinstance(arrangement, dict) or not arrangement.keys() >= REQUIRED_ARRANGEMENT:
+        return False
+    coach_actions = adaptation_json.get("coach_actions")
+    reason = payload.get("reason")
+    return (
+        isinstance(coach_actions, list)
+        and len(coach_actions) >= 1
+        and isinstance(reason, str)
+        and len(reason.strip()) >= 10
+    )
 
 
 def verify_payload_contract(payload: dict[str, Any]) -> tuple[bool, list[str]]:
+    if _contract_ok(payload):
+        return True, []
     errors: list[str] = []
-    missing_top = [key for key in REQUIRED_TOP_LEVEL if key not in payload]
+    missing_top = [key for key in _REQUIRED_TOP_LEVEL_ORDERED if key not in payload]
     if missing_top:
-        errors.append(f"missing_top_level:{','.join(sorted(missing_top))}")
+        errors.append(f"missing_top_level:{','.join(missing_top)}")
 
     adaptation_json = payload.get("adaptation_json")
     if not isinstance(adaptation_json, dict):
@@ -21,9 +44,9 @@ def verify_payload_contract(payload: dict[str, Any]) -> tuple[bool, list[str]]:
     if not isinstance(arrangement, dict):
         errors.append("arrangement_not_object")
     else:
-        missing_arrangement = [key for key in REQUIRED_ARRANGEMENT if key not in arrangement]
+        missing_arrangement = [key for key in _REQUIRED_ARRANGEMENT_ORDERED if key not in arrangement]
         if missing_arrangement:
-            errors.append(f"missing_arrangement:{','.join(sorted(missing_arrangement))}")
+            errors.append(f"missing_arrangement:{','.join(missing_arrangement)}")
 
     coach_actions = adaptation_json.get("coach_actions")
     if not isinstance(coach_actions, list) or len(coach_actions) < 1:
@@ -36,9 +59,13 @@ def verify_payload_contract(payload: dict[str, Any]) -> tuple[bool, list[str]]:
     return len(errors) == 0, errors
 
 
-def quality_rubric_score(payload: dict[str, Any]) -> float:
-    passed, errors = verify_payload_contract(payload)
-    if passed:
+def quality_rubric_score(payload: dict[str, Any], errors: list[str] | None = None) -> float:
+    """Score a payload; pass `errors` from an earlier verify_payload_contract call to skip re-verifying."""
+    if errors is None:
+        if _contract_ok(payload):
+            return 1.0
+        _, errors = verify_payload_contract(payload)
+    if not errors:
         return 1.0
     penalty = min(0.8, 0.2 * len(errors))
     return max(0.0, 1.0 - penalty)
@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import os
+import threading
+import time
+from collections.abc import Callable
+from typing import Any
+
+ANALYTICS_CACHE_TTL_SECONDS = float(os.getenv("ANALYTICS_CACHE_TTL_SECONDS", "60"))
+
+
+class AnalyticsCache:
+    """
+    Process-local read-through cache for responses derived from the daily projections.
+    Projection writes in this process call `clear` once their transaction commits, so local
+    reads never trail local commits; other workers converge within the TTL.
+    """
+
+    def __init__(self, ttl_seconds: float = ANALYTICS_CACHE_TTL_SECONDS) -> None:
+        self.ttl_seconds = ttl_seconds
+        self._entries: dict[str, tuple[float, int, Any]] = {}
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    def get_or_compute(self, key: str, compute: Callable[[], Any]) -> Any:
+        if self.ttl_seconds <= 0:
+            return compute()
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            generation = self._generation
+        if entry is not None and entry[0] > now and entry[1] == generation:
+            return entry[2]
+        value = compute()
+        with self._lock:
+            # A write that landed while computing bumps the generation; do not cache over it.
+            if self._generation == generation:
+                self._entries[key] = (now + self.ttl_seconds, generation, value)
+        return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+
+
+analytics_cache = AnalyticsCache()
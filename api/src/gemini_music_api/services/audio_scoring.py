@@ -1,37 +1,48 @@
 from __future__ import annotations
 
 import datetime as dt
-from statistics import mean
+import logging
+import threading
+from collections.abc import Iterable
+from functools import lru_cache
 from typing import Any
 
-from sqlalchemy import select
+from sqlalchemy import bindparam, case, func, select
 from sqlalchemy.orm import Session
 
+from ..db import SessionLocal, dialect_insert
 from ..models import AudioChunk, StageScoreProjection
 from ..schemas import AudioChunkFeaturesIn, MahaMantraEvalOut, MahaMantraMetrics
-from .bhav import DEFAULT_GOLDEN_PROFILE, resolve_lineage
+from .bhav import DEFAULT_GOLDEN_PROFILE, LineageProfile, clamp01, resolve_lineage
 from .gemini_scoring import try_gemini_stage_score
 from .maha_mantra_eval import STAGE_TARGETS, evaluate_maha_mantra_stage
 
+logger = logging.getLogger(__name__)
+
+# Coverage denominators per stage (floored at 1s).
+_STAGE_TARGET_DURATION = {
+    stage: max(1.0, float(target["duration_seconds"])) for stage, target in STAGE_TARGETS.items()
+}
+
+# (session_id, stage, lineage_id, golden_profile) keys whose projection lags the chunk log.
+ProjectionKey = tuple[str, str, str, str]
+_PENDING_PROJECTIONS: set[ProjectionKey] = set()
+# Keys with a deterministic projection awaiting a background Gemini rescore.
+_PENDING_GEMINI: set[ProjectionKey] = set()
+_PENDING_LOCK = threading.Lock()
+
 
 def _utcnow() -> dt.datetime:
     return dt.datetime.now(dt.timezone.utc)
 
 
-def clamp01(value: float | int | None) -> float:
+def _unit_round(value: float | None, default: float | None, ndigits: int = 3) -> float | None:
+    """Default, clamp to [0,1] and round one feature in a single call."""
     if value is None:
-        return 0.0
-    return max(0.0, min(1.0, float(value)))
-
-
-def _weighted_mean(rows: list[tuple[float, float]], default: float) -> float:
-    if not rows:
-        return default
-    total_weight = sum(weight for _, weight in rows)
-    if total_weight <= 0:
-        return default
-    weighted = sum(value * weight for value, weight in rows)
-    return weighted / total_weight
+        if default is None:
+            return None
+        value = default
+    return round(0.0 if value < 0.0 else 1.0 if value > 1.0 else float(value), ndigits)
 
 
 def normalize_audio_chunk(
@@ -55,150 +66,189 @@ def normalize_audio_chunk(
     else:
         voice_ratio_total = 0.0
 
+    voice_total = _unit_round(voice_ratio_total, 0.0)
+    pitch_stability = _unit_round(features.pitch_stability, 0.5)
+    cadence_consistency = _unit_round(features.cadence_consistency, 0.5)
     metrics = {
         "duration_seconds": round(max(0.1, duration_seconds), 3),
-        "voice_ratio_total": round(clamp01(voice_ratio_total), 3),
-        "voice_ratio_student": (
-            None if features.voice_ratio_student is None else round(clamp01(features.voice_ratio_student), 3)
-        ),
-        "voice_ratio_guru": (
-            None if features.voice_ratio_guru is None else round(clamp01(features.voice_ratio_guru), 3)
-        ),
-        "pitch_stability": round(clamp01(features.pitch_stability if features.pitch_stability is not None else 0.5), 3),
+        "voice_ratio_total": voice_total,
+        "voice_ratio_student": _unit_round(features.voice_ratio_student, None),
+        "voice_ratio_guru": _unit_round(features.voice_ratio_guru, None),
+        "pitch_stability": pitch_stability,
         "cadence_bpm": round(
             float(features.cadence_bpm) if features.cadence_bpm is not None else 72.0,
             2,
         ),
-        "cadence_consistency": round(
-            clamp01(features.cadence_consistency if features.cadence_consistency is not None else 0.5),
-            3,
-        ),
-        "avg_energy": round(clamp01(features.avg_energy if features.avg_energy is not None else 0.5), 3),
+        "cadence_consistency": cadence_consistency,
+        "avg_energy": _unit_round(features.avg_energy, 0.5),
     }
 
     snr_db = float(features.snr_db) if features.snr_db is not None else None
     snr_norm = clamp01((snr_db - 5.0) / 25.0) if snr_db is not None else 0.5
-    signal_quality = mean(
-        [
-            metrics["voice_ratio_total"],
-            metrics["pitch_stability"],
-            metrics["cadence_consistency"],
-        ]
-    )
-    chunk_confidence = round(clamp01((0.6 * signal_quality) + (0.4 * snr_norm)), 3)
+    # 0.6 weight on the mean of the three signal ratios, folded to 0.2 per ratio.
+    chunk_confidence = round(clamp01((0.2 * (voice_total + pitch_stability + cadence_consistency)) + (0.4 * snr_norm)), 3)
 
     features_json: dict[str, Any] = {
-        "duration_seconds": metrics["duration_seconds"],
+        **metrics,
         "total_frames": total_frames,
         "voiced_frames": voiced_frames,
         "snr_db": snr_db,
-        "voice_ratio_total": metrics["voice_ratio_total"],
-        "voice_ratio_student": metrics["voice_ratio_student"],
-        "voice_ratio_guru": metrics["voice_ratio_guru"],
-        "pitch_stability": metrics["pitch_stability"],
-        "cadence_bpm": metrics["cadence_bpm"],
-        "cadence_consistency": metrics["cadence_consistency"],
-        "avg_energy": metrics["avg_energy"],
     }
     return features_json, metrics, chunk_confidence
 
 
-def _aggregate_stage_metrics(chunks: list[AudioChunk]) -> tuple[MahaMantraMetrics, dict[str, Any]]:
-    if not chunks:
-        raise ValueError("No audio chunks available for aggregation")
-
-    duration_weights: list[float] = []
-    duration_total = 0.0
-    cadence_rows: list[tuple[float, float]] = []
-    pitch_rows: list[tuple[float, float]] = []
-    consistency_rows: list[tuple[float, float]] = []
-    energy_rows: list[tuple[float, float]] = []
-    voice_total_rows: list[tuple[float, float]] = []
-    student_rows: list[tuple[float, float]] = []
-    guru_rows: list[tuple[float, float]] = []
-    snr_values: list[float] = []
-
-    for chunk in chunks:
-        m = chunk.metrics_json or {}
-        f = chunk.features_json or {}
-        duration = max(0.1, float(m.get("duration_seconds") or f.get("duration_seconds") or 0.1))
-        duration_weights.append(duration)
-        duration_total += duration
-
-        cadence_rows.append((float(m.get("cadence_bpm", 72.0)), duration))
-        pitch_rows.append((clamp01(m.get("pitch_stability")), duration))
-        consistency_rows.append((clamp01(m.get("cadence_consistency")), duration))
-        energy_rows.append((clamp01(m.get("avg_energy")), duration))
-        voice_total_rows.append((clamp01(m.get("voice_ratio_total")), duration))
-
-        if m.get("voice_ratio_student") is not None:
-            student_rows.append((clamp01(m.get("voice_ratio_student")), duration))
-        if m.get("voice_ratio_guru") is not None:
-            guru_rows.append((clamp01(m.get("voice_ratio_guru")), duration))
-
-        snr_db = f.get("snr_db")
-        if isinstance(snr_db, (int, float)):
-            snr_values.append(float(snr_db))
+def _chunk_metric(key: str) -> Any:
+    return AudioChunk.metrics_json[key].as_float()
+
+
+def _clamp01_sql(expr: Any) -> Any:
+    value = func.coalesce(expr, 0.0)
+    return case((value < 0.0, 0.0), (value > 1.0, 1.0), else_=value)
+
+
+# Duration weight: metrics duration, else features duration, else 0.1s; never below 0.1s.
+_CHUNK_DURATION_RAW = func.coalesce(
+    func.nullif(_chunk_metric("duration_seconds"), 0.0),
+    func.nullif(AudioChunk.features_json["duration_seconds"].as_float(), 0.0),
+    0.1,
+)
+_CHUNK_DURATION = case((_CHUNK_DURATION_RAW < 0.1, 0.1), else_=_CHUNK_DURATION_RAW)
+_STUDENT_RATIO = _chunk_metric("voice_ratio_student")
+_GURU_RATIO = _chunk_metric("voice_ratio_guru")
+
+# Weighted numerators and their denominators for one stage, in a single aggregate SELECT; only the
+# final divisions happen in Python.
+_METRIC_TOTAL_COLUMNS = (
+    func.count().label("chunk_count"),
+    func.sum(_CHUNK_DURATION).label("duration_total"),
+    func.sum(func.coalesce(_chunk_metric("cadence_bpm"), 72.0) * _CHUNK_DURATION).label("cadence_bpm"),
+    func.sum(_clamp01_sql(_chunk_metric("pitch_stability")) * _CHUNK_DURATION).label("pitch_stability"),
+    func.sum(_clamp01_sql(_chunk_metric("cadence_consistency")) * _CHUNK_DURATION).label("cadence_consistency"),
+    func.sum(_clamp01_sql(_chunk_metric("avg_energy")) * _CHUNK_DURATION).label("avg_energy"),
+    func.sum(_clamp01_sql(_chunk_metric("voice_ratio_total")) * _CHUNK_DURATION).label("voice_ratio_total"),
+    func.count(_STUDENT_RATIO).label("student_count"),
+    func.sum(case((_STUDENT_RATIO.is_not(None), _clamp01_sql(_STUDENT_RATIO) * _CHUNK_DURATION))).label(
+        "voice_ratio_student"
+    ),
+    func.sum(case((_STUDENT_RATIO.is_not(None), _CHUNK_DURATION))).label("student_weight"),
+    func.count(_GURU_RATIO).label("guru_count"),
+    func.sum(case((_GURU_RATIO.is_not(None), _clamp01_sql(_GURU_RATIO) * _CHUNK_DURATION))).label(
+        "voice_ratio_guru"
+    ),
+    func.sum(case((_GURU_RATIO.is_not(None), _CHUNK_DURATION))).label("guru_weight"),
+    func.avg(AudioChunk.features_json["snr_db"].as_float()).label("snr_mean_db"),
+)
+_STAGE_METRIC_TOTALS = select(*_METRIC_TOTAL_COLUMNS).where(
+    AudioChunk.session_id == bindparam("session_id"),
+    AudioChunk.stage == bindparam("stage"),
+    AudioChunk.lineage_id == bindparam("lineage_id"),
+    AudioChunk.golden_profile == bindparam("golden_profile"),
+)
+# The same totals for every (stage, lineage, golden profile) of a session, one row per group.
+_SESSION_METRIC_TOTALS = (
+    select(AudioChunk.stage, AudioChunk.lineage_id, AudioChunk.golden_profile, *_METRIC_TOTAL_COLUMNS)
+    .where(AudioChunk.session_id == bindparam("session_id"))
+    .group_by(AudioChunk.stage, AudioChunk.lineage_id, AudioChunk.golden_profile)
+)
+_PROJECTION_KEY_COLUMNS = ("session_id", "stage", "lineage_id", "golden_profile")
+
+
+def _weighted_mean(weighted_sum: float | None, total_weight: float | None, default: float) -> float:
+    if weighted_sum is None or total_weight is None or total_weight <= 0:
+        return default
+    return float(weighted_sum) / float(total_weight)
+
+
+def _aggregate_stage_metrics(
+    db: Session,
+    *,
+    session_id: str,
+    stage: str,
+    lineage_id: str,
+    golden_profile: str,
+) -> tuple[MahaMantraMetrics, dict[str, Any]]:
+    totals = db.execute(
+        _STAGE_METRIC_TOTALS,
+        {
+            "session_id": session_id,
+            "stage": stage,
+            "lineage_id": lineage_id,
+            "golden_profile": golden_profile,
+        },
+    ).one()
+    if not totals.chunk_count:
+        raise ValueError("No chunks for stage projection")
+    return _metrics_from_totals(totals)
+
 
+def _metrics_from_totals(totals: Any) -> tuple[MahaMantraMetrics, dict[str, Any]]:
+    duration_total = float(totals.duration_total)
     metrics = MahaMantraMetrics(
         duration_seconds=round(duration_total, 3),
-        voice_ratio_total=round(_weighted_mean(voice_total_rows, 0.0), 3),
+        voice_ratio_total=round(_weighted_mean(totals.voice_ratio_total, duration_total, 0.0), 3),
         voice_ratio_student=(
-            round(_weighted_mean(student_rows, 0.0), 3) if student_rows else None
+            round(_weighted_mean(totals.voice_ratio_student, totals.student_weight, 0.0), 3)
+            if totals.student_count
+            else None
         ),
-        voice_ratio_guru=round(_weighted_mean(guru_rows, 0.0), 3) if guru_rows else None,
-        pitch_stability=round(_weighted_mean(pitch_rows, 0.5), 3),
-        cadence_bpm=round(_weighted_mean(cadence_rows, 72.0), 2),
-        cadence_consistency=round(_weighted_mean(consistency_rows, 0.5), 3),
-        avg_energy=round(_weighted_mean(energy_rows, 0.5), 3),
+        voice_ratio_guru=(
+            round(_weighted_mean(totals.voice_ratio_guru, totals.guru_weight, 0.0), 3)
+            if totals.guru_count
+            else None
+        ),
+        pitch_stability=round(_weighted_mean(totals.pitch_stability, duration_total, 0.5), 3),
+        cadence_bpm=round(_weighted_mean(totals.cadence_bpm, duration_total, 72.0), 2),
+        cadence_consistency=round(_weighted_mean(totals.cadence_consistency, duration_total, 0.5), 3),
+        avg_energy=round(_weighted_mean(totals.avg_energy, duration_total, 0.5), 3),
     )
 
     info = {
         "duration_total_seconds": round(duration_total, 3),
-        "chunk_count": len(chunks),
-        "snr_mean_db": round(mean(snr_values), 3) if snr_values else None,
+        "chunk_count": int(totals.chunk_count),
+        "snr_mean_db": round(float(totals.snr_mean_db), 3) if totals.snr_mean_db is not None else None,
     }
     return metrics, info
 
 
-def recompute_stage_projection(
-    db: Session,
-    *,
-    session_id: str,
+# Aggregated metrics are rounded, so replays and recomputes with no new chunks repeat
+# the same key; cache_info() reports the hit rate.
+@lru_cache(maxsize=1024)
+def _deterministic_stage_eval(
     stage: str,
     lineage_id: str,
-    golden_profile: str = DEFAULT_GOLDEN_PROFILE,
-) -> StageScoreProjection:
-    chunks = db.scalars(
-        select(AudioChunk)
-        .where(
-            AudioChunk.session_id == session_id,
-            AudioChunk.stage == stage,
-            AudioChunk.lineage_id == lineage_id,
-            AudioChunk.golden_profile == golden_profile,
-        )
-        .order_by(AudioChunk.seq.asc(), AudioChunk.id.asc())
-    ).all()
-    if not chunks:
-        raise ValueError("No chunks for stage projection")
-
-    metrics, aggregate_info = _aggregate_stage_metrics(chunks)
-    lineage = resolve_lineage(lineage_id)
-    deterministic_result = evaluate_maha_mantra_stage(
+    golden_profile: str,
+    metrics: MahaMantraMetrics,
+) -> MahaMantraEvalOut:
+    return evaluate_maha_mantra_stage(
         stage=stage,
         metrics=metrics,
-        lineage=lineage,
+        lineage=resolve_lineage(lineage_id),
         golden_profile=golden_profile,
     )
+
+
+def _projection_values(
+    *,
+    stage: str,
+    lineage: LineageProfile,
+    golden_profile: str,
+    metrics: MahaMantraMetrics,
+    aggregate_info: dict[str, Any],
+    score_with_gemini: bool,
+) -> dict[str, Any]:
+    deterministic_result = _deterministic_stage_eval(stage, lineage.id, golden_profile, metrics)
     result: MahaMantraEvalOut = deterministic_result
-    gemini_payload, gemini_meta = try_gemini_stage_score(
-        stage=stage,
-        lineage=lineage,
-        golden_profile=golden_profile,
-        metrics=metrics,
-        deterministic_eval=deterministic_result,
-        aggregate_info=aggregate_info,
-    )
+    if score_with_gemini:
+        gemini_payload, gemini_meta = try_gemini_stage_score(
+            stage=stage,
+            lineage=lineage,
+            golden_profile=golden_profile,
+            metrics=metrics,
+            deterministic_eval=deterministic_result,
+            aggregate_info=aggregate_info,
+        )
+    else:
+        gemini_payload, gemini_meta = None, {"attempted": False, "model": None, "reason": "deferred"}
 
     scorer_source = "deterministic"
     scorer_model: str | None = None
@@ -232,59 +282,228 @@ def recompute_stage_projection(
             metrics_used=dict(gemini_payload.get("metrics_used") or deterministic_result.metrics_used),
         )
 
-    target_duration = float(STAGE_TARGETS[stage]["duration_seconds"])
-    coverage_ratio = clamp01(float(metrics.duration_seconds) / max(1.0, target_duration))
+    coverage_ratio = clamp01(float(metrics.duration_seconds) / _STAGE_TARGET_DURATION[stage])
     snr_mean_db = aggregate_info.get("snr_mean_db")
     snr_norm = clamp01((float(snr_mean_db) - 5.0) / 25.0) if snr_mean_db is not None else 0.5
-    signal_quality = mean(
-        [
-            clamp01(metrics.voice_ratio_total),
-            clamp01(metrics.pitch_stability),
-            clamp01(metrics.cadence_consistency),
-        ]
-    )
+    # MahaMantraMetrics already bounds these ratios to [0, 1].
+    signal_quality = (metrics.voice_ratio_total + metrics.pitch_stability + metrics.cadence_consistency) / 3.0
     confidence = round(clamp01((0.55 * coverage_ratio) + (0.25 * snr_norm) + (0.20 * signal_quality)), 3)
+    scorer_confidence = round(clamp01(scorer_confidence), 3)
+
+    return {
+        "discipline": float(result.discipline),
+        "resonance": float(result.resonance),
+        "coherence": float(result.coherence),
+        "composite": float(result.composite),
+        "passes_golden": bool(result.passes_golden),
+        "confidence": confidence,
+        "scorer_source": scorer_source,
+        "scorer_model": scorer_model,
+        "scorer_confidence": scorer_confidence,
+        "scorer_evidence_json": scorer_evidence_json,
+        "coverage_ratio": round(coverage_ratio, 3),
+        "source_chunk_count": int(aggregate_info["chunk_count"]),
+        "metrics_json": {
+            **result.metrics_used,
+            "aggregate": aggregate_info,
+            "scorer": {
+                "source": scorer_source,
+                "model": scorer_model,
+                "reason": gemini_meta.get("reason"),
+                "scorer_confidence": scorer_confidence,
+            },
+        },
+        "feedback_json": list(result.feedback),
+        "updated_at": _utcnow(),
+    }
+
+
+def _upsert_projections(db: Session, rows: list[dict[str, Any]]) -> list[StageScoreProjection]:
+    """One INSERT ... ON CONFLICT DO UPDATE ... RETURNING for all rows; results in no particular order."""
+    stmt = dialect_insert(db, StageScoreProjection).values(rows)
+    stmt = (
+        stmt.on_conflict_do_update(
+            index_elements=list(_PROJECTION_KEY_COLUMNS),
+            set_={name: stmt.excluded[name] for name in rows[0] if name not in _PROJECTION_KEY_COLUMNS},
+        )
+        .returning(StageScoreProjection)
+        .execution_options(populate_existing=True)
+    )
+    return list(db.scalars(stmt).all())
+
+
+def recompute_stage_projection(
+    db: Session,
+    *,
+    session_id: str,
+    stage: str,
+    lineage_id: str,
+    golden_profile: str = DEFAULT_GOLDEN_PROFILE,
+    score_with_gemini: bool = True,
+) -> StageScoreProjection:
+    metrics, aggregate_info = _aggregate_stage_metrics(
+        db,
+        session_id=session_id,
+        stage=stage,
+        lineage_id=lineage_id,
+        golden_profile=golden_profile,
+    )
+    lineage = resolve_lineage(lineage_id)
+    values = _projection_values(
+        stage=stage,
+        lineage=lineage,
+        golden_profile=golden_profile,
+        metrics=metrics,
+        aggregate_info=aggregate_info,
+        score_with_gemini=score_with_gemini,
+    )
+    row = {"session_id": session_id, "stage": stage, "lineage_id": lineage.id, "golden_profile": golden_profile}
+    return _upsert_projections(db, [{**row, **values}])[0]
 
-    projection = db.scalars(
-        select(StageScoreProjection).where(
-            StageScoreProjection.session_id == session_id,
-            StageScoreProjection.stage == stage,
-            StageScoreProjection.lineage_id == lineage.id,
-            StageScoreProjection.golden_profile == golden_profile,
+
+def recompute_stage_projections(
+    db: Session,
+    *,
+    session_id: str,
+    keys: Iterable[tuple[str, str, str]],
+    score_with_gemini: bool = True,
+) -> list[StageScoreProjection]:
+    """
+    Recompute several (stage, lineage_id, golden_profile) projections of one session with one grouped
+    aggregate query and one multi-row upsert. Caller owns the transaction.
+    """
+    wanted = {(stage, resolve_lineage(lineage_id).id, golden_profile) for stage, lineage_id, golden_profile in keys}
+    if not wanted:
+        return []
+    rows: list[dict[str, Any]] = []
+    for totals in db.execute(_SESSION_METRIC_TOTALS, {"session_id": session_id}):
+        group = (totals.stage, totals.lineage_id, totals.golden_profile)
+        if group not in wanted:
+            continue
+        wanted.discard(group)
+        metrics, aggregate_info = _metrics_from_totals(totals)
+        values = _projection_values(
+            stage=totals.stage,
+            lineage=resolve_lineage(totals.lineage_id),
+            golden_profile=totals.golden_profile,
+            metrics=metrics,
+            aggregate_info=aggregate_info,
+            score_with_gemini=score_with_gemini,
+        )
+        rows.append(
+            {
+                "session_id": session_id,
+                "stage": totals.stage,
+                "lineage_id": totals.lineage_id,
+                "golden_profile": totals.golden_profile,
+                **values,
+            }
         )
-    ).first()
-    if projection is None:
-        projection = StageScoreProjection(
-            session_id=session_id,
+    if wanted:
+        raise ValueError("No chunks for stage projection")
+    return _upsert_projections(db, rows)
+
+
+def mark_projection_pending(key: ProjectionKey) -> None:
+    with _PENDING_LOCK:
+        _PENDING_PROJECTIONS.add(key)
+
+
+def flush_pending_projections(db: Session, *, session_id: str) -> int:
+    """
+    Recompute and commit any deferred projections for the session before they are read.
+    Claimed keys go back to the pending set if the recompute or commit fails.
+    """
+    with _PENDING_LOCK:
+        claimed = [key for key in _PENDING_PROJECTIONS if key[0] == session_id]
+        _PENDING_PROJECTIONS.difference_update(claimed)
+    if not claimed:
+        return 0
+    try:
+        recompute_stage_projections(db, session_id=session_id, keys=[key[1:] for key in claimed])
+        db.commit()
+    except Exception:
+        db.rollback()
+        with _PENDING_LOCK:
+            _PENDING_PROJECTIONS.update(claimed)
+        raise
+    return len(claimed)
+
+
+def _recompute_in_new_session(key: ProjectionKey, pending: set[ProjectionKey]) -> None:
+    with _PENDING_LOCK:
+        if key not in pending:
+            return
+        pending.discard(key)
+    session_id, stage, lineage_id, golden_profile = key
+    with SessionLocal() as db:
+        try:
+            recompute_stage_projection(
+                db,
+                session_id=session_id,
+                stage=stage,
+                lineage_id=lineage_id,
+                golden_profile=golden_profile,
+            )
+            db.commit()
+        except Exception:
+            db.rollback()
+            with _PENDING_LOCK:
+                pending.add(key)
+            raise
+
+
+def recompute_pending_projection(key: ProjectionKey) -> None:
+    """Background task body; a no-op when a reader already recomputed the key."""
+    _recompute_in_new_session(key, _PENDING_PROJECTIONS)
+
+
+def mark_gemini_pending(key: ProjectionKey) -> bool:
+    """Queue a Gemini rescore for `key`; False when one is already queued (skip scheduling another)."""
+    with _PENDING_LOCK:
+        if key in _PENDING_GEMINI:
+            return False
+        _PENDING_GEMINI.add(key)
+        return True
+
+
+def enhance_stage_projection_with_gemini(key: ProjectionKey) -> None:
+    """
+    Background task body: rescore a deterministic projection with Gemini over the latest chunks.
+
+    The Gemini call runs between two short transactions so no pooled connection (or SQLite read
+    transaction) is held while waiting on the network. Failures are logged, not retried.
+    """
+    with _PENDING_LOCK:
+        if key not in _PENDING_GEMINI:
+            return
+        _PENDING_GEMINI.discard(key)
+    session_id, stage, lineage_id, golden_profile = key
+    aggregate_key = {
+        "session_id": session_id,
+        "stage": stage,
+        "lineage_id": lineage_id,
+        "golden_profile": golden_profile,
+    }
+    try:
+        with SessionLocal() as db:
+            metrics, aggregate_info = _aggregate_stage_metrics(db, **aggregate_key)
+        lineage = resolve_lineage(lineage_id)
+        values = _projection_values(
             stage=stage,
-            lineage_id=lineage.id,
+            lineage=lineage,
             golden_profile=golden_profile,
+            metrics=metrics,
+            aggregate_info=aggregate_info,
+            score_with_gemini=True,
         )
-        db.add(projection)
-
-    projection.discipline = float(result.discipline)
-    projection.resonance = float(result.resonance)
-    projection.coherence = float(result.coherence)
-    projection.composite = float(result.composite)
-    projection.passes_golden = bool(result.passes_golden)
-    projection.confidence = confidence
-    projection.scorer_source = scorer_source
-    projection.scorer_model = scorer_model
-    projection.scorer_confidence = round(clamp01(scorer_confidence), 3)
-    projection.scorer_evidence_json = scorer_evidence_json
-    projection.coverage_ratio = round(coverage_ratio, 3)
-    projection.source_chunk_count = int(aggregate_info["chunk_count"])
-    projection.metrics_json = {
-        **result.metrics_used,
-        "aggregate": aggregate_info,
-        "scorer": {
-            "source": scorer_source,
-            "model": scorer_model,
-            "reason": gemini_meta.get("reason"),
-            "scorer_confidence": round(clamp01(scorer_confidence), 3),
-        },
-    }
-    projection.feedback_json = list(result.feedback)
-    projection.updated_at = _utcnow()
-    db.flush()
-    return projection
+        with SessionLocal() as db:
+            # A chunk that landed during the call carries its own projection (and rescore); keep it.
+            if _aggregate_stage_metrics(db, **aggregate_key) != (metrics, aggregate_info):
+                return
+            _upsert_projections(db, [{**aggregate_key, "lineage_id": lineage.id, **values}])
+            db.commit()
+    except Exception:  # noqa: BLE001
+        # Nothing reschedules a failed rescore; leave the key unqueued so the next defer_gemini ingest
+        # of this stage can. The deterministic projection already committed stays in place.
+        logger.exception("Gemini rescore failed for stage projection %s", key)
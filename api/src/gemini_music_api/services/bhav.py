@@ -2,12 +2,19 @@ from __future__ import annotations
 
 import math
 from dataclasses import dataclass
+from functools import lru_cache
 
 
 def clamp01(value: float | int | None) -> float:
     if value is None:
         return 0.0
-    return max(0.0, min(1.0, float(value)))
+    value = float(value)
+    # Comparisons instead of max(min(...)): same results (NaN -> 1.0, -0.0 -> 0.0), no builtin calls.
+    if value <= 0.0:
+        return 0.0
+    if value <= 1.0:
+        return value
+    return 1.0
 
 
 def _norm_rating_1_to_5(value: float | int | None) -> float:
@@ -25,8 +32,9 @@ def _mean(values: list[float]) -> float:
 def _std(values: list[float], mean: float) -> float:
     if len(values) <= 1:
         return 0.0
-    variance = sum((x - mean) ** 2 for x in values) / len(values)
-    return math.sqrt(variance)
+    # map + sumprod keep the deviation pass in C instead of a per-item generator expression.
+    deviations = list(map(mean.__rsub__, values))
+    return math.sqrt(math.sumprod(deviations, deviations) / len(values))
 
 
 def _cadence_consistency(cadences: list[float]) -> float:
@@ -54,8 +62,8 @@ class BhavWeights:
 @dataclass(frozen=True)
 class LineageProfile:
     id: str
-    aliases: set[str]
-    mantra_aliases: set[str]
+    aliases: frozenset[str]
+    mantra_aliases: frozenset[str]
     thresholds: dict[str, float]
     weights: BhavWeights
 
@@ -63,12 +71,14 @@ class LineageProfile:
 LINEAGE_PROFILES: dict[str, LineageProfile] = {
     "vaishnavism": LineageProfile(
         id="vaishnavism",
-        aliases={"vaishnavism", "vashnavism", "vaishnava"},
-        mantra_aliases={
-            "maha_mantra",
-            "hare_krishna_hare_rama",
-            "maha_mantra_hare_krishna_hare_rama",
-        },
+        aliases=frozenset({"vaishnavism", "vashnavism", "vaishnava"}),
+        mantra_aliases=frozenset(
+            {
+                "maha_mantra",
+                "hare_krishna_hare_rama",
+                "maha_mantra_hare_krishna_hare_rama",
+            }
+        ),
         thresholds={
             "discipline": 0.75,
             "resonance": 0.72,
@@ -79,12 +89,14 @@ LINEAGE_PROFILES: dict[str, LineageProfile] = {
     ),
     "sadhguru": LineageProfile(
         id="sadhguru",
-        aliases={"sadhguru", "isha", "isha_foundation"},
-        mantra_aliases={
-            "maha_mantra",
-            "hare_krishna_hare_rama",
-            "maha_mantra_hare_krishna_hare_rama",
-        },
+        aliases=frozenset({"sadhguru", "isha", "isha_foundation"}),
+        mantra_aliases=frozenset(
+            {
+                "maha_mantra",
+                "hare_krishna_hare_rama",
+                "maha_mantra_hare_krishna_hare_rama",
+            }
+        ),
         thresholds={
             "discipline": 0.78,
             "resonance": 0.70,
@@ -95,12 +107,14 @@ LINEAGE_PROFILES: dict[str, LineageProfile] = {
     ),
     "shree_vallabhacharya": LineageProfile(
         id="shree_vallabhacharya",
-        aliases={"shree_vallabhacharya", "vallabhacharya", "pushtimarg"},
-        mantra_aliases={
-            "maha_mantra",
-            "hare_krishna_hare_rama",
-            "maha_mantra_hare_krishna_hare_rama",
-        },
+        aliases=frozenset({"shree_vallabhacharya", "vallabhacharya", "pushtimarg"}),
+        mantra_aliases=frozenset(
+            {
+                "maha_mantra",
+                "hare_krishna_hare_rama",
+                "maha_mantra_hare_krishna_hare_rama",
+            }
+        ),
         thresholds={
             "discipline": 0.73,
             "resonance": 0.76,
@@ -115,21 +129,27 @@ LINEAGE_PROFILES: dict[str, LineageProfile] = {
 DEFAULT_LINEAGE_ID = "vaishnavism"
 DEFAULT_GOLDEN_PROFILE = "maha_mantra_v1"
 
+_LINEAGE_BY_ALIAS: dict[str, LineageProfile] = {
+    alias: profile for profile in LINEAGE_PROFILES.values() for alias in profile.aliases
+}
+
 
+@lru_cache(maxsize=256)
 def resolve_lineage(lineage_name: str | None) -> LineageProfile:
     if not lineage_name:
         return LINEAGE_PROFILES[DEFAULT_LINEAGE_ID]
-    key = lineage_name.strip().lower()
-    for profile in LINEAGE_PROFILES.values():
-        if key in profile.aliases:
-            return profile
-    raise ValueError(f"Unsupported lineage: {lineage_name}")
+    profile = _LINEAGE_BY_ALIAS.get(lineage_name.strip().lower())
+    if profile is None:
+        raise ValueError(f"Unsupported lineage: {lineage_name}")
+    return profile
 
 
 def _is_maha_mantra_profile_match(mantra_key: str | None, profile: LineageProfile) -> bool:
     if not mantra_key:
         return False
-    return mantra_key.strip().lower() in profile.mantra_aliases
+    # Stored keys are usually already canonical; only normalize on a miss.
+    aliases = profile.mantra_aliases
+    return mantra_key in aliases or mantra_key.strip().lower() in aliases
 
 
 def compute_bhav(
@@ -148,15 +168,20 @@ def compute_bhav(
     user_value_norm = _norm_rating_1_to_5(summary.get("user_value_rating"))
 
     cadence_values = []
-    adaptation_helpfulness = []
+    helpful_count = 0
+    helpful_total = 0
     for payload in event_payloads:
-        if payload.get("cadence_bpm") is not None:
-            cadence_values.append(float(payload["cadence_bpm"]))
-        if payload.get("adaptation_helpful") is not None:
-            adaptation_helpfulness.append(1.0 if bool(payload["adaptation_helpful"]) else 0.0)
+        cadence = payload.get("cadence_bpm")
+        if cadence is not None:
+            cadence_values.append(float(cadence))
+        helpful = payload.get("adaptation_helpful")
+        if helpful is not None:
+            helpful_total += 1
+            if helpful:
+                helpful_count += 1
 
     cadence_consistency = _cadence_consistency(cadence_values)
-    adaptation_acceptance = _mean(adaptation_helpfulness) if adaptation_helpfulness else 0.5
+    adaptation_acceptance = helpful_count / helpful_total if helpful_total else 0.5
     duration_ratio = clamp01(practice_minutes / max(1.0, float(target_duration_minutes)))
 
     discipline = clamp01((0.45 * duration_ratio) + (0.35 * (1.0 if completed_goal else 0.0)) + (0.20 * cadence_consistency))
@@ -177,13 +202,17 @@ def compute_bhav(
     gaps: dict[str, float] = {}
     passes_golden = False
     if profile_match:
+        discipline_gap = round(discipline - thresholds["discipline"], 3)
+        resonance_gap = round(resonance - thresholds["resonance"], 3)
+        coherence_gap = round(coherence - thresholds["coherence"], 3)
+        composite_gap = round(composite - thresholds["composite"], 3)
         gaps = {
-            "discipline": round(discipline - thresholds["discipline"], 3),
-            "resonance": round(resonance - thresholds["resonance"], 3),
-            "coherence": round(coherence - thresholds["coherence"], 3),
-            "composite": round(composite - thresholds["composite"], 3),
+            "discipline": discipline_gap,
+            "resonance": resonance_gap,
+            "coherence": coherence_gap,
+            "composite": composite_gap,
         }
-        passes_golden = all(v >= 0.0 for v in gaps.values())
+        passes_golden = min(discipline_gap, resonance_gap, coherence_gap, composite_gap) >= 0.0
 
     return {
         "discipline": round(discipline, 3),
@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+import os
+import threading
+import time
+
+from ..schemas import ConsentOut
+
+CONSENT_CACHE_TTL_SECONDS = float(os.getenv("CONSENT_CACHE_TTL_SECONDS", "60"))
+
+
+class ConsentCache:
+    """
+    Process-local TTL cache of each user's latest consent record.
+    Writes go through `put`, so this process never serves a consent older than its own writes;
+    other workers converge within the TTL.
+    """
+
+    def __init__(self, ttl_seconds: float = CONSENT_CACHE_TTL_SECONDS, max_entries: int = 10_000) -> None:
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: dict[str, tuple[float, ConsentOut]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, user_id: str) -> ConsentOut | None:
+        if self.ttl_seconds <= 0:
+            return None
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry is None:
+                return None
+            expires_at, consent = entry
+            if expires_at <= time.monotonic():
+                del self._entries[user_id]
+                return None
+            return consent
+
+    def put(self, consent: ConsentOut) -> None:
+        if self.ttl_seconds <= 0:
+            return
+        with self._lock:
+            if len(self._entries) >= self.max_entries and consent.user_id not in self._entries:
+                # Dicts keep insertion order, so this drops the oldest entry.
+                del self._entries[next(iter(self._entries))]
+            self._entries[consent.user_id] = (time.monotonic() + self.ttl_seconds, consent)
+
+    def invalidate(self, user_id: str) -> None:
+        with self._lock:
+            self._entries.pop(user_id, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+consent_cache = ConsentCache()
@@ -5,32 +5,37 @@ from typing import Any
 
 SUPPORTED_SCHEMA_VERSIONS = {"v1"}
 
+# Required payload keys per event type, in the order they are reported when missing.
+_REQUIRED_FIELDS: dict[str, tuple[str, ...]] = {
+    "voice_window": ("cadence_bpm", "practice_seconds"),
+    "partner_signal": ("signal_type",),
+    "maha_mantra_stage_eval": ("stage",),
+}
+_REQUIRED_KEYS = {event_type: frozenset(fields) for event_type, fields in _REQUIRED_FIELDS.items()}
+_NUMERIC_FIELDS: dict[str, tuple[str, ...]] = {
+    "voice_window": ("cadence_bpm", "practice_seconds"),
+}
+_NUMBER_TYPES = (int, float)
+
 
 def _is_number(value: Any) -> bool:
-    return isinstance(value, (int, float)) and not isinstance(value, bool)
+    # Exact type check: payloads are decoded JSON, and this rejects bool without a second test.
+    return type(value) in _NUMBER_TYPES
 
 
 def validate_event_payload(*, event_type: str, payload: dict[str, Any], schema_version: str) -> None:
     if schema_version not in SUPPORTED_SCHEMA_VERSIONS:
         raise ValueError(f"Unsupported schema_version: {schema_version}")
 
-    if event_type == "voice_window":
-        required = ["cadence_bpm", "practice_seconds"]
-        missing = [key for key in required if key not in payload]
-        if missing:
-            raise ValueError(f"voice_window missing required fields: {', '.join(missing)}")
-        if not _is_number(payload.get("cadence_bpm")):
-            raise ValueError("voice_window.cadence_bpm must be numeric")
-        if not _is_number(payload.get("practice_seconds")):
-            raise ValueError("voice_window.practice_seconds must be numeric")
-        return
-
-    if event_type == "partner_signal":
-        if "signal_type" not in payload:
-            raise ValueError("partner_signal missing required field: signal_type")
-        return
-
-    if event_type == "maha_mantra_stage_eval":
-        if "stage" not in payload:
-            raise ValueError("maha_mantra_stage_eval missing required field: stage")
+    required = _REQUIRED_KEYS.get(event_type)
+    if required is None:
         return
+    if not payload.keys() >= required:
+        missing = [key for key in _REQUIRED_FIELDS[event_type] if key not in payload]
+        if len(required) == 1:
+            raise ValueError(f"{event_type} missing required field: {missing[0]}")
+        raise ValueError(f"{event_type} missing required fields: {', '.join(missing)}")
+
+    for key in _NUMERIC_FIELDS.get(event_type, ()):
+        if not _is_number(payload[key]):
+            raise ValueError(f"{event_type}.{key} must be numeric")
@@ -2,26 +2,110 @@ from __future__ import annotations
 
 import json
 import os
+import threading
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any
 
+import httpx
+
+# One client per API key for the whole process so keep-alive connections (and the
+# TLS session) are reused across requests instead of re-handshaking per call.
+_CLIENTS: dict[str, Any] = {}
+_CLIENTS_LOCK = threading.Lock()
+
 
 @dataclass(frozen=True)
 class GeminiAdaptationConfig:
     enabled: bool
     model: str
     api_key: str | None
+    is_valid_model: bool
 
 
+# Environment is fixed per process; call get_gemini_adaptation_config.cache_clear()
+# after changing it (e.g. in tests).
+@lru_cache(maxsize=1)
 def get_gemini_adaptation_config() -> GeminiAdaptationConfig:
     enabled = os.getenv("USE_GEMINI_ADAPTATION", "false").strip().lower() in {"1", "true", "yes"}
     model = os.getenv("GEMINI_MODEL", "gemini-3-flash-preview")
     api_key = os.getenv("GEMINI_API_KEY")
-    return GeminiAdaptationConfig(enabled=enabled, model=model, api_key=api_key)
+    return GeminiAdaptationConfig(
+        enabled=enabled,
+        model=model,
+        api_key=api_key,
+        is_valid_model=model.startswith("gemini-3-"),
+    )
+
+
+def _http_timeout_ms() -> int:
+    return int(os.getenv("GEMINI_HTTP_TIMEOUT_MS", "2000"))
+
+
+_COMPACT = (",", ":")
+# Only the context varies per call, so the rest of the prompt is serialized once around its slot.
+_PROMPT_PREFIX = (
+    json.dumps(
+        {
+            "task": "Return devotional adaptation JSON for mantra/kirtan session.",
+            "constraints": {
+                "tempo_bpm_min": 48,
+                "tempo_bpm_max": 128,
+                "guidance_intensity_allowed": ["low", "medium", "high"],
+                "key_center_allowed": ["C", "D", "E", "F", "G", "A", "B"],
+            },
+        },
+        separators=_COMPACT,
+    )[:-1]
+    + ',"context":'
+)
+_PROMPT_SUFFIX = (
+    ',"response_schema":'
+    + json.dumps(
+        {
+            "tempo_bpm": "int",
+            "guidance_intensity": "low|medium|high",
+            "key_center": "str",
+            "reason": "str",
+            "adaptation_json": "object",
+        },
+        separators=_COMPACT,
+    )
+    + "}"
+)
+_REQUIRED_RESPONSE_KEYS = frozenset({"tempo_bpm", "guidance_intensity", "key_center", "reason", "adaptation_json"})
+
+
+def get_gemini_client(api_key: str) -> Any:
+    client = _CLIENTS.get(api_key)
+    if client is not None:
+        return client
+
+    from google import genai  # type: ignore
+    from google.genai import types  # type: ignore
 
+    with _CLIENTS_LOCK:
+        client = _CLIENTS.get(api_key)
+        if client is None:
+            client = genai.Client(
+                api_key=api_key,
+                http_options=types.HttpOptions(
+                    timeout=_http_timeout_ms(),
+                    client_args={
+                        "limits": httpx.Limits(max_keepalive_connections=32, max_connections=64),
+                    },
+                ),
+            )
+            _CLIENTS[api_key] = client
+    return client
 
-def _validate_model(model: str) -> bool:
-    return model.startswith("gemini-3-")
+
+def close_gemini_clients() -> None:
+    with _CLIENTS_LOCK:
+        clients = list(_CLIENTS.values())
+        _CLIENTS.clear()
+    for client in clients:
+        client.close()
 
 
 def try_gemini_adaptation(*, context: dict[str, Any]) -> dict[str, Any] | None:
@@ -34,36 +118,17 @@ def try_gemini_adaptation(*, context: dict[str, Any]) -> dict[str, Any] | None:
         return None
     if not cfg.api_key:
         return None
-    if not _validate_model(cfg.model):
+    if not cfg.is_valid_model:
         return None
 
     try:
-        from google import genai  # type: ignore
-    except Exception:
+        client = get_gemini_client(cfg.api_key)
+    except ImportError:
         return None
 
-    prompt = {
-        "task": "Return devotional adaptation JSON for mantra/kirtan session.",
-        "constraints": {
-            "tempo_bpm_min": 48,
-            "tempo_bpm_max": 128,
-            "guidance_intensity_allowed": ["low", "medium", "high"],
-            "key_center_allowed": ["C", "D", "E", "F", "G", "A", "B"],
-        },
-        "context": context,
-        "response_schema": {
-            "tempo_bpm": "int",
-            "guidance_intensity": "low|medium|high",
-            "key_center": "str",
-            "reason": "str",
-            "adaptation_json": "object",
-        },
-    }
-
-    client = genai.Client(api_key=cfg.api_key)
     response = client.models.generate_content(
         model=cfg.model,
-        contents=json.dumps(prompt),
+        contents=_PROMPT_PREFIX + json.dumps(context, separators=_COMPACT) + _PROMPT_SUFFIX,
     )
     text = (response.text or "").strip()
     if not text:
@@ -74,7 +139,6 @@ def try_gemini_adaptation(*, context: dict[str, Any]) -> dict[str, Any] | None:
     except Exception:
         return None
 
-    required = {"tempo_bpm", "guidance_intensity", "key_center", "reason", "adaptation_json"}
-    if not required.issubset(set(parsed.keys())):
+    if not parsed.keys() >= _REQUIRED_RESPONSE_KEYS:
         return None
     return parsed
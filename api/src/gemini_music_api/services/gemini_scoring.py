@@ -3,10 +3,55 @@ from __future__ import annotations
 import json
 import os
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any
 
+import orjson
+
 from ..schemas import MahaMantraEvalOut, MahaMantraMetrics
-from .bhav import LineageProfile, clamp01
+from .bhav import BhavWeights, LineageProfile, clamp01
+from .gemini_adapter import get_gemini_client
+
+
+_COMPACT = (",", ":")
+# Everything but the context is fixed per (golden profile, lineage weights); serialize it once.
+_PROMPT_SUFFIX = (
+    ',"response_schema":'
+    + json.dumps(
+        {
+            "discipline": "float 0..1",
+            "resonance": "float 0..1",
+            "coherence": "float 0..1",
+            "composite": "float 0..1",
+            "passes_golden": "bool",
+            "feedback": ["string"],
+            "scorer_confidence": "float 0..1",
+            "metrics_used": "object",
+            "evidence_json": "object",
+        },
+        separators=_COMPACT,
+    )
+    + "}"
+)
+
+
+@lru_cache(maxsize=64)
+def _prompt_prefix(golden_profile: str, weights: BhavWeights) -> str:
+    prefix = {
+        "task": "Score devotional mantra performance. Return JSON only. No markdown or prose.",
+        "scoring_axes": ["discipline", "resonance", "coherence", "composite"],
+        "constraints": {
+            "all_scores_range": [0.0, 1.0],
+            "feedback_items_max": 4,
+            "lineage_weights": {
+                "discipline": weights.discipline,
+                "resonance": weights.resonance,
+                "coherence": weights.coherence,
+            },
+            "golden_profile": golden_profile,
+        },
+    }
+    return json.dumps(prefix, separators=_COMPACT)[:-1] + ',"context":'
 
 
 @dataclass(frozen=True)
@@ -14,13 +59,15 @@ class GeminiScoringConfig:
     enabled: bool
     model: str
     api_key: str | None
+    timeout_ms: int
 
 
 def get_gemini_scoring_config() -> GeminiScoringConfig:
     enabled = os.getenv("USE_GEMINI_SCORING", "false").strip().lower() in {"1", "true", "yes"}
     model = os.getenv("GEMINI_SCORING_MODEL", os.getenv("GEMINI_MODEL", "gemini-3-flash-preview"))
     api_key = os.getenv("GEMINI_API_KEY")
-    return GeminiScoringConfig(enabled=enabled, model=model, api_key=api_key)
+    timeout_ms = int(os.getenv("GEMINI_SCORING_TIMEOUT_MS", "30000"))
+    return GeminiScoringConfig(enabled=enabled, model=model, api_key=api_key, timeout_ms=timeout_ms)
 
 
 def _validate_model(model: str) -> bool:
@@ -28,7 +75,15 @@ def _validate_model(model: str) -> bool:
 
 
 def _extract_json(text: str) -> dict[str, Any] | None:
-    candidates: list[str] = [text.strip()]
+    # Well-formed replies parse directly; only the rest pay for the fence and brace recovery scans.
+    try:
+        parsed = orjson.loads(text)
+    except Exception:
+        parsed = None
+    if isinstance(parsed, dict):
+        return parsed
+
+    candidates: list[str] = []
     if "```" in text:
         stripped = text.strip()
         if stripped.startswith("```"):
@@ -46,7 +101,7 @@ def _extract_json(text: str) -> dict[str, Any] | None:
         if not candidate:
             continue
         try:
-            parsed = json.loads(candidate)
+            parsed = orjson.loads(candidate)
         except Exception:
             continue
         if isinstance(parsed, dict):
@@ -160,60 +215,41 @@ def try_gemini_stage_score(
     if not _validate_model(cfg.model):
         return None, {**meta, "reason": "invalid_model", "model": cfg.model}
 
+    # Shared per-API-key client from the adaptation path: imports the SDK once and reuses its connections.
     try:
-        from google import genai  # type: ignore
-    except Exception:
+        client = get_gemini_client(cfg.api_key)
+        from google.genai import types  # type: ignore
+    except ImportError:
         return None, {**meta, "reason": "sdk_unavailable", "model": cfg.model}
+    except Exception as exc:  # noqa: BLE001
+        return None, {"attempted": True, "model": cfg.model, "reason": f"request_error:{str(exc)[:160]}"}
 
     meta = {"attempted": True, "model": cfg.model, "reason": "request_failed"}
-    prompt = {
-        "task": (
-            "Score devotional mantra performance. Return JSON only. "
-            "No markdown or prose."
-        ),
-        "scoring_axes": ["discipline", "resonance", "coherence", "composite"],
-        "constraints": {
-            "all_scores_range": [0.0, 1.0],
-            "feedback_items_max": 4,
-            "lineage_weights": {
-                "discipline": lineage.weights.discipline,
-                "resonance": lineage.weights.resonance,
-                "coherence": lineage.weights.coherence,
-            },
-            "golden_profile": golden_profile,
-        },
-        "context": {
-            "stage": stage,
-            "lineage": lineage.id,
-            "metrics": metrics.model_dump(),
-            "aggregate_info": aggregate_info,
-            "deterministic_baseline": {
-                "discipline": deterministic_eval.discipline,
-                "resonance": deterministic_eval.resonance,
-                "coherence": deterministic_eval.coherence,
-                "composite": deterministic_eval.composite,
-                "passes_golden": deterministic_eval.passes_golden,
-                "feedback": deterministic_eval.feedback,
-            },
-        },
-        "response_schema": {
-            "discipline": "float 0..1",
-            "resonance": "float 0..1",
-            "coherence": "float 0..1",
-            "composite": "float 0..1",
-            "passes_golden": "bool",
-            "feedback": ["string"],
-            "scorer_confidence": "float 0..1",
-            "metrics_used": "object",
-            "evidence_json": "object",
+    context = {
+        "stage": stage,
+        "lineage": lineage.id,
+        "metrics": metrics.model_dump(),
+        "aggregate_info": aggregate_info,
+        "deterministic_baseline": {
+            "discipline": deterministic_eval.discipline,
+            "resonance": deterministic_eval.resonance,
+            "coherence": deterministic_eval.coherence,
+            "composite": deterministic_eval.composite,
+            "passes_golden": deterministic_eval.passes_golden,
+            "feedback": deterministic_eval.feedback,
         },
     }
 
     try:
-        client = genai.Client(api_key=cfg.api_key)
         response = client.models.generate_content(
             model=cfg.model,
-            contents=json.dumps(prompt),
+            contents=(
+                _prompt_prefix(golden_profile, lineage.weights)
+                + json.dumps(context, separators=_COMPACT)
+                + _PROMPT_SUFFIX
+            ),
+            # The shared client carries the adaptation path's tight timeout; scoring sets its own per call.
+            config=types.GenerateContentConfig(http_options=types.HttpOptions(timeout=cfg.timeout_ms)),
         )
         text = (response.text or "").strip()
     except Exception as exc:  # noqa: BLE001
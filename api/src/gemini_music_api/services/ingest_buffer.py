@@ -0,0 +1,175 @@
+from __future__ import annotations
+
+import logging
+import os
+import threading
+from abc import ABC, abstractmethod
+from collections import defaultdict
+from collections.abc import Callable
+from typing import Any
+
+from sqlalchemy.orm import Session
+
+from ..db import SessionLocal, dialect_insert
+from ..models import SessionEvent
+from .projections import record_partner_events, to_date_key
+
+logger = logging.getLogger(__name__)
+
+ASYNC_INSERT_WAIT_MS = int(os.getenv("ASYNC_INSERT_WAIT_MS", "200"))
+ASYNC_INSERT_MAX_ROWS = int(os.getenv("ASYNC_INSERT_MAX_ROWS", "500"))
+# Pending rows beyond this are refused so callers fall back to a synchronous write.
+ASYNC_INSERT_MAX_PENDING = int(os.getenv("ASYNC_INSERT_MAX_PENDING", "10000"))
+# Flushes a row may fail (individually) before it is logged and dropped.
+ASYNC_INSERT_MAX_ATTEMPTS = int(os.getenv("ASYNC_INSERT_MAX_ATTEMPTS", "5"))
+
+
+def write_partner_events(db: Session, rows: list[dict[str, Any]]) -> int:
+    """
+    Insert already-validated partner event rows as one multi-row statement.
+    Rows whose (session_id, client_event_id) already exists are skipped.
+    """
+    if not rows:
+        return 0
+    stmt = (
+        dialect_insert(db, SessionEvent)
+        .values(rows)
+        .on_conflict_do_nothing(index_elements=["session_id", "client_event_id"])
+        .returning(SessionEvent.event_time, SessionEvent.source_adapter)
+    )
+    inserted = db.execute(stmt).all()
+    adapters_by_day: dict[str, list[str]] = defaultdict(list)
+    for event_time, source_adapter in inserted:
+        adapters_by_day[to_date_key(event_time)].append(source_adapter or "")
+    for date_key, adapter_ids in sorted(adapters_by_day.items()):
+        record_partner_events(db, date_key=date_key, adapter_ids=adapter_ids)
+    return len(inserted)
+
+
+class _IntervalFlusher(ABC):
+    """Background thread that calls `flush` every `wait_seconds`, or sooner when woken."""
+
+    thread_name = "interval-flusher"
+
+    def __init__(self, *, wait_ms: int) -> None:
+        self.wait_seconds = max(1, wait_ms) / 1000.0
+        self._wake = threading.Event()
+        self._stopping = False
+        self._thread: threading.Thread | None = None
+
+    @abstractmethod
+    def flush(self) -> int:
+        """Write everything pending and return how many items were applied."""
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._stopping = False
+        self._thread = threading.Thread(target=self._run, name=self.thread_name, daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        thread = self._thread
+        if thread is None:
+            return
+        self._stopping = True
+        self._wake.set()
+        thread.join()
+        self._thread = None
+        self.flush()
+
+    def _run(self) -> None:
+        while not self._stopping:
+            self._wake.wait(self.wait_seconds)
+            self._wake.clear()
+            try:
+                self.flush()
+            except Exception:  # noqa: BLE001
+                logger.exception("%s flush failed", self.thread_name)
+
+
+class PartnerEventBuffer(_IntervalFlusher):
+    """
+    Async-insert buffer for partner events: callers enqueue validated rows and a
+    background thread writes them every `wait_ms`, or as soon as `max_rows` are pending.
+    At most `max_pending` rows are held; `submit` refuses more so the caller writes synchronously.
+    """
+
+    thread_name = "partner-event-buffer"
+
+    def __init__(
+        self,
+        *,
+        wait_ms: int = ASYNC_INSERT_WAIT_MS,
+        max_rows: int = ASYNC_INSERT_MAX_ROWS,
+        max_pending: int = ASYNC_INSERT_MAX_PENDING,
+        max_attempts: int = ASYNC_INSERT_MAX_ATTEMPTS,
+        session_factory: Callable[[], Session] = SessionLocal,
+    ) -> None:
+        super().__init__(wait_ms=wait_ms)
+        self.max_rows = max(1, max_rows)
+        self.max_pending = max_pending
+        self.max_attempts = max(1, max_attempts)
+        self._session_factory = session_factory
+        # (row, failed attempts so far)
+        self._rows: list[tuple[dict[str, Any], int]] = []
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+
+    def submit(self, row: dict[str, Any]) -> bool:
+        """Queue `row`; False when the buffer is full and the row was not accepted."""
+        with self._lock:
+            if len(self._rows) >= self.max_pending:
+                return False
+            self._rows.append((row, 0))
+            pending = len(self._rows)
+        if pending >= self.max_rows:
+            self._wake.set()
+        return True
+
+    def flush(self) -> int:
+        with self._flush_lock:
+            with self._lock:
+                entries, self._rows = self._rows, []
+            if not entries:
+                return 0
+            try:
+                return self._write([row for row, _ in entries])
+            except Exception:  # noqa: BLE001
+                logger.warning("partner event batch of %d failed; retrying rows one at a time", len(entries))
+            # Isolate the failure so one bad row cannot hold back the rest of the batch.
+            written = 0
+            retry: list[tuple[dict[str, Any], int]] = []
+            for row, failures in entries:
+                try:
+                    written += self._write([row])
+                except Exception:  # noqa: BLE001
+                    failures += 1
+                    if failures >= self.max_attempts:
+                        logger.exception(
+                            "dropping partner event %s/%s after %d failed attempts",
+                            row.get("session_id"),
+                            row.get("client_event_id"),
+                            failures,
+                        )
+                    else:
+                        retry.append((row, failures))
+            if retry:
+                with self._lock:
+                    self._rows[:0] = retry
+            return written
+
+    def _write(self, rows: list[dict[str, Any]]) -> int:
+        db = self._session_factory()
+        try:
+            written = write_partner_events(db, rows)
+            db.commit()
+            return written
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+
+partner_event_buffer = PartnerEventBuffer()
@@ -1,10 +1,11 @@
 from __future__ import annotations
 
-import json
 from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
+import orjson
+
 
 TIMING_MARKERS_PATH = (
     Path(__file__).resolve().parents[1] / "data" / "maha_mantra_timing_markers.v1.json"
@@ -13,7 +14,8 @@ TIMING_MARKERS_PATH = (
 
 @lru_cache(maxsize=1)
 def load_maha_mantra_timing_markers() -> dict[str, Any]:
-    raw = json.loads(TIMING_MARKERS_PATH.read_text(encoding="utf-8"))
+    # orjson parses the raw bytes, so the file is not decoded to str first.
+    raw = orjson.loads(TIMING_MARKERS_PATH.read_bytes())
 
     required_top = {
         "track_id",
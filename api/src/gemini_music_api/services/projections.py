@@ -2,13 +2,15 @@ from __future__ import annotations
 
 import datetime as dt
 from collections import defaultdict
+from functools import lru_cache
 from statistics import mean
 from typing import Any
 
-from sqlalchemy import func, select
+from sqlalchemy import case, event, func, insert, or_, select, update
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
+from ..db import SessionLocal, dialect_insert
 from ..models import (
     AdaptationDecision,
     BhavEvaluation,
@@ -21,16 +23,47 @@ from ..models import (
     WebhookDelivery,
     WebhookSubscription,
 )
+from .analytics_cache import analytics_cache
 
 
 def _utcnow() -> dt.datetime:
     return dt.datetime.now(dt.timezone.utc)
 
 
-def _date_key(value: dt.datetime | dt.date) -> str:
-    if isinstance(value, dt.date) and not isinstance(value, dt.datetime):
-        return value.isoformat()
-    return value.date().isoformat()
+_ANALYTICS_STALE = "analytics_stale"
+
+
+def _mark_analytics_stale(db: Session) -> None:
+    # Cleared after commit, not now: a reader between here and the commit would otherwise
+    # cache the old committed row under the new generation.
+    db.info[_ANALYTICS_STALE] = True
+
+
+# Both hooks also fire when a savepoint (begin_nested) is released or rolled back; only the
+# outermost transaction decides whether the write is visible to other readers.
+@event.listens_for(SessionLocal, "after_commit")
+def _clear_analytics_after_commit(db: Session) -> None:
+    if db.in_nested_transaction():
+        return
+    if db.info.pop(_ANALYTICS_STALE, False):
+        analytics_cache.clear()
+
+
+@event.listens_for(SessionLocal, "after_rollback")
+def _forget_analytics_stale(db: Session) -> None:
+    if db.in_nested_transaction():
+        return
+    db.info.pop(_ANALYTICS_STALE, None)
+
+
+@lru_cache(maxsize=64)
+def _date_key_for_ordinal(ordinal: int) -> str:
+    return dt.date.fromordinal(ordinal).isoformat()
+
+
+def to_date_key(value: dt.datetime | dt.date) -> str:
+    # Writes cluster on a handful of days, so the "YYYY-MM-DD" key is memoised per calendar day.
+    return _date_key_for_ordinal(value.toordinal())
 
 
 def _upsert_ecosystem_row(db: Session, date_key: str) -> EcosystemUsageDaily:
@@ -180,36 +213,36 @@ def queue_webhook_deliveries(
     max_attempts: int = 3,
 ) -> int:
     event_time = event_time or _utcnow()
-    subscriptions = db.scalars(
-        select(WebhookSubscription)
+    # Only the fan-out columns are needed; skip building WebhookSubscription identities.
+    subscriptions = db.execute(
+        select(WebhookSubscription.id, WebhookSubscription.event_types)
         .where(WebhookSubscription.is_active.is_(True))
         .order_by(WebhookSubscription.id.asc())
     ).all()
 
-    queued = 0
-    for sub in subscriptions:
-        if event_type not in sub.event_types and "*" not in sub.event_types:
-            continue
-        db.add(
-            WebhookDelivery(
-                subscription_id=sub.id,
-                event_type=event_type,
-                payload=payload,
-                status="queued",
-                attempt_count=0,
-                max_attempts=max(1, int(max_attempts)),
-                next_attempt_at=event_time,
-            )
-        )
-        queued += 1
-
-    if queued:
+    attempts = max(1, int(max_attempts))
+    rows = [
+        {
+            "subscription_id": sub.id,
+            "event_type": event_type,
+            "payload": payload,
+            "status": "queued",
+            "attempt_count": 0,
+            "max_attempts": attempts,
+            "next_attempt_at": event_time,
+        }
+        for sub in subscriptions
+        if event_type in sub.event_types or "*" in sub.event_types
+    ]
+    if rows:
+        # One multi-row INSERT in the caller's transaction instead of a flush per delivery row.
+        db.execute(insert(WebhookDelivery).values(rows))
         increment_ecosystem_usage(
             db,
-            date_key=_date_key(event_time),
-            outbound_webhooks_queued=queued,
+            date_key=to_date_key(event_time),
+            outbound_webhooks_queued=len(rows),
         )
-    return queued
+    return len(rows)
 
 
 def process_webhook_deliveries(
@@ -219,57 +252,102 @@ def process_webhook_deliveries(
     now: dt.datetime | None = None,
     ignore_schedule: bool = False,
     base_backoff_seconds: int = 5,
+    touched_dates: set[str] | None = None,
 ) -> dict[str, int]:
+    """Deliver one batch. Pass `touched_dates` to collect the affected days and refresh them later."""
+    defer_refresh = touched_dates is not None
+    if touched_dates is None:
+        touched_dates = set()
     now = now or _utcnow()
-    query = (
-        select(WebhookDelivery)
-        .where(WebhookDelivery.status.in_(["queued", "retrying"]))
-        .order_by(WebhookDelivery.id.asc())
-        .limit(batch_size)
+    query = select(
+        WebhookDelivery.id,
+        WebhookDelivery.subscription_id,
+        WebhookDelivery.payload,
+        WebhookDelivery.attempt_count,
+        WebhookDelivery.max_attempts,
+        WebhookDelivery.created_at,
+    ).where(WebhookDelivery.status.in_(["queued", "retrying"]))
+    if not ignore_schedule:
+        # Served by ix_webhook_deliveries_status_next_attempt; rows not yet due never fill the batch.
+        query = query.where(
+            or_(WebhookDelivery.next_attempt_at.is_(None), WebhookDelivery.next_attempt_at <= now)
+        )
+    deliveries = db.execute(query.order_by(WebhookDelivery.id.asc()).limit(batch_size)).all()
+
+    subscription_ids = {row.subscription_id for row in deliveries if row.subscription_id}
+    target_urls = (
+        dict(
+            db.execute(
+                select(WebhookSubscription.id, WebhookSubscription.target_url).where(
+                    WebhookSubscription.id.in_(subscription_ids)
+                )
+            ).all()
+        )
+        if subscription_ids
+        else {}
     )
-    deliveries = db.scalars(query).all()
-
-    processed = 0
-    succeeded = 0
-    retried = 0
-    dead_lettered = 0
-    failed_attempts = 0
-    touched_dates: set[str] = set()
 
-    for delivery in deliveries:
-        if not ignore_schedule and delivery.next_attempt_at and delivery.next_attempt_at > now:
-            continue
+    # Outcomes are collected per batch and written with one UPDATE per transition, not one per row.
+    delivered_ids: list[int] = []
+    dead_letter_ids: list[int] = []
+    retry_rows: list[dict[str, Any]] = []
 
-        processed += 1
-        touched_dates.add(_date_key(delivery.created_at))
-        subscription = db.get(WebhookSubscription, delivery.subscription_id) if delivery.subscription_id else None
-        target_url = (subscription.target_url if subscription is not None else "").lower()
-        force_fail = bool((delivery.payload or {}).get("force_webhook_fail"))
+    for row in deliveries:
+        touched_dates.add(to_date_key(row.created_at))
+        target_url = (target_urls.get(row.subscription_id) or "").lower()
+        force_fail = bool((row.payload or {}).get("force_webhook_fail"))
         should_fail = force_fail or ("fail" in target_url)
 
         if not should_fail:
-            delivery.status = "delivered"
-            delivery.delivered_at = now
-            delivery.last_error = None
-            succeeded += 1
+            delivered_ids.append(row.id)
             continue
 
-        failed_attempts += 1
-        delivery.attempt_count += 1
-        delivery.last_error = "simulated_delivery_failure"
-        if delivery.attempt_count >= max(1, int(delivery.max_attempts)):
-            delivery.status = "dead_letter"
-            delivery.dead_lettered_at = now
-            delivery.dead_letter_reason = "max_attempts_exceeded"
-            dead_lettered += 1
+        attempt_count = row.attempt_count + 1
+        if attempt_count >= max(1, int(row.max_attempts)):
+            dead_letter_ids.append(row.id)
         else:
-            backoff = max(1, int(base_backoff_seconds)) * (2 ** (delivery.attempt_count - 1))
-            delivery.status = "retrying"
-            delivery.next_attempt_at = now + dt.timedelta(seconds=backoff)
-            retried += 1
+            backoff = max(1, int(base_backoff_seconds)) * (2 ** (attempt_count - 1))
+            retry_rows.append(
+                {
+                    "id": row.id,
+                    "status": "retrying",
+                    "attempt_count": attempt_count,
+                    "last_error": "simulated_delivery_failure",
+                    "next_attempt_at": now + dt.timedelta(seconds=backoff),
+                }
+            )
 
-    for date_key in touched_dates:
-        refresh_ecosystem_usage_daily(db, date_key=date_key)
+    if delivered_ids:
+        db.execute(
+            update(WebhookDelivery)
+            .where(WebhookDelivery.id.in_(delivered_ids))
+            .values(status="delivered", delivered_at=now, last_error=None)
+        )
+    if dead_letter_ids:
+        db.execute(
+            update(WebhookDelivery)
+            .where(WebhookDelivery.id.in_(dead_letter_ids))
+            .values(
+                status="dead_letter",
+                attempt_count=WebhookDelivery.attempt_count + 1,
+                last_error="simulated_delivery_failure",
+                dead_lettered_at=now,
+                dead_letter_reason="max_attempts_exceeded",
+            )
+        )
+    if retry_rows:
+        # Backoff differs per row; ORM bulk UPDATE by primary key sends them as one executemany.
+        db.execute(update(WebhookDelivery), retry_rows)
+
+    processed = len(deliveries)
+    succeeded = len(delivered_ids)
+    retried = len(retry_rows)
+    dead_lettered = len(dead_letter_ids)
+    failed_attempts = retried + dead_lettered
+
+    if not defer_refresh:
+        for date_key in touched_dates:
+            refresh_ecosystem_usage_daily(db, date_key=date_key)
 
     db.flush()
     return {
@@ -281,6 +359,49 @@ def process_webhook_deliveries(
     }
 
 
+def _upsert_daily_counters(
+    db: Session,
+    model: type[EcosystemUsageDaily] | type[BusinessSignalDaily],
+    *,
+    date_key: str,
+    deltas: dict[str, int],
+    assign: dict[str, Any] | None = None,
+    at_least: dict[str, int] | None = None,
+) -> Any:
+    """
+    Apply a delta to one daily projection row with a single INSERT ... ON CONFLICT DO UPDATE.
+    `deltas` are added, `assign` overwrites, `at_least` keeps the larger of stored and given value.
+    """
+    assign = assign or {}
+    at_least = at_least or {}
+    table = model.__table__
+    stmt = dialect_insert(db, model).values(
+        date_key=date_key,
+        updated_at=_utcnow(),
+        **deltas,
+        **assign,
+        **at_least,
+    )
+    excluded = stmt.excluded
+    set_: dict[str, Any] = {name: table.c[name] + excluded[name] for name in deltas}
+    set_.update({name: excluded[name] for name in assign})
+    set_.update(
+        {
+            name: case((excluded[name] > table.c[name], excluded[name]), else_=table.c[name])
+            for name in at_least
+        }
+    )
+    set_["updated_at"] = excluded.updated_at
+    if model is BusinessSignalDaily:
+        _mark_analytics_stale(db)
+    stmt = (
+        stmt.on_conflict_do_update(index_elements=["date_key"], set_=set_)
+        .returning(model)
+        .execution_options(populate_existing=True)
+    )
+    return db.scalars(stmt).one()
+
+
 def increment_ecosystem_usage(
     db: Session,
     *,
@@ -296,21 +417,125 @@ def increment_ecosystem_usage(
     content_export_events: int = 0,
     unique_partner_sources: int | None = None,
 ) -> EcosystemUsageDaily:
-    row = _upsert_ecosystem_row(db, date_key)
-    row.inbound_partner_events += inbound_partner_events
-    row.outbound_webhooks_queued += outbound_webhooks_queued
-    row.webhook_deliveries_succeeded += webhook_deliveries_succeeded
-    row.webhook_deliveries_retrying += webhook_deliveries_retrying
-    row.webhook_dead_letters += webhook_dead_letters
-    row.webhook_failed_attempts += webhook_failed_attempts
-    row.exports_generated += exports_generated
-    row.wearable_adapter_events += wearable_adapter_events
-    row.content_export_events += content_export_events
-    if unique_partner_sources is not None:
-        row.unique_partner_sources = max(row.unique_partner_sources, unique_partner_sources)
-    row.updated_at = _utcnow()
-    db.flush()
-    return row
+    return _upsert_daily_counters(
+        db,
+        EcosystemUsageDaily,
+        date_key=date_key,
+        deltas={
+            "inbound_partner_events": inbound_partner_events,
+            "outbound_webhooks_queued": outbound_webhooks_queued,
+            "webhook_deliveries_succeeded": webhook_deliveries_succeeded,
+            "webhook_deliveries_retrying": webhook_deliveries_retrying,
+            "webhook_dead_letters": webhook_dead_letters,
+            "webhook_failed_attempts": webhook_failed_attempts,
+            "exports_generated": exports_generated,
+            "wearable_adapter_events": wearable_adapter_events,
+            "content_export_events": content_export_events,
+        },
+        at_least=(
+            {"unique_partner_sources": unique_partner_sources} if unique_partner_sources is not None else None
+        ),
+    )
+
+
+def count_partner_sources(db: Session, *, date_key: str) -> int:
+    return db.scalar(
+        select(func.count(func.distinct(SessionEvent.ingestion_source))).where(
+            func.date(SessionEvent.event_time) == date_key,
+            SessionEvent.ingestion_source.like("partner:%"),
+        )
+    ) or 0
+
+
+def record_partner_events(db: Session, *, date_key: str, adapter_ids: list[str]) -> EcosystemUsageDaily:
+    """Incremental ecosystem update for newly stored partner events (already flushed)."""
+    return increment_ecosystem_usage(
+        db,
+        date_key=date_key,
+        inbound_partner_events=len(adapter_ids),
+        wearable_adapter_events=sum(1 for adapter_id in adapter_ids if adapter_id.startswith("wearable_")),
+        content_export_events=sum(1 for adapter_id in adapter_ids if adapter_id.startswith("content_")),
+        unique_partner_sources=count_partner_sources(db, date_key=date_key),
+    )
+
+
+def record_session_started(db: Session, *, session: SessionModel) -> BusinessSignalDaily:
+    """Incremental business-signal update for a newly flushed session."""
+    date_key = to_date_key(session.started_at)
+    prior_today, oldest = db.execute(
+        select(
+            func.count(SessionModel.id).filter(func.date(SessionModel.started_at) == date_key),
+            func.min(SessionModel.started_at),
+        ).where(
+            SessionModel.user_id == session.user_id,
+            SessionModel.id != session.id,
+        )
+    ).one()
+    first_today = not prior_today
+    threshold_date = dt.date.fromisoformat(date_key) - dt.timedelta(days=7)
+    returning = first_today and oldest is not None and oldest.date() <= threshold_date
+    return _upsert_daily_counters(
+        db,
+        BusinessSignalDaily,
+        date_key=date_key,
+        deltas={
+            "sessions_started": 1,
+            "unique_active_users": int(first_today),
+            "day7_returning_users": int(returning),
+        },
+    )
+
+
+def _ended_session_averages(db: Session, date_key: str) -> dict[str, float]:
+    """
+    Day averages over ended sessions' summaries. Both the incremental path and the rebuild use
+    this one SQL AVG, so a reconciliation run never changes the published (rounded) values.
+    """
+    avg_rating, avg_helpful = db.execute(
+        select(
+            func.avg(SessionModel.summary_json["user_value_rating"].as_float()),
+            func.avg(SessionModel.summary_json["adaptation_helpful_rate"].as_float()),
+        ).where(
+            SessionModel.ended_at.is_not(None),
+            func.date(SessionModel.ended_at) == date_key,
+        )
+    ).one()
+    return {
+        "avg_user_value_rating": round(float(avg_rating), 3) if avg_rating is not None else 0.0,
+        "adaptation_helpful_rate": round(float(avg_helpful), 3) if avg_helpful is not None else 0.0,
+    }
+
+
+def record_session_ended(db: Session, *, session: SessionModel, summary: dict[str, Any]) -> BusinessSignalDaily:
+    """Incremental business-signal update for a session whose end has been flushed."""
+    date_key = to_date_key(session.ended_at)
+    return _upsert_daily_counters(
+        db,
+        BusinessSignalDaily,
+        date_key=date_key,
+        deltas={
+            "sessions_completed": 1,
+            "meaningful_sessions": int(bool(summary.get("meaningful_session"))),
+        },
+        assign=_ended_session_averages(db, date_key),
+    )
+
+
+def record_bhav_evaluation(db: Session, *, evaluation: BhavEvaluation) -> BusinessSignalDaily:
+    """Incremental business-signal update for a newly flushed Bhav evaluation."""
+    date_key = to_date_key(evaluation.created_at)
+    pass_rate = db.scalar(
+        select(func.avg(case((BhavEvaluation.passes_golden.is_(True), 1.0), else_=0.0))).where(
+            func.date(BhavEvaluation.created_at) == date_key
+        )
+    )
+    return _upsert_daily_counters(
+        db,
+        BusinessSignalDaily,
+        date_key=date_key,
+        deltas={},
+        assign={"bhav_pass_rate": round(float(pass_rate), 3) if pass_rate is not None else 0.0},
+    )
 
 
 def refresh_ecosystem_usage_daily(db: Session, *, date_key: str) -> EcosystemUsageDaily:
@@ -374,6 +599,7 @@ def refresh_ecosystem_usage_daily(db: Session, *, date_key: str) -> EcosystemUsa
 
 
 def refresh_business_signal_daily(db: Session, *, date_key: str) -> BusinessSignalDaily:
+    _mark_analytics_stale(db)
     row = _upsert_business_row(db, date_key)
 
     started_sessions = db.scalars(
@@ -395,19 +621,9 @@ def refresh_business_signal_daily(db: Session, *, date_key: str) -> BusinessSign
         1 for summary in summary_payloads if bool(summary.get("meaningful_session"))
     )
 
-    ratings = [
-        float(summary["user_value_rating"])
-        for summary in summary_payloads
-        if summary.get("user_value_rating") is not None
-    ]
-    row.avg_user_value_rating = round(mean(ratings), 3) if ratings else 0.0
-
-    helpful_rates = [
-        float(summary["adaptation_helpful_rate"])
-        for summary in summary_payloads
-        if summary.get("adaptation_helpful_rate") is not None
-    ]
-    row.adaptation_helpful_rate = round(mean(helpful_rates), 3) if helpful_rates else 0.0
+    averages = _ended_session_averages(db, date_key)
+    row.avg_user_value_rating = averages["avg_user_value_rating"]
+    row.adaptation_helpful_rate = averages["adaptation_helpful_rate"]
 
     pass_flags = db.scalars(
         select(BhavEvaluation.passes_golden).where(
@@ -444,6 +660,18 @@ def refresh_business_signal_daily(db: Session, *, date_key: str) -> BusinessSign
     return row
 
 
+def refresh_ecosystem_usage_days(date_keys: list[str]) -> None:
+    """Background task body: rebuild usage projections for `date_keys` in a short-lived session."""
+    with SessionLocal() as db:
+        try:
+            for date_key in date_keys:
+                refresh_ecosystem_usage_daily(db, date_key=date_key)
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+
+
 def refresh_daily_projections(db: Session, *, date_key: str) -> tuple[EcosystemUsageDaily, BusinessSignalDaily]:
     eco = refresh_ecosystem_usage_daily(db, date_key=date_key)
     biz = refresh_business_signal_daily(db, date_key=date_key)
@@ -479,7 +707,7 @@ def compute_business_cohorts(db: Session) -> dict[str, Any]:
         lambda: {"users": set(), "sessions": 0, "completed": 0, "meaningful": 0}
     )
     for session in sessions:
-        key = _date_key(session.started_at)
+        key = to_date_key(session.started_at)
         bucket = by_day[key]
         bucket["users"].add(session.user_id)
         bucket["sessions"] += 1
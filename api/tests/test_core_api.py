@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import datetime as dt
 import os
 from pathlib import Path
 
@@ -13,12 +14,15 @@ os.environ["DATABASE_URL"] = f"sqlite:///{TEST_DB_PATH}"
 from gemini_music_api.db import Base, engine
 from gemini_music_api.main import app
 from gemini_music_api.services.ai_kirtan_contract import verify_payload_contract
+from gemini_music_api.services.analytics_cache import analytics_cache
+from gemini_music_api.services.ingest_buffer import partner_event_buffer
 
 
 @pytest.fixture(autouse=True)
 def reset_db() -> None:
     Base.metadata.drop_all(bind=engine)
     Base.metadata.create_all(bind=engine)
+    analytics_cache.clear()
     yield
     Base.metadata.drop_all(bind=engine)
 
@@ -52,6 +56,10 @@ def test_core_story_flow(client: TestClient) -> None:
     assert consent_resp.status_code == 200
     assert consent_resp.json()["biometric_enabled"] is True
 
+    read_consent = client.get(f"/v1/users/{user_id}/consent")
+    assert read_consent.status_code == 200
+    assert read_consent.json()["biometric_enabled"] is True
+
     start_resp = client.post(
         "/v1/sessions",
         json={
@@ -285,6 +293,19 @@ def test_audio_chunk_ingest_and_projection(client: TestClient) -> None:
     assert projections[0]["source_chunk_count"] == 1
     assert projections[0]["scorer_source"] == "deterministic"
 
+    deferred = client.post(
+        f"/v1/sessions/{session_id}/audio/chunks",
+        params={"defer_projection": "true"},
+        json={**payload, "chunk_id": "guided-002", "seq": 2},
+    )
+    assert deferred.status_code == 201
+    assert deferred.json()["idempotency_hit"] is False
+    assert deferred.json()["projection"]["source_chunk_count"] == 1
+
+    list_after_defer = client.get(f"/v1/sessions/{session_id}/stage-projections")
+    assert list_after_defer.status_code == 200
+    assert list_after_defer.json()[0]["source_chunk_count"] == 2
+
 
 def test_audio_chunk_uses_gemini_scorer_when_available(client: TestClient, monkeypatch: pytest.MonkeyPatch) -> None:
     from gemini_music_api.services import audio_scoring
@@ -425,6 +446,198 @@ def test_audio_chunk_falls_back_when_gemini_scorer_invalid(client: TestClient, m
     assert projection["scorer_evidence_json"]["fallback_reason"] == "invalid_payload"
 
 
+def test_audio_chunk_defers_gemini_scoring_to_background(client: TestClient, monkeypatch: pytest.MonkeyPatch) -> None:
+    from gemini_music_api.services import audio_scoring
+
+    def _fake_gemini_score(**_: object) -> tuple[dict[str, object], dict[str, object]]:
+        return (
+            {
+                "discipline": 0.92,
+                "resonance": 0.88,
+                "coherence": 0.9,
+                "composite": 0.9,
+                "passes_golden": True,
+                "feedback": ["Gemini scorer: rescored in background."],
+                "scorer_confidence": 0.91,
+                "evidence_json": {"mode": "stubbed"},
+            },
+            {"attempted": True, "model": "gemini-3-pro-preview", "reason": "ok"},
+        )
+
+    monkeypatch.setenv("USE_GEMINI_SCORING", "true")
+    monkeypatch.setattr(audio_scoring, "try_gemini_stage_score", _fake_gemini_score)
+
+    user_id = client.post("/v1/users", json={"display_name": "Deferred Gemini User"}).json()["id"]
+    session_id = client.post(
+        "/v1/sessions",
+        json={
+            "user_id": user_id,
+            "intention": "Deferred Gemini scoring",
+            "mantra_key": "maha_mantra_hare_krishna_hare_rama",
+            "mood": "focused",
+            "target_duration_minutes": 3,
+        },
+    ).json()["id"]
+
+    payload = {
+        "stage": "guided",
+        "chunk_id": "guided-deferred-gemini-001",
+        "seq": 1,
+        "t_start_ms": 48000,
+        "t_end_ms": 93000,
+        "sample_rate_hz": 16000,
+        "encoding": "browser_metrics_v1",
+        "lineage": "vaishnavism",
+        "golden_profile": "maha_mantra_v1",
+        "features": {
+            "duration_seconds": 45,
+            "voice_ratio_total": 0.71,
+            "pitch_stability": 0.84,
+            "cadence_bpm": 72,
+            "cadence_consistency": 0.81,
+            "avg_energy": 0.5,
+            "snr_db": 18,
+        },
+    }
+
+    ingest_resp = client.post(f"/v1/sessions/{session_id}/audio/chunks?defer_gemini=true", json=payload)
+    assert ingest_resp.status_code == 201
+    projection = ingest_resp.json()["projection"]
+    assert projection["scorer_source"] == "deterministic"
+    assert projection["scorer_evidence_json"]["fallback_reason"] == "deferred"
+
+    projections = client.get(f"/v1/sessions/{session_id}/stage-projections").json()
+    assert projections[0]["scorer_source"] == "gemini"
+    assert projections[0]["scorer_model"] == "gemini-3-pro-preview"
+    assert projections[0]["feedback_json"][0] == "Gemini scorer: rescored in background."
+
+
+def test_failed_gemini_rescore_can_be_scheduled_again(client: TestClient, monkeypatch: pytest.MonkeyPatch) -> None:
+    from gemini_music_api.services import audio_scoring
+
+    calls: list[str] = []
+
+    def _flaky_gemini_score(**_: object) -> tuple[dict[str, object], dict[str, object]]:
+        calls.append("call")
+        if len(calls) == 1:
+            raise RuntimeError("scorer unavailable")
+        return (
+            {
+                "discipline": 0.9,
+                "resonance": 0.9,
+                "coherence": 0.9,
+                "composite": 0.9,
+                "passes_golden": True,
+                "feedback": ["Gemini scorer: second attempt."],
+                "scorer_confidence": 0.8,
+                "evidence_json": {},
+            },
+            {"attempted": True, "model": "gemini-3-pro-preview", "reason": "ok"},
+        )
+
+    monkeypatch.setenv("USE_GEMINI_SCORING", "true")
+    monkeypatch.setattr(audio_scoring, "try_gemini_stage_score", _flaky_gemini_score)
+
+    user_id = client.post("/v1/users", json={"display_name": "Flaky Gemini User"}).json()["id"]
+    session_id = client.post(
+        "/v1/sessions",
+        json={
+            "user_id": user_id,
+            "intention": "Flaky Gemini scoring",
+            "mantra_key": "maha_mantra_hare_krishna_hare_rama",
+            "target_duration_minutes": 3,
+        },
+    ).json()["id"]
+
+    def _ingest(chunk_id: str, seq: int) -> None:
+        resp = client.post(
+            f"/v1/sessions/{session_id}/audio/chunks?defer_gemini=true",
+            json={
+                "stage": "guided",
+                "chunk_id": chunk_id,
+                "seq": seq,
+                "t_start_ms": 48000 + (seq - 1) * 10000,
+                "t_end_ms": 58000 + (seq - 1) * 10000,
+                "sample_rate_hz": 16000,
+                "encoding": "browser_metrics_v1",
+                "lineage": "vaishnavism",
+                "golden_profile": "maha_mantra_v1",
+                "features": {"duration_seconds": 10, "voice_ratio_total": 0.7, "snr_db": 18},
+            },
+        )
+        assert resp.status_code == 201
+
+    _ingest("guided-flaky-001", 1)
+    projections = client.get(f"/v1/sessions/{session_id}/stage-projections").json()
+    assert projections[0]["scorer_source"] == "deterministic"
+    assert not any(key[0] == session_id for key in audio_scoring._PENDING_GEMINI)
+
+    _ingest("guided-flaky-002", 2)
+    projections = client.get(f"/v1/sessions/{session_id}/stage-projections").json()
+    assert len(calls) == 2
+    assert projections[0]["scorer_source"] == "gemini"
+
+
+def test_recompute_stage_projections_batches_stages(client: TestClient) -> None:
+    from gemini_music_api.db import SessionLocal
+    from gemini_music_api.services.audio_scoring import recompute_stage_projections
+
+    user_id = client.post("/v1/users", json={"display_name": "Batch Projection User"}).json()["id"]
+    session_id = client.post(
+        "/v1/sessions",
+        json={
+            "user_id": user_id,
+            "intention": "Batch projection recompute",
+            "mantra_key": "maha_mantra_hare_krishna_hare_rama",
+            "mood": "focused",
+            "target_duration_minutes": 3,
+        },
+    ).json()["id"]
+
+    single: dict[str, dict[str, object]] = {}
+    for seq, stage in enumerate(["guided", "call_response"], start=1):
+        resp = client.post(
+            f"/v1/sessions/{session_id}/audio/chunks",
+            json={
+                "stage": stage,
+                "chunk_id": f"{stage}-batch-001",
+                "seq": seq,
+                "t_start_ms": 0,
+                "t_end_ms": 30000,
+                "sample_rate_hz": 16000,
+                "encoding": "browser_metrics_v1",
+                "lineage": "vaishnavism",
+                "golden_profile": "maha_mantra_v1",
+                "features": {
+                    "duration_seconds": 30,
+                    "voice_ratio_total": 0.7,
+                    "pitch_stability": 0.8,
+                    "cadence_bpm": 70 + seq,
+                    "cadence_consistency": 0.8,
+                    "avg_energy": 0.5,
+                    "snr_db": 18,
+                },
+            },
+        )
+        assert resp.status_code == 201
+        single[stage] = resp.json()["projection"]
+
+    with SessionLocal() as db:
+        rows = recompute_stage_projections(
+            db,
+            session_id=session_id,
+            keys=[("guided", "vaishnavism", "maha_mantra_v1"), ("call_response", "vaishnava", "maha_mantra_v1")],
+        )
+        db.commit()
+        batched = {row.stage: row for row in rows}
+
+    assert set(batched) == {"guided", "call_response"}
+    for stage, projection in single.items():
+        assert batched[stage].id == projection["id"]
+        assert batched[stage].composite == projection["composite"]
+        assert batched[stage].source_chunk_count == 1
+
+
 def test_poc_static_ui_served(client: TestClient) -> None:
     resp = client.get("/poc/")
     assert resp.status_code == 200
@@ -503,6 +716,278 @@ def test_integration_surfaces_and_exports(client: TestClient) -> None:
     assert eco["exports_generated"] >= 1
 
 
+def test_webhook_usage_refresh_does_not_double_count_partner_events(client: TestClient) -> None:
+    user_id = client.post("/v1/users", json={"display_name": "Webhook Usage User"}).json()["id"]
+    session_id = client.post(
+        "/v1/sessions",
+        json={"user_id": user_id, "intention": "Webhook usage refresh", "target_duration_minutes": 10},
+    ).json()["id"]
+    webhook_resp = client.post(
+        "/v1/integrations/webhooks",
+        json={
+            "target_url": "https://example.org/hook",
+            "adapter_id": "content_playlist_export",
+            "event_types": ["session_ended"],
+            "is_active": True,
+        },
+    )
+    assert webhook_resp.status_code == 201
+
+    partner_event = client.post(
+        "/v1/integrations/events",
+        json={
+            "session_id": session_id,
+            "partner_source": "wearable_co",
+            "adapter_id": "wearable_hr_stream",
+            "event_type": "partner_signal",
+            "client_event_id": "webhook-usage-evt-001",
+            "payload": {"signal_type": "heart_rate", "heart_rate": 98},
+        },
+    )
+    assert partner_event.status_code == 201
+    end_resp = client.post(f"/v1/sessions/{session_id}/end", json={"user_value_rating": 4, "completed_goal": True})
+    assert end_resp.status_code == 200
+
+    process = client.post("/v1/admin/webhooks/process?ignore_schedule=true")
+    assert process.status_code == 200
+    assert process.json()["processed"] >= 1
+
+    incremental = client.get("/v1/integrations/exports/ecosystem-usage/daily").json()
+    assert incremental["inbound_partner_events"] == 1
+    assert incremental["wearable_adapter_events"] == 1
+
+    assert client.post("/v1/admin/projections/recompute").status_code == 200
+    recomputed = client.get("/v1/integrations/exports/ecosystem-usage/daily").json()
+    for field in ("inbound_partner_events", "wearable_adapter_events", "outbound_webhooks_queued"):
+        assert incremental[field] == recomputed[field]
+
+
+def test_partner_event_is_counted_with_its_write_before_any_rebuild(client: TestClient) -> None:
+    from gemini_music_api.services.projections import refresh_ecosystem_usage_days
+
+    user_id = client.post("/v1/users", json={"display_name": "Partner Count User"}).json()["id"]
+    session_id = client.post(
+        "/v1/sessions",
+        json={"user_id": user_id, "intention": "Partner counting", "target_duration_minutes": 10},
+    ).json()["id"]
+
+    def _ingest(client_event_id: str) -> None:
+        resp = client.post(
+            "/v1/integrations/events",
+            json={
+                "session_id": session_id,
+                "partner_source": "wearable_co",
+                "adapter_id": "wearable_hr_stream",
+                "event_type": "partner_signal",
+                "client_event_id": client_event_id,
+                "payload": {"signal_type": "heart_rate", "heart_rate": 91},
+            },
+        )
+        assert resp.status_code == 201
+
+    _ingest("partner-count-evt-001")
+    usage = client.get("/v1/integrations/exports/ecosystem-usage/daily").json()
+    assert usage["inbound_partner_events"] == 1
+
+    # A rebuild from the log right after the write must not leave a delta to be added again later.
+    refresh_ecosystem_usage_days([usage["date_key"]])
+    _ingest("partner-count-evt-002")
+    usage = client.get("/v1/integrations/exports/ecosystem-usage/daily").json()
+    assert usage["inbound_partner_events"] == 2
+    assert usage["wearable_adapter_events"] == 2
+
+
+def test_analytics_cache_is_invalidated_after_projection_commit() -> None:
+    from gemini_music_api.db import SessionLocal
+    from gemini_music_api.services.projections import refresh_business_signal_daily
+
+    assert analytics_cache.get_or_compute("north_star", lambda: "before") == "before"
+    with SessionLocal() as db:
+        refresh_business_signal_daily(db, date_key="2026-01-01")
+        # Uncommitted: readers still see the old committed row, so the cached value stays valid.
+        assert analytics_cache.get_or_compute("north_star", lambda: "during") == "before"
+        db.commit()
+    assert analytics_cache.get_or_compute("north_star", lambda: "after") == "after"
+
+    with SessionLocal() as db:
+        refresh_business_signal_daily(db, date_key="2026-01-02")
+        db.rollback()
+    assert analytics_cache.get_or_compute("north_star", lambda: "rolled_back") == "after"
+
+
+def test_business_averages_match_between_incremental_and_rebuild() -> None:
+    from gemini_music_api.db import SessionLocal
+    from gemini_music_api.models import SessionModel, User
+    from gemini_music_api.services.projections import record_session_ended, refresh_business_signal_daily
+
+    ended_at = dt.datetime(2026, 3, 1, 12, 0, tzinfo=dt.timezone.utc)
+    with SessionLocal() as db:
+        user = User(display_name="Rounding User")
+        db.add(user)
+        db.flush()
+        for rate in [0.667, 0.667, 0.333, 0.333, 0.667, 0.0]:
+            session = SessionModel(
+                user_id=user.id,
+                intention="Rounding",
+                status="ENDED",
+                started_at=ended_at,
+                ended_at=ended_at,
+                summary_json={"adaptation_helpful_rate": rate},
+            )
+            db.add(session)
+            db.flush()
+            incremental = record_session_ended(db, session=session, summary=session.summary_json)
+        incremental_rate = incremental.adaptation_helpful_rate
+        rebuilt = refresh_business_signal_daily(db, date_key="2026-03-01")
+        assert rebuilt.adaptation_helpful_rate == incremental_rate
+        db.rollback()
+
+
+def test_partner_event_async_insert_is_buffered_then_flushed(client: TestClient) -> None:
+    user_id = client.post("/v1/users", json={"display_name": "Async Partner"}).json()["id"]
+    session_id = client.post(
+        "/v1/sessions",
+        json={"user_id": user_id, "intention": "Buffered ingest", "target_duration_minutes": 10},
+    ).json()["id"]
+    event = {
+        "session_id": session_id,
+        "partner_source": "wearable_co",
+        "adapter_id": "wearable_hr_stream",
+        "event_type": "partner_signal",
+        "client_event_id": "async-evt-001",
+        "payload": {"signal_type": "heart_rate", "heart_rate": 102},
+    }
+
+    accepted = client.post("/v1/integrations/events", json=event, headers={"X-Async-Insert": "true"})
+    assert accepted.status_code == 202
+    assert accepted.json()["accepted"] is True
+
+    partner_event_buffer.flush()
+
+    replay = client.post("/v1/integrations/events", json=event, headers={"X-Async-Insert": "false"})
+    assert replay.status_code == 201
+    assert replay.json()["idempotency_hit"] is True
+    assert replay.json()["ingestion_source"] == "partner:wearable_co"
+
+
+def test_partner_event_buffer_isolates_failing_rows_and_falls_back_when_full(
+    client: TestClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from gemini_music_api.services.ingest_buffer import PartnerEventBuffer
+
+    user_id = client.post("/v1/users", json={"display_name": "Buffer Limits"}).json()["id"]
+    session_id = client.post(
+        "/v1/sessions",
+        json={"user_id": user_id, "intention": "Buffer limits", "target_duration_minutes": 10},
+    ).json()["id"]
+
+    def _row(session: str, client_event_id: str) -> dict[str, object]:
+        return {
+            "session_id": session,
+            "event_type": "partner_signal",
+            "event_time": dt.datetime.now(dt.timezone.utc),
+            "client_event_id": client_event_id,
+            "ingestion_source": "partner:wearable_co",
+            "source_adapter": "wearable_hr_stream",
+            "schema_version": "v1",
+            "payload": {"signal_type": "heart_rate"},
+        }
+
+    buffer = PartnerEventBuffer(max_pending=2, max_attempts=2)
+    assert buffer.submit(_row(session_id, "buffer-good-001")) is True
+    # Unknown session: violates the foreign key on every attempt.
+    assert buffer.submit(_row("00000000-0000-0000-0000-000000000000", "buffer-bad-001")) is True
+    assert buffer.submit(_row(session_id, "buffer-overflow-001")) is False
+
+    assert buffer.flush() == 1
+    assert buffer.flush() == 0
+    assert buffer.flush() == 0
+
+    monkeypatch.setattr(partner_event_buffer, "max_pending", 0)
+    fallback = client.post(
+        "/v1/integrations/events",
+        json={
+            "session_id": session_id,
+            "partner_source": "wearable_co",
+            "adapter_id": "wearable_hr_stream",
+            "event_type": "partner_signal",
+            "client_event_id": "buffer-full-001",
+            "payload": {"signal_type": "heart_rate", "heart_rate": 101},
+        },
+        headers={"X-Async-Insert": "true"},
+    )
+    assert fallback.status_code == 201
+    assert fallback.json()["idempotency_hit"] is False
+
+
+def test_partner_event_batch_ingest(client: TestClient) -> None:
+    user_id = client.post("/v1/users", json={"display_name": "Partner Batch"}).json()["id"]
+    session_id = client.post(
+        "/v1/sessions",
+        json={"user_id": user_id, "intention": "Partner batch", "target_duration_minutes": 10},
+    ).json()["id"]
+    event = {
+        "session_id": session_id,
+        "partner_source": "wearable_co",
+        "adapter_id": "wearable_hr_stream",
+        "payload": {"signal_type": "heart_rate", "heart_rate": 98},
+    }
+    batch = {
+        "events": [
+            {**event, "client_event_id": "partner-batch-001"},
+            {**event, "client_event_id": "partner-batch-002"},
+            {**event, "client_event_id": "partner-batch-001"},
+        ]
+    }
+
+    first = client.post("/v1/integrations/events:batch", json=batch)
+    assert first.status_code == 201
+    assert first.json() == {"received": 3, "inserted": 2, "idempotency_hits": 1}
+
+    replay = client.post("/v1/integrations/events:batch", json=batch)
+    assert replay.json()["inserted"] == 0
+
+    missing = client.post(
+        "/v1/integrations/events:batch",
+        json={"events": [{**event, "session_id": "missing-session"}]},
+    )
+    assert missing.status_code == 404
+
+
+def test_session_event_batch_ingest_is_idempotent(client: TestClient) -> None:
+    user_id = client.post("/v1/users", json={"display_name": "Batch"}).json()["id"]
+    session_id = client.post(
+        "/v1/sessions",
+        json={"user_id": user_id, "intention": "Batch ingest", "target_duration_minutes": 10},
+    ).json()["id"]
+    single = client.post(
+        f"/v1/sessions/{session_id}/events",
+        json={"event_type": "note", "client_event_id": "batch-001", "payload": {}},
+    )
+    assert single.status_code == 201
+
+    resp = client.post(
+        f"/v1/sessions/{session_id}/events:batch",
+        json={
+            "events": [
+                {"event_type": "note", "client_event_id": "batch-001", "payload": {}},
+                {"event_type": "note", "client_event_id": "batch-002", "payload": {"n": 2}},
+                {"event_type": "note", "payload": {"n": 3}},
+                {"event_type": "note", "client_event_id": "batch-002", "payload": {"n": 2}},
+            ]
+        },
+    )
+    assert resp.status_code == 201
+    body = resp.json()
+    assert body["inserted"] == 2
+    assert body["idempotency_hits"] == 2
+    events = body["events"]
+    assert [e["idempotency_hit"] for e in events] == [True, False, False, True]
+    assert events[0]["id"] == single.json()["id"]
+    assert events[1]["id"] == events[3]["id"]
+    assert events[2]["payload"] == {"n": 3}
+
+
 def test_adaptive_vs_static_experiment_endpoint(client: TestClient) -> None:
     resp = client.post(
         "/v1/analytics/experiments/adaptive-vs-static",
@@ -587,3 +1072,37 @@ def test_ai_kirtan_contract_verifier_rejects_missing_arrangement_fields() -> Non
     passed, errors = verify_payload_contract(invalid_payload)
     assert passed is False
     assert any(err.startswith("missing_arrangement:") for err in errors)
+
+
+def test_session_timestamps_serialize_as_utc_on_write_and_read(client: TestClient) -> None:
+    user_id = client.post("/v1/users", json={"display_name": "Utc"}).json()["id"]
+    start_resp = client.post(
+        "/v1/sessions",
+        json={"user_id": user_id, "intention": "Clock check", "mantra_key": "om_namah_shivaya"},
+    )
+    assert start_resp.status_code == 201
+    created = start_resp.json()
+
+    read_resp = client.get(f"/v1/sessions/{created['id']}")
+    assert read_resp.status_code == 200
+    assert read_resp.json()["started_at"] == created["started_at"]
+    assert dt.datetime.fromisoformat(created["started_at"].replace("Z", "+00:00")).utcoffset() == dt.timedelta(0)
+
+
+def test_flush_pending_projections_requeues_claimed_keys_on_failure(monkeypatch: pytest.MonkeyPatch) -> None:
+    from gemini_music_api.db import SessionLocal
+    from gemini_music_api.services import audio_scoring
+
+    key = ("session-requeue", "guided", "vaishnavism", "maha_mantra_v1")
+    audio_scoring.mark_projection_pending(key)
+
+    def _failing_recompute(*_: object, **__: object) -> list[object]:
+        raise RuntimeError("recompute failed")
+
+    monkeypatch.setattr(audio_scoring, "recompute_stage_projections", _failing_recompute)
+    try:
+        with SessionLocal() as db, pytest.raises(RuntimeError):
+            audio_scoring.flush_pending_projections(db, session_id="session-requeue")
+        assert key in audio_scoring._PENDING_PROJECTIONS
+    finally:
+        audio_scoring._PENDING_PROJECTIONS.discard(key)